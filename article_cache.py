@@ -0,0 +1,193 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import metrics
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join('.cache', 'article_cache.sqlite3')
+DEFAULT_TTL = 7 * 24 * 60 * 60  # 7일
+DEFAULT_MAX_ENTRIES = 50000
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # 200MB
+
+# put 호출이 이 횟수만큼 쌓이면 크기 기준 정리를 수행
+EVICT_EVERY = 200
+
+
+class CacheEntry:
+    """캐시에 저장된 기사 본문과 재검증 정보"""
+
+    __slots__ = ('url', 'text', 'etag', 'last_modified', 'fetched_at')
+
+    def __init__(self, url, text, etag, last_modified, fetched_at):
+        self.url = url
+        self.text = text
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+
+    def is_fresh(self, ttl, now=None):
+        """TTL 안에 있으면 네트워크 요청 없이 사용할 수 있습니다."""
+        now = time.time() if now is None else now
+        return now - self.fetched_at < ttl
+
+    def conditional_headers(self):
+        """조건부 요청(If-None-Match / If-Modified-Since) 헤더를 반환합니다."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ArticleCache:
+    """
+    기사 URL을 키로 추출된 본문을 저장하는 SQLite 캐시입니다.
+    Args:
+        path: str, SQLite 파일 경로
+        ttl: float, 재검증 없이 사용할 수 있는 기간(초)
+        max_entries: int, 최대 항목 수
+        max_bytes: int, 저장된 본문의 최대 총 크기(bytes)
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL,
+                 max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = {'hit': 0, 'revalidated': 0, 'miss': 0}
+        self._puts_since_evict = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # 동시 크롤링 스레드에서 공유하므로 잠금으로 직렬화
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            '''CREATE TABLE IF NOT EXISTS articles (
+                url TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )'''
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_articles_accessed ON articles(accessed_at)')
+        self._conn.commit()
+
+    def get(self, url):
+        """URL에 해당하는 캐시 항목을 반환합니다. 없으면 None."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT url, text, etag, last_modified, fetched_at FROM articles WHERE url = ?', (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE articles SET accessed_at = ? WHERE url = ?', (time.time(), url))
+            return CacheEntry(*row)
+
+    def put(self, url, text, etag=None, last_modified=None, fetched_at=None):
+        """추출된 본문과 재검증 헤더를 저장합니다."""
+        now = time.time()
+        fetched_at = now if fetched_at is None else fetched_at
+        size = len(text.encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (url, text, etag, last_modified, fetched_at, now, size)
+            )
+            self._conn.commit()
+            self._puts_since_evict += 1
+            if self._puts_since_evict >= EVICT_EVERY:
+                self._evict_locked()
+
+    def touch(self, url):
+        """304 응답으로 재검증된 항목의 수집 시각을 갱신합니다."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'UPDATE articles SET fetched_at = ?, accessed_at = ? WHERE url = ?', (now, now, url)
+            )
+            self._conn.commit()
+
+    def seed(self, records, fetched_at=None):
+        """
+        기존 결과(news_data.json 등)의 본문으로 캐시에 없는 항목을 채웁니다.
+        Args:
+            records: list, '링크'와 '내용'을 가진 기사 목록
+            fetched_at: float, 수집 시각 (기본값: 현재 시각)
+        Returns:
+            int: 새로 추가된 항목 수
+        """
+        now = time.time()
+        fetched_at = now if fetched_at is None else fetched_at
+        rows = [
+            (r['링크'], r['내용'], None, None, fetched_at, now, len(r['내용'].encode('utf-8')))
+            for r in records
+            if r.get('링크') and isinstance(r.get('내용'), str) and r['내용']
+        ]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany('INSERT OR IGNORE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+            self._conn.commit()
+            added = self._conn.total_changes - before
+            self._evict_locked()
+        return added
+
+    def record(self, kind):
+        """적중(hit)/재검증(revalidated)/미스(miss) 횟수를 기록합니다."""
+        with self._lock:
+            self.stats[kind] += 1
+        metrics.increment(f'cache.{kind}')
+
+    def evict(self):
+        """TTL 만료가 아닌 크기 기준(항목 수, 총 바이트)으로 오래 사용되지 않은 항목을 제거합니다."""
+        with self._lock:
+            self._evict_locked()
+
+    def _evict_locked(self):
+        self._puts_since_evict = 0
+        count, total = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM articles').fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        # 최근 사용 순으로 누적 크기를 계산해 한도를 넘는 항목을 제거
+        removed = 0
+        kept_count = 0
+        kept_bytes = 0
+        stale = []
+        for url, size in self._conn.execute('SELECT url, size FROM articles ORDER BY accessed_at DESC'):
+            if kept_count + 1 > self.max_entries or kept_bytes + size > self.max_bytes:
+                stale.append((url,))
+                continue
+            kept_count += 1
+            kept_bytes += size
+        if stale:
+            self._conn.executemany('DELETE FROM articles WHERE url = ?', stale)
+            self._conn.commit()
+            removed = len(stale)
+        logger.info(f"캐시 정리: {removed}개 항목 제거 (남은 항목: {kept_count}, 크기: {kept_bytes} bytes)")
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+
+    def summary(self):
+        """실행 로그용 캐시 통계 문자열"""
+        return (f"캐시 적중: {self.stats['hit']}, 재검증(304): {self.stats['revalidated']}, "
+                f"미스: {self.stats['miss']}")
+
+    def close(self):
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
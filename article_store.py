@@ -0,0 +1,183 @@
+import argparse
+import json
+import logging
+import mmap
+import os
+import re
+from datetime import datetime
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = 'news_store'
+INDEX_FILE = 'index.jsonl'
+
+# 발행일 형식: 시트의 'M/D/YYYY' 또는 'YYYY-MM-DD' / 'YYYY.MM.DD'
+_MDY_DATE = re.compile(r'^\s*(\d{1,2})/(\d{1,2})/(\d{4})')
+_YMD_DATE = re.compile(r'^\s*(\d{4})[-./](\d{1,2})[-./](\d{1,2})')
+
+
+def normalize_date(value):
+    """발행일 문자열을 'YYYY-MM-DD'로 바꿉니다. 알 수 없는 형식이면 None."""
+    if not isinstance(value, str):
+        return None
+    match = _MDY_DATE.match(value)
+    if match:
+        month, day, year = match.groups()
+    else:
+        match = _YMD_DATE.match(value)
+        if not match:
+            return None
+        year, month, day = match.groups()
+    return f"{int(year):04d}-{int(month):02d}-{int(day):02d}"
+
+
+def publication_day(value):
+    """발행일 문자열을 날짜 번호(date.toordinal, 하루에 1씩 증가)로 바꿉니다. 알 수 없는 날짜면 None."""
+    normalized = normalize_date(value)
+    if normalized is None:
+        return None
+    try:
+        return datetime.strptime(normalized, '%Y-%m-%d').toordinal()
+    except ValueError:
+        return None
+
+
+class ArticleStore:
+    """
+    날짜별 파티션(JSON Lines)과 오프셋 색인으로 이루어진 추가 전용 기사 저장소입니다.
+    news_data.json과 달리 매일 그날의 파티션에만 기사를 덧붙이고, 읽을 때는 색인에서
+    키워드/발행일로 고른 줄만 mmap으로 읽습니다.
+
+        news_store/2026-08-22.jsonl  # 그날 추가된 기사, 한 줄에 하나
+        news_store/index.jsonl       # 기사마다 {"p": 파티션, "o": 오프셋, "n": 길이,
+                                     #           "k": 키워드, "d": 발행일, "l": 링크}
+    Args:
+        path: str, 저장소 디렉터리
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        self.index_path = os.path.join(path, INDEX_FILE)
+        self._index = None
+
+    def partition_path(self, partition):
+        return os.path.join(self.path, f"{partition}.jsonl")
+
+    def index(self):
+        """색인 항목 목록 (처음 한 번만 읽음)"""
+        if self._index is None:
+            self._index = []
+            if os.path.exists(self.index_path):
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self._index = [json.loads(line) for line in f if line.strip()]
+        return self._index
+
+    def keys(self):
+        """저장된 (키워드, 링크) 집합 (같은 기사가 여러 키워드에 있을 수 있음)"""
+        return {(entry['k'], entry['l']) for entry in self.index()}
+
+    def keywords(self):
+        """저장된 키워드 목록 (처음 나온 순서)"""
+        return list(dict.fromkeys(entry['k'] for entry in self.index()))
+
+    def __len__(self):
+        return len(self.index())
+
+    def append(self, records, partition=None):
+        """
+        기사를 파티션 끝에 덧붙이고 색인에 추가합니다. 이미 저장된 (키워드, 링크)는 건너뜁니다.
+        Args:
+            records: list, 기사 목록 (news_data.json과 같은 형식)
+            partition: str, 파티션 이름 (기본값: 오늘 날짜)
+        Returns:
+            int: 추가된 기사 수
+        """
+        partition = partition or datetime.now().strftime('%Y-%m-%d')
+        known = self.keys()
+        lines = []
+        entries = []
+        partition_path = self.partition_path(partition)
+        offset = os.path.getsize(partition_path) if os.path.exists(partition_path) else 0
+        for record in records:
+            key = (record.get('키워드'), record.get('링크'))
+            if key in known:
+                continue
+            known.add(key)
+            line = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+            entries.append({
+                'p': partition, 'o': offset, 'n': len(line),
+                'k': key[0], 'd': normalize_date(record.get('발행일')), 'l': key[1],
+            })
+            lines.append(line)
+            offset += len(line)
+        if not lines:
+            return 0
+
+        os.makedirs(self.path, exist_ok=True)
+        # 파티션을 먼저 쓰고 색인을 나중에 씀 (중간에 실패하면 색인에 없는 줄은 무시됨)
+        with open(partition_path, 'ab') as f:
+            f.writelines(lines)
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self.index().extend(entries)
+        logger.info(f"저장소 {partition} 파티션에 {len(lines)}개 기사를 추가했습니다.")
+        return len(lines)
+
+    def select(self, keywords=None, start=None, end=None):
+        """
+        키워드/발행일(YYYY-MM-DD, 양 끝 포함) 조건에 맞는 색인 항목을 반환합니다.
+        발행일을 알 수 없는 기사는 날짜 조건이 있으면 제외합니다.
+        """
+        keywords = set(keywords) if keywords is not None else None
+        selected = []
+        for entry in self.index():
+            if keywords is not None and entry['k'] not in keywords:
+                continue
+            if start is not None or end is not None:
+                date = entry['d']
+                if date is None or (start is not None and date < start) or (end is not None and date > end):
+                    continue
+            selected.append(entry)
+        return selected
+
+    def read(self, keywords=None, start=None, end=None):
+        """
+        조건에 맞는 기사만 읽습니다. 파티션 파일은 mmap으로 열어 필요한 줄만 디코딩합니다.
+        Returns:
+            generator: 기사(dict), 저장된 순서
+        """
+        by_partition = {}
+        for entry in self.select(keywords, start, end):
+            by_partition.setdefault(entry['p'], []).append(entry)
+        for partition, entries in by_partition.items():
+            with open(self.partition_path(partition), 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for entry in entries:
+                    yield json.loads(data[entry['o']:entry['o'] + entry['n']])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기사 저장소 조회/가져오기')
+    parser.add_argument('--path', default=DEFAULT_STORE_PATH, help='저장소 디렉터리')
+    parser.add_argument('--import-json', metavar='FILE',
+                        help='news_data.json 형식 파일의 기사를 오늘 파티션에 추가')
+    parser.add_argument('--keyword', action='append', help='조회할 키워드 (여러 번 지정 가능)')
+    parser.add_argument('--start', help='발행일 시작 (YYYY-MM-DD)')
+    parser.add_argument('--end', help='발행일 끝 (YYYY-MM-DD)')
+    args = parser.parse_args()
+
+    store = ArticleStore(args.path)
+    if args.import_json:
+        with open(args.import_json, 'r', encoding='utf-8') as f:
+            added = store.append(json.load(f))
+        print(f"{added}개 기사를 가져왔습니다. (전체 {len(store)}개)")
+        return
+    articles = list(store.read(args.keyword, args.start, args.end))
+    print(json.dumps(articles, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
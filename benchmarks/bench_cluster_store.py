@@ -0,0 +1,101 @@
+"""
+며칠에 걸쳐 같은 사건의 후속 기사가 들어오는 상황에서 날마다 중복제거하는 세 가지 방식을 비교합니다.
+
+- 전체 재계산: 그날까지 쌓인 모든 기사로 deduplicate_articles를 다시 실행
+- 그날 기사만: 그날 들어온 기사만 중복제거 (이전 날과는 비교하지 않음)
+- 기사 묶음 저장소: 그날 기사만 넣되 ClusterStore의 키워드별 중심 벡터에 배정된 기사는 제외
+
+날짜별 시간과, 결과 기사 중 이전 날 결과와 유사도가 임계값을 넘는 기사 수(다시 선택된 같은 이야기)를 출력합니다.
+
+사용법: python benchmarks/bench_cluster_store.py [--articles 1500] [--keywords 3] [--days 10]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import synthetic_articles  # noqa: E402
+from cluster_store import ClusterStore  # noqa: E402
+import shorten  # noqa: E402
+from similarity import SimilarityModel  # noqa: E402
+
+
+def article_day(article):
+    month, day, _ = article['발행일'].split('/')
+    return (int(month), int(day))
+
+
+def repeats(model, previous, current, threshold):
+    """current 결과 중 같은 키워드의 이전 날 결과와 유사도가 임계값을 넘는 기사 수"""
+    count = 0
+    for keyword in {row['키워드'] for row in current}:
+        before = [row['내용'] for row in previous if row['키워드'] == keyword]
+        now = [row['내용'] for row in current if row['키워드'] == keyword]
+        if before and now:
+            count += sum(1 for neighbors in model.many_vs_many(now, before, top_k=1, threshold=threshold)
+                         if neighbors)
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--articles', type=int, default=1500, help='키워드별 기사 수')
+    parser.add_argument('--keywords', type=int, default=3)
+    parser.add_argument('--days', type=int, default=10)
+    parser.add_argument('--threshold', type=float, default=0.5)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    articles = []
+    for k in range(args.keywords):
+        articles.extend(synthetic_articles(args.articles, keyword=f'키워드{k}', seed=k, days=args.days))
+    days = sorted({article_day(article) for article in articles})
+    by_day = {day: [article for article in articles if article_day(article) == day] for day in days}
+    model = SimilarityModel.fit([article['내용'] for article in articles])
+    print(f"기사 {len(articles)}개, 키워드 {args.keywords}개, {len(days)}일")
+
+    totals = {'전체 재계산': 0.0, '그날 기사만': 0.0, '기사 묶음 저장소': 0.0}
+    repeated = {name: 0 for name in totals}
+    published = {name: [] for name in totals}
+    with tempfile.TemporaryDirectory() as directory:
+        store = ClusterStore(os.path.join(directory, 'clusters.sqlite3'),
+                             model_path=os.path.join(directory, 'model.npz'))
+        print(f"{'날짜':>6}{'새 기사':>8}{'전체 재계산':>14}{'그날 기사만':>14}{'묶음 저장소':>14}")
+        seen = []
+        for day in days:
+            seen.extend(by_day[day])
+            runs = {
+                '전체 재계산': lambda: shorten.deduplicate_articles(pd.DataFrame(seen)),
+                '그날 기사만': lambda: shorten.deduplicate_articles(pd.DataFrame(by_day[day])),
+                '기사 묶음 저장소': lambda: shorten.deduplicate_articles(pd.DataFrame(by_day[day]),
+                                                                 cluster_store=store),
+            }
+            elapsed = {}
+            for name, run in runs.items():
+                start = time.perf_counter()
+                result = run()
+                elapsed[name] = time.perf_counter() - start
+                totals[name] += elapsed[name]
+                if name == '전체 재계산':
+                    # 전체 재계산은 결과 전체를 다시 만들므로 그날 새로 들어온 기사만 비교
+                    new_links = {article['링크'] for article in by_day[day]}
+                    result = [row for row in result if row['링크'] in new_links]
+                repeated[name] += repeats(model, published[name], result, args.threshold)
+                published[name].extend(result)
+            print(f"{day[0]:>3}/{day[1]:<2}{len(by_day[day]):>8}"
+                  + ''.join(f"{elapsed[name]:>13.2f}s" for name in runs))
+        store.close()
+
+    print(f"{'':<16}{'총 시간':>10}{'결과 기사':>10}{'이전 날과 중복':>16}")
+    for name in totals:
+        print(f"{name:<16}{totals[name]:>9.2f}s{len(published[name]):>10}{repeated[name]:>16}")
+
+
+if __name__ == '__main__':
+    main()
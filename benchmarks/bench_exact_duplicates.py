@@ -0,0 +1,67 @@
+"""
+같은 본문(통신사 기사 전재 등)이 섞인 키워드 그룹에서 전체 기사를 벡터화/비교하는 방식과
+collapse_duplicates로 고유 본문만 비교한 뒤 펼치는 방식의 시간을 비교하고 그룹 결과가 같은지 확인합니다.
+
+사용법: python benchmarks/bench_exact_duplicates.py [--articles 2000] [--rates 0 0.3 0.6]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import synthetic_articles  # noqa: E402
+import shorten  # noqa: E402
+
+
+def with_copies(articles, rate, seed=0):
+    """rate 비율의 기사를 앞선 기사의 본문 복사본(공백만 다른 경우 포함)으로 바꿉니다."""
+    rnd = random.Random(seed)
+    articles = [dict(article) for article in articles]
+    for i in range(1, len(articles)):
+        if rnd.random() < rate:
+            body = articles[rnd.randrange(i)]['내용']
+            articles[i]['내용'] = body if rnd.random() < 0.5 else '  ' + body.replace(' ', '  ')
+    return articles
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--articles', type=int, default=2000)
+    parser.add_argument('--rates', type=float, nargs='+', default=[0, 0.3, 0.6])
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    base = synthetic_articles(args.articles)
+    print(f"기사 수: {args.articles}")
+    print(f"{'복사 비율':>8}{'고유 본문':>10}{'전체 비교':>12}{'고유 본문 비교':>16}{'속도 향상':>10}")
+    for rate in args.rates:
+        texts = [shorten.preprocess_text(article['내용']) for article in with_copies(base, rate)]
+
+        full, full_time = timed(lambda: shorten.cluster_texts(texts))
+
+        def collapsed():
+            first, inverse, counts = shorten.collapse_duplicates(texts)
+            clusters = shorten.cluster_texts([texts[i] for i in first], weights=counts)
+            return shorten.expand_clusters(clusters, inverse), len(first)
+
+        (expanded, unique), collapsed_time = timed(collapsed)
+        assert len(full) == len(expanded) and all(np.array_equal(a, b) for a, b in zip(full, expanded)), \
+            "고유 본문으로 묶은 결과가 전체 비교 결과와 다릅니다"
+        print(f"{rate:>8.0%}{unique:>10}{full_time:>11.2f}s{collapsed_time:>15.2f}s"
+              f"{full_time / collapsed_time:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
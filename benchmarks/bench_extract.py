@@ -0,0 +1,105 @@
+"""
+저장된 HTML 픽스처로 기사당 파싱+본문 추출 시간을 측정합니다.
+
+기존 방식(html.parser + 21개 선택자 순차 탐색)과 도메인 선택자 추출기를
+백엔드(bs4, lxml, selectolax)별로 비교합니다.
+
+사용법: python benchmarks/bench_extract.py [--repeat 20]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from extractor import BACKENDS, ExtractorRegistry  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# 변경 전 crawl_article의 선택자 목록 (중복 포함)
+LEGACY_SELECTORS = [
+    'div#dic_area', 'div.article-body', 'article', 'div.article-content', 'div.article-text',
+    'div#articleBody', 'div#news_body_area', 'div#article-view-content-div', 'div.article_body',
+    'div#articeBody', 'div.end_body', 'div#newsEndContents', 'div.article_txt', 'div#articleContent',
+    'div#newsContent', 'div.news_body', 'div#newsViewArea', 'div#content', 'div.article',
+    'div.article-content', 'div.article-body',
+]
+
+
+def legacy_extract(html, url=''):
+    """변경 전 crawl_article의 파싱/추출 부분"""
+    soup = BeautifulSoup(html, 'html.parser')
+    for selector in LEGACY_SELECTORS:
+        article = soup.select_one(selector)
+        if article:
+            for tag in article.select('script, style, iframe, .reporter_area, .copyright, .promotion'):
+                tag.decompose()
+            return ' '.join(article.get_text(strip=True).split()), selector
+    return None, None
+
+
+def load_fixtures():
+    with open(os.path.join(FIXTURE_DIR, 'index.json'), 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    fixtures = []
+    for name, url in index.items():
+        with open(os.path.join(FIXTURE_DIR, name), 'r', encoding='utf-8') as f:
+            fixtures.append((name, url, f.read()))
+    return fixtures
+
+
+def measure(extract, fixtures, repeat):
+    """픽스처별 기사당 평균 시간(ms)과 결과를 반환합니다."""
+    timings = {}
+    results = {}
+    for name, url, html in fixtures:
+        results[name] = extract(html, url)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            extract(html, url)
+        timings[name] = (time.perf_counter() - start) / repeat * 1000
+    return timings, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    fixtures = load_fixtures()
+
+    variants = {'legacy': legacy_extract}
+    for name in BACKENDS:
+        registry = ExtractorRegistry(backend=name)
+        if registry.backend.name != name:
+            print(f"{name}: 설치되지 않아 건너뜁니다")
+            continue
+        variants[f'registry/{name}'] = registry.extract
+
+    baseline_timings, baseline_results = measure(legacy_extract, fixtures, args.repeat)
+    header = f"{'fixture':<24}" + ''.join(f"{v:>22}" for v in variants)
+    print(header)
+    all_timings = {'legacy': baseline_timings}
+    for variant, extract in variants.items():
+        if variant == 'legacy':
+            continue
+        timings, results = measure(extract, fixtures, args.repeat)
+        all_timings[variant] = timings
+        mismatched = [n for n in results if results[n][0] != baseline_results[n][0]]
+        if mismatched:
+            print(f"경고: {variant} 결과가 기존 방식과 다릅니다: {mismatched}")
+
+    for name, _, _ in fixtures:
+        print(f"{name:<24}" + ''.join(f"{all_timings[v][name]:>20.2f}ms" for v in variants))
+    print(f"{'평균':<24}" + ''.join(
+        f"{sum(all_timings[v].values()) / len(fixtures):>20.2f}ms" for v in variants))
+
+
+if __name__ == '__main__':
+    main()
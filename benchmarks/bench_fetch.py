@@ -0,0 +1,53 @@
+"""
+직렬 크롤링과 동시 크롤링의 처리량을 비교합니다.
+
+사용법: python benchmarks/bench_fetch.py [--articles 200] [--hosts 4] [--latency 0.05]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# 동시성 자체를 비교하므로 호스트별 요청 속도 제한은 끔
+os.environ.setdefault('FETCH_RATE_PER_HOST', '0')
+
+from stub_server import StubServer  # noqa: E402
+import crawler  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--articles', type=int, default=200)
+    parser.add_argument('--hosts', type=int, default=4)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--per-host', type=int, default=8)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    servers = [StubServer(latency=args.latency).start() for _ in range(args.hosts)]
+    try:
+        urls = [f"{servers[i % args.hosts].base_url}/article/{i}" for i in range(args.articles)]
+
+        start = time.perf_counter()
+        serial = [crawler.crawl_article(url) for url in urls]
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        concurrent = crawler.crawl_articles(urls, max_workers=args.workers, per_host_limit=args.per_host)
+        concurrent_time = time.perf_counter() - start
+    finally:
+        for server in servers:
+            server.stop()
+
+    assert serial == concurrent, "동시 크롤링 결과가 직렬 결과와 다릅니다"
+    print(f"기사 수: {args.articles}, 호스트 수: {args.hosts}, 응답 지연: {args.latency * 1000:.0f}ms")
+    print(f"직렬:   {serial_time:7.2f}s  {args.articles / serial_time:8.1f} articles/s")
+    print(f"동시:   {concurrent_time:7.2f}s  {args.articles / concurrent_time:8.1f} articles/s")
+    print(f"속도 향상: {serial_time / concurrent_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+MinHash LSH 후보 생성과 전체 쌍 비교를 비교합니다.
+
+그룹 크기별로 전체 비교(similarity_graph)와 LSH 후보 비교의 시간, 후보 쌍 수,
+재현율(전체 비교에서 임계값을 넘는 쌍 중 LSH 후보에 포함된 비율)을 출력하고,
+과거 기사 인덱스 크기별 새 기사 한 건의 조회 시간을 측정합니다.
+
+사용법: python benchmarks/bench_lsh.py [--sizes 1000,5000,10000] [--history 1000,10000,50000]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scipy import sparse  # noqa: E402
+
+from corpus import load_sentences, synthetic_articles  # noqa: E402
+from lsh_index import LshIndex, MinHasher, candidate_pairs  # noqa: E402
+import shorten  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='1000,5000,10000')
+    parser.add_argument('--history', default='1000,10000,50000')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    sentences = load_sentences()
+    hasher = MinHasher()
+
+    print(f"{'size':>7}{'exact':>10}{'lsh':>10}{'candidates':>12}{'all pairs':>14}{'recall':>8}")
+    for size in (int(s) for s in args.sizes.split(',')):
+        articles = synthetic_articles(size, seed=size, sentences=sentences)
+        texts = [shorten.preprocess_text(a['내용']) for a in articles]
+        matrix = shorten.vectorize_texts(texts)
+
+        start = time.perf_counter()
+        exact = shorten.similarity_graph(matrix)
+        exact_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        left, right = candidate_pairs([hasher.signature(text) for text in texts])
+        approx = shorten.candidate_similarity_graph(matrix, left, right)
+        lsh_time = time.perf_counter() - start
+
+        true_pairs = set(zip(*sparse.triu(exact, 1).nonzero()))
+        found_pairs = set(zip(*sparse.triu(approx, 1).nonzero()))
+        recall = len(true_pairs & found_pairs) / max(len(true_pairs), 1)
+        print(f"{size:>7}{exact_time:>9.2f}s{lsh_time:>9.2f}s{len(left):>12}"
+              f"{size * (size - 1) // 2:>14}{recall:>8.3f}")
+
+    print()
+    print(f"{'history':>8}{'add':>10}{'query/article':>16}")
+    queries = [hasher.signature(shorten.preprocess_text(a['내용']))
+               for a in synthetic_articles(100, seed=99999, sentences=sentences)]
+    with tempfile.TemporaryDirectory() as directory:
+        for size in (int(s) for s in args.history.split(',')):
+            index = LshIndex(os.path.join(directory, f'index_{size}.sqlite3'), hasher=hasher)
+            start = time.perf_counter()
+            for article in synthetic_articles(size, seed=size + 1, sentences=sentences):
+                index.add(article['키워드'], article['링크'], shorten.preprocess_text(article['내용']))
+            index.commit()
+            add_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for signature in queries:
+                index.query('키워드', signature)
+            query_time = (time.perf_counter() - start) / len(queries) * 1000
+            index.close()
+            print(f"{size:>8}{add_time:>9.2f}s{query_time:>14.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+키워드 그룹별 프로세스 풀 중복제거의 코어 수에 따른 확장성을 측정합니다.
+
+합성 코퍼스(키워드 수 × 키워드당 기사 수)에 대해 workers 값별 deduplicate_articles 시간을 재고,
+결과가 직렬 실행과 바이트 단위로 같은지 확인합니다.
+
+사용법: python benchmarks/bench_parallel.py [--keywords 16] [--articles 1000] [--workers 1,2,4,8]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+from corpus import load_sentences, synthetic_articles  # noqa: E402
+import shorten  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--keywords', type=int, default=16)
+    parser.add_argument('--articles', type=int, default=1000)
+    parser.add_argument('--workers', default=','.join(str(w) for w in (1, 2, 4, 8) if w <= (os.cpu_count() or 1)))
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    sentences = load_sentences()
+    records = []
+    for k in range(args.keywords):
+        records.extend(synthetic_articles(args.articles, keyword=f'키워드{k:02d}', seed=k, sentences=sentences))
+    df = pd.DataFrame(records)
+    print(f"기사 수: {len(df)}, 키워드 수: {args.keywords}, CPU 수: {os.cpu_count()}")
+
+    baseline = None
+    baseline_time = None
+    for workers in (int(w) for w in args.workers.split(',')):
+        start = time.perf_counter()
+        result = shorten.deduplicate_articles(df, workers=workers)
+        elapsed = time.perf_counter() - start
+        output = json.dumps(result, ensure_ascii=False, indent=2)
+        if baseline is None:
+            baseline, baseline_time = output, elapsed
+        print(f"workers={workers:<3} {elapsed:7.2f}s  속도 향상 {baseline_time / elapsed:4.1f}x  "
+              f"직렬과 동일: {output == baseline}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+날마다 새 기사가 쌓일 때 결과를 게시하는 세 방식을 로컬 가짜 GitHub API(fake_contents_api.py)로 비교합니다.
+
+- 전체 파일: 기존 read_the_sheet.update_github_repo처럼 파일 sha를 GET한 뒤 전체 JSON을 PUT
+- 샤드: publish_shards + contents_api_target.ContentsApiTarget (바뀐 발행일 샤드와 manifest만 PUT, 파일마다 커밋)
+- 한 커밋: shard_publisher.publish_shards + GitDataTarget (바뀐 샤드와 manifest를 git data API로 커밋 하나에)
+
+날짜별 요청 수와 전송 바이트, 합계 커밋 수를 출력하고, 마지막에 샤드에서 다시 모은 기사가 게시한 기사와 같은지
+확인합니다.
+
+사용법: python benchmarks/bench_publish.py [--per-day 100] [--days 30] [--keywords 3]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import load_sentences, synthetic_articles  # noqa: E402
+from contents_api_target import ContentsApiTarget  # noqa: E402
+from fake_contents_api import FakeContentsApi  # noqa: E402
+from shard_publisher import GitDataTarget, load_shards, publish_shards  # noqa: E402
+
+REPO = 'owner/news_bot'
+
+
+def publish_full_file(records, target, path='news_data.json'):
+    """기존 방식: sha를 읽고 전체 파일을 올림"""
+    _, sha = target.get(path)
+    target.put(path, json.dumps(records, ensure_ascii=False, indent=2).encode('utf-8'), sha=sha)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--per-day', type=int, default=100, help='키워드별 하루 기사 수')
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--keywords', type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    sentences = load_sentences()
+    articles = []
+    for k in range(args.keywords):
+        articles.extend(synthetic_articles(args.per_day * args.days, keyword=f'키워드{k}', seed=k,
+                                           sentences=sentences, days=args.days))
+    by_day = {}
+    for article in articles:
+        by_day.setdefault(int(article['발행일'].split('/')[1]), []).append(article)
+
+    methods = {'전체 파일': (publish_full_file, ContentsApiTarget), '샤드': (publish_shards, ContentsApiTarget),
+               '한 커밋': (publish_shards, GitDataTarget)}
+    servers = {name: FakeContentsApi().start() for name in methods}
+    targets = {name: target_class(REPO, 'token', api_url=servers[name].base_url)
+               for name, (_, target_class) in methods.items()}
+    totals = {name: {'requests': 0, 'bytes': 0, 'commits': 0} for name in methods}
+    try:
+        print(f"{'날짜':>4}{'기사':>8}" + ''.join(f"{name + ' 요청':>12}{name + ' 전송':>14}" for name in methods))
+        published = []
+        for day in sorted(by_day):
+            # news_data.json처럼 키워드 순 (같은 키워드 안에서는 추가된 순서)
+            published = sorted(published + by_day[day], key=lambda row: row['키워드'])
+            line = f"{day:>4}{len(published):>8}"
+            for name, (method, _) in methods.items():
+                servers[name].reset_counts()
+                method(published, targets[name])
+                requests_made = sum(servers[name].requests.values())
+                totals[name]['requests'] += requests_made
+                totals[name]['bytes'] += servers[name].received_bytes
+                totals[name]['commits'] += servers[name].commits
+                line += f"{requests_made:>12}{servers[name].received_bytes / 1024:>12.1f}KB"
+            print(line)
+
+        print(f"{'합계':>12}" + ''.join(f"{totals[name]['requests']:>12}{totals[name]['bytes'] / 1024 / 1024:>12.2f}MB"
+                                       for name in methods))
+        print(f"{'커밋':>12}" + ''.join(f"{totals[name]['commits']:>12}{'':>14}" for name in methods))
+        key = lambda row: (row['키워드'], row['링크'])  # noqa: E731
+        for name in ('샤드', '한 커밋'):
+            restored = load_shards(targets[name])
+            assert sorted(restored, key=key) == sorted(published, key=key), f"{name}: 샤드에서 다시 모은 기사가 다릅니다"
+        print(f"샤드에서 다시 모은 기사 {len(restored)}개가 게시한 기사와 같습니다.")
+    finally:
+        for server in servers.values():
+            server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+URL → 신문사 추출 시간을 비교합니다.
+
+기존 방식(행마다 apply + split + except), pandas str.extract, publishers.newspapers_from_urls를
+합성 URL 열(네이버 뉴스/모르는 코드/다른 사이트 혼합)에서 실행하고 결과가 같은지 확인합니다.
+
+사용법: python benchmarks/bench_publishers.py [--rows 1000000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from publishers import NEWSPAPER_CODES, newspapers_from_urls  # noqa: E402
+
+
+def legacy_extract_newspaper_from_url(url):
+    """변경 전 crawler.extract_newspaper_from_url"""
+    try:
+        if 'naver.com' in url:
+            code = url.split('/article/')[1].split('/')[0]
+            return NEWSPAPER_CODES.get(code, '기타')
+        return '기타'
+    except:  # noqa: E722
+        return '기타'
+
+
+def synthetic_urls(rows, seed=0):
+    """신문사 코드와 형식이 섞인 URL 열"""
+    rnd = np.random.RandomState(seed)
+    codes = np.array(list(NEWSPAPER_CODES) + ['001', '421', '018'])
+    templates = np.array([
+        'https://n.news.naver.com/mnews/article/{code}/{aid}?sid=101',
+        'https://n.news.naver.com/article/{code}/{aid}',
+        'https://m.entertain.naver.com/article/{code}/{aid}',
+        'https://www.businesspost.co.kr/BP?command=article_view&num={aid}',
+        'https://news.naver.com/main/read.naver?oid={code}&aid={aid}',
+    ])
+    picked_codes = codes[rnd.randint(len(codes), size=rows)]
+    picked_templates = templates[rnd.choice(len(templates), size=rows, p=[0.5, 0.3, 0.1, 0.05, 0.05])]
+    aids = rnd.randint(10 ** 9, size=rows)
+    return pd.Series([t.format(code=c, aid=f'{a:010d}') for t, c, a in zip(picked_templates, picked_codes, aids)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    urls = synthetic_urls(args.rows)
+    print(f"URL 수: {len(urls)}")
+
+    start = time.perf_counter()
+    legacy = urls.apply(legacy_extract_newspaper_from_url)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    codes = urls.str.extract(r'/article/([^/]*)', expand=False)
+    codes = codes.where(urls.str.contains('naver.com', regex=False, na=False))
+    extracted = codes.map(NEWSPAPER_CODES).fillna('기타')
+    extract_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = newspapers_from_urls(urls)
+    new_time = time.perf_counter() - start
+
+    print(f"기존(apply)          {legacy_time:6.2f}s")
+    print(f"str.extract          {extract_time:6.2f}s  속도 향상 {legacy_time / extract_time:4.1f}x  "
+          f"결과 동일: {legacy.equals(extracted)}")
+    print(f"newspapers_from_urls {new_time:6.2f}s  속도 향상 {legacy_time / new_time:4.1f}x  "
+          f"결과 동일: {legacy.equals(result)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+합성 코퍼스(news_data.json의 scale배)를 중복제거할 때 DataFrame을 거치는 경로와
+ArticleTable(원본 dict + 필요한 열만) 경로의 시간과 최대 메모리(tracemalloc)를 비교하고 결과가 같은지 확인합니다.
+
+- DataFrame: pd.DataFrame(records) → deduplicate_articles (DataFrame을 받는 기존 API)
+- ArticleTable: deduplicate_records (DataFrame을 만들지 않음)
+
+중복제거 전체(TF-IDF 계산이 대부분)와 별도로, 기사 목록을 만드는 부분만(DataFrame → ArticleTable.from_frame 대
+ArticleTable(records))의 시간과 최대 메모리도 출력합니다.
+
+항목마다 새 프로세스에서 실행하므로 서로의 메모리가 섞이지 않습니다.
+
+사용법: python benchmarks/bench_records.py [--scales 10 100] [--no-memory]
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import synthetic_corpus  # noqa: E402
+
+PATHS = ('DataFrame', 'ArticleTable')
+
+
+def measure(function, memory):
+    """(반환값, 시간, 최대 메모리 MB)"""
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    value = function()
+    elapsed = time.perf_counter() - start
+    peak = 0.0
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+    return value, elapsed, peak
+
+
+def run(path, scale, memory):
+    """한 경로로 기사 목록 생성과 중복제거를 각각 측정하고 결과 해시와 함께 반환합니다."""
+    import pandas as pd
+    import shorten
+
+    records = synthetic_corpus(scale)
+    if path == 'DataFrame':
+        build = lambda: shorten.ArticleTable.from_frame(pd.DataFrame(records))  # noqa: E731
+        dedup = lambda: shorten.deduplicate_articles(pd.DataFrame(records))  # noqa: E731
+    else:
+        build = lambda: shorten.ArticleTable(records)  # noqa: E731
+        dedup = lambda: shorten.deduplicate_records(records)  # noqa: E731
+
+    table, build_seconds, build_peak = measure(build, memory)
+    del table
+    rows, elapsed, peak = measure(dedup, memory)
+    digest = hashlib.sha256(json.dumps(rows, ensure_ascii=False, default=str).encode('utf-8')).hexdigest()
+    return {'seconds': elapsed, 'peak_mb': peak, 'build_seconds': build_seconds, 'build_peak_mb': build_peak,
+            'rows': len(rows), 'digest': digest}
+
+
+def run_isolated(path, scale, memory):
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+        out = f.name
+    try:
+        command = [sys.executable, os.path.abspath(__file__), '--run', path, '--scale', str(scale), '--out', out]
+        if not memory:
+            command.append('--no-memory')
+        subprocess.run(command, check=True)
+        with open(out, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    finally:
+        os.remove(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', type=int, nargs='+', default=[10])
+    parser.add_argument('--no-memory', action='store_true', help='tracemalloc 없이 시간만 측정')
+    parser.add_argument('--run', choices=PATHS, help=argparse.SUPPRESS)
+    parser.add_argument('--scale', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--out', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    if args.run:
+        # import 비용은 bench_startup.py에서 따로 추적하므로 미리 읽어 둠
+        import pandas  # noqa: F401
+        import sklearn.feature_extraction.text  # noqa: F401
+        import sklearn.preprocessing  # noqa: F401
+        result = run(args.run, args.scale, memory=not args.no_memory)
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        return
+
+    memory = not args.no_memory
+    print(f"{'배수':>4}{'경로':>14}{'결과 기사':>10}{'목록 생성':>10}{'메모리':>10}{'중복제거':>10}{'메모리':>10}")
+    for scale in args.scales:
+        results = {path: run_isolated(path, scale, memory) for path in PATHS}
+        assert len({result['digest'] for result in results.values()}) == 1, "두 경로의 결과가 다릅니다"
+        for path, result in results.items():
+            build_peak = f"{result['build_peak_mb']:>8.1f}MB" if memory else f"{'-':>10}"
+            peak = f"{result['peak_mb']:>8.1f}MB" if memory else f"{'-':>10}"
+            print(f"{scale:>4}x{path:>14}{result['rows']:>10}{result['build_seconds']:>9.3f}s{build_peak}"
+                  f"{result['seconds']:>9.2f}s{peak}")
+        base, new = results['DataFrame'], results['ArticleTable']
+        summary = (f"     목록 생성 x{base['build_seconds'] / new['build_seconds']:.1f} 빠름, "
+                   f"중복제거 시간 x{base['seconds'] / new['seconds']:.2f}")
+        if memory:
+            summary += (f", 최대 메모리 차이 목록 생성 {base['build_peak_mb'] - new['build_peak_mb']:.1f}MB / "
+                        f"중복제거 {base['peak_mb'] - new['peak_mb']:.1f}MB")
+        print(summary)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+일시적 오류(503/429)와 계속 실패하는 호스트가 섞인 상황에서 재시도 없는 요청과 fetcher.Fetcher를 비교합니다.
+
+- 정상 호스트: 항상 200
+- 불안정한 호스트: 기사마다 503/429를 0~2번 보낸 뒤 200
+- 다운된 호스트: 항상 503
+
+본문을 얻은 기사 수, 다운된 호스트로 보낸 요청 수(서킷 브레이커), 걸린 시간을 출력합니다.
+
+사용법: python benchmarks/bench_retry.py [--articles 300] [--latency 0.01]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stub_server import StubServer  # noqa: E402
+import crawler  # noqa: E402
+from fetcher import CircuitBreaker, Fetcher, fetch_all  # noqa: E402
+
+
+def run(urls, fetcher):
+    start = time.perf_counter()
+    texts = fetch_all(urls, lambda url, _: crawler.crawl_article(url, session=fetcher), max_workers=16)
+    return texts, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--articles', type=int, default=300)
+    parser.add_argument('--latency', type=float, default=0.01)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rnd = random.Random(args.seed)
+    paths = [f"/article/{i}" for i in range(args.articles)]
+    # StubServer가 목록을 복사하므로 두 실행에 같은 실패 시나리오가 적용됨
+    flaky_failures = {path: [rnd.choice([503, 429]) for _ in range(rnd.randint(0, 2))] for path in paths}
+
+    results = {}
+    for name in ('재시도 없음', 'Fetcher'):
+        healthy = StubServer(latency=args.latency).start()
+        flaky = StubServer(latency=args.latency, failures=flaky_failures).start()
+        down = StubServer(latency=args.latency, failure_status=503).start()
+        servers = (healthy, flaky, down)
+        try:
+            urls = [f"{servers[i % 3].base_url}{path}" for i, path in enumerate(paths)]
+            if name == '재시도 없음':
+                fetcher = Fetcher(retries=0, rate_per_host=0, breaker=CircuitBreaker(threshold=float('inf')))
+            else:
+                fetcher = Fetcher(rate_per_host=0, backoff_base=0.05)
+            texts, elapsed = run(urls, fetcher)
+            results[name] = (sum(1 for text in texts if text), down.request_count,
+                             flaky.request_count, elapsed)
+        finally:
+            for server in servers:
+                server.stop()
+
+    print(f"기사 수: {args.articles} (호스트별 {args.articles // 3}개), 응답 지연: {args.latency * 1000:.0f}ms")
+    print(f"{'':<12}{'본문 확보':>10}{'다운 호스트 요청':>18}{'불안정 호스트 요청':>20}{'시간':>10}")
+    for name, (ok, down_requests, flaky_requests, elapsed) in results.items():
+        print(f"{name:<12}{ok:>10}{down_requests:>18}{flaky_requests:>20}{elapsed:>9.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+유사 그룹별 기사 선택 시간을 비교합니다.
+
+기존 방식(그룹마다 DataFrame 복사 + key=lambda 정렬 + iterrows)과
+모든 그룹을 한 번에 처리하는 select_from_clusters를 같은 합성 그룹에서 실행하고,
+선택 결과가 같은지 확인합니다.
+
+사용법: python benchmarks/bench_selection.py [--clusters 1000,5000] [--cluster-size 4]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from corpus import load_sentences, synthetic_articles  # noqa: E402
+from publishers import NEWSPAPER_GROUPS  # noqa: E402
+import shorten  # noqa: E402
+
+
+def legacy_select_articles_by_length(group_articles):
+    """변경 전 select_articles_by_length (그룹마다 정렬, 신문사 우선순위는 선형 탐색)"""
+    def priority(newspaper):
+        for group in NEWSPAPER_GROUPS.values():
+            if newspaper in group:
+                return group[newspaper]
+        return float('inf')
+
+    def sort_key(x):
+        return x.map(priority) if x.name == '신문사' else x
+
+    group_articles = group_articles.copy()
+    group_articles['길이'] = group_articles['내용'].str.len()
+    selected_articles = []
+    for group_name in ['보수', '진보', '경제']:
+        group_mask = group_articles['신문사'].isin(NEWSPAPER_GROUPS[group_name].keys())
+        subset = group_articles[group_mask].copy()
+        if len(subset) > 0:
+            candidates = subset.sort_values(['길이', '신문사'], key=sort_key, ascending=[False, True])
+            selected_articles.append(candidates.iloc[0].to_dict())
+    if len(selected_articles) < 3:
+        remaining = group_articles[~group_articles['신문사'].isin([a['신문사'] for a in selected_articles])].copy()
+        remaining = remaining.sort_values(['길이', '신문사'], key=sort_key, ascending=[False, True])
+        for _, article in remaining.iterrows():
+            if len(selected_articles) >= 3:
+                break
+            selected_articles.append(article.to_dict())
+    return selected_articles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clusters', default='1000,5000')
+    parser.add_argument('--cluster-size', type=int, default=4)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    sentences = load_sentences()
+    for n_clusters in (int(n) for n in args.clusters.split(',')):
+        df = pd.DataFrame(synthetic_articles(n_clusters * args.cluster_size, seed=n_clusters, sentences=sentences))
+        clusters = np.array_split(np.random.RandomState(0).permutation(len(df)), n_clusters)
+        clusters = [np.sort(members) for members in clusters]
+
+        start = time.perf_counter()
+        legacy = [legacy_select_articles_by_length(df.iloc[members]) for members in clusters]
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        selected = shorten.select_from_clusters(df['신문사'], df['내용'].str.len(), clusters)
+        new_time = time.perf_counter() - start
+
+        same = [[a['링크'] for a in rows] for rows in legacy] == [df['링크'].iloc[s].tolist() for s in selected]
+        print(f"유사 그룹 {n_clusters:>6}개  기존 {legacy_time:7.2f}s  일괄 {new_time:7.3f}s  "
+              f"속도 향상 {legacy_time / new_time:6.1f}x  결과 동일: {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+시트 읽기 방식별 요청 수와 전송 셀 수를 비교합니다 (가짜 워크시트, 네트워크 없음).
+
+매일 새 행이 추가되는 시트를 기존 방식(매번 get_all_values)과 SheetReader(필요한 열만,
+마지막으로 읽은 행 다음부터, 수정 시각이 같으면 건너뜀)로 읽고, 읽은 행이 같은지 확인합니다.
+
+사용법: python benchmarks/bench_sheet.py [--rows 20000] [--days 7] [--daily 300] [--extra-columns 6]
+"""
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+from fake_sheet import FakeWorksheet  # noqa: E402
+from sheet_reader import SHEET_COLUMNS, SheetReader  # noqa: E402
+
+
+def make_row(i, extra_columns):
+    return ([f'키워드{i % 40}', f'8/{i % 28 + 1}/2026', f'제목 {i}',
+             f'https://n.news.naver.com/mnews/article/023/{i:010d}'] +
+            [f'기타 열 {j} 값 {i}' for j in range(extra_columns)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--days', type=int, default=7)
+    parser.add_argument('--daily', type=int, default=300)
+    parser.add_argument('--extra-columns', type=int, default=6)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    header = SHEET_COLUMNS + [f'열{j}' for j in range(args.extra_columns)]
+    rows = [header] + [make_row(i, args.extra_columns) for i in range(args.rows)]
+    legacy_sheet = FakeWorksheet(rows)
+    sheet = FakeWorksheet(rows)
+
+    state = None
+    legacy_links = []
+    links = []
+    next_row = args.rows
+    # 하루는 변경 없이 한 번 더 실행되는 경우(수동 재실행)를 포함
+    for day in range(args.days + 1):
+        if day < args.days:
+            for _ in range(args.daily if day else 0):
+                row = make_row(next_row, args.extra_columns)
+                legacy_sheet.append_row(row)
+                sheet.append_row(row)
+                next_row += 1
+
+        values = legacy_sheet.get_all_values()
+        legacy_df = pd.DataFrame(values[1:], columns=values[0])
+        # 기존 방식은 매번 전체를 읽고 이미 본 링크를 걸러냄
+        seen = set(legacy_links)
+        legacy_links.extend(link for link in legacy_df['링크'] if link not in seen)
+
+        df, state = SheetReader(sheet).read(state)
+        links.extend(df['링크'])
+
+    print(f"실행 {args.days + 1}회, 시트 행 {next_row}개, 열 {len(header)}개")
+    print(f"기존(get_all_values)  요청 {legacy_sheet.requests:4d}회  셀 {legacy_sheet.cells:10,d}개")
+    print(f"SheetReader           요청 {sheet.requests:4d}회  셀 {sheet.cells:10,d}개  "
+          f"({legacy_sheet.cells / max(sheet.cells, 1):.0f}배 적음)")
+    print(f"읽은 행 동일: {legacy_links == links}")
+
+
+if __name__ == '__main__':
+    main()
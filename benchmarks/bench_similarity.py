@@ -0,0 +1,87 @@
+"""
+키워드 그룹 크기별 find_similar_articles 시간을 비교합니다.
+
+기존 방식(그룹마다 밀집 N×N cosine_similarity + 행별 np.where)과 희소 블록 곱 방식을
+합성 기사 그룹 크기 100 ~ 10,000에서 실행 시간과 최대 메모리(tracemalloc)를 측정합니다.
+
+사용법: python benchmarks/bench_similarity.py [--sizes 100,1000,5000,10000] [--legacy-max 5000]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from sklearn.feature_extraction.text import TfidfVectorizer  # noqa: E402
+from sklearn.metrics.pairwise import cosine_similarity  # noqa: E402
+
+from corpus import load_sentences, synthetic_articles  # noqa: E402
+import shorten  # noqa: E402
+
+
+def legacy_find_similar_articles(group, similarity_threshold=0.5):
+    """변경 전 find_similar_articles (밀집 유사도 행렬)"""
+    texts = group['내용'].apply(shorten.preprocess_text).tolist()
+    tfidf_matrix = TfidfVectorizer(max_features=10000).fit_transform(texts)
+    similarity_matrix = cosine_similarity(tfidf_matrix)
+    similar_groups = []
+    used_indices = set()
+    for i in range(len(texts)):
+        if i in used_indices:
+            continue
+        similar_indices = np.where(similarity_matrix[i] > similarity_threshold)[0]
+        similar_indices = [idx for idx in similar_indices if idx not in used_indices]
+        if similar_indices:
+            similar_groups.append(group.iloc[similar_indices])
+            used_indices.update(similar_indices)
+    return similar_groups
+
+
+def timed(func, *args, **kwargs):
+    """실행 시간(초), tracemalloc 최대 메모리(MB), 결과를 반환합니다."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    # tracemalloc은 실행을 느리게 하므로 메모리는 따로 한 번 더 실행해 측정
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='100,500,1000,2500,5000,10000')
+    parser.add_argument('--legacy-max', type=int, default=5000,
+                        help='기존 방식을 측정할 최대 그룹 크기 (밀집 행렬 메모리 제한)')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    sentences = load_sentences()
+    print(f"{'size':>7}{'legacy':>20}{'greedy':>20}{'components':>20}{'clusters':>10}  same")
+    for size in (int(s) for s in args.sizes.split(',')):
+        group = pd.DataFrame(synthetic_articles(size, seed=size, sentences=sentences))
+        greedy_time, greedy_peak, greedy = timed(shorten.find_similar_articles, group)
+        components_time, components_peak, _ = timed(shorten.find_similar_articles, group,
+                                                    clustering='components')
+        if size <= args.legacy_max:
+            legacy_time, legacy_peak, legacy = timed(legacy_find_similar_articles, group)
+            same = [list(g.index) for g in legacy] == [list(g.index) for g in greedy]
+            legacy_cell = f"{legacy_time:>8.2f}s {legacy_peak:>8.0f}MB"
+        else:
+            same = '-'
+            legacy_cell = f"{'skip':>20}"
+        print(f"{size:>7}{legacy_cell}{greedy_time:>8.2f}s {greedy_peak:>8.0f}MB"
+              f"{components_time:>8.2f}s {components_peak:>8.0f}MB{len(greedy):>10}  {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+기사 몇 건을 기사 목록 전체와 비교할 때 쌍마다 모델을 새로 학습하는 calculate_similarity와
+한 번 학습한 SimilarityModel의 one_vs_many/many_vs_many 시간을 비교합니다.
+
+사용법: python benchmarks/bench_similarity_api.py [--queries 5] [--top-k 5] [--threshold 0.3]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shorten  # noqa: E402
+from similarity import SimilarityModel  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--queries', type=int, default=5)
+    parser.add_argument('--top-k', type=int, default=5)
+    parser.add_argument('--threshold', type=float, default=0.3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    with open(os.path.join(ROOT, 'news_data.json'), 'r', encoding='utf-8') as f:
+        bodies = [record.get('내용', '') for record in json.load(f)]
+    queries = bodies[:args.queries]
+    print(f"질의 {len(queries)}건 x 기사 {len(bodies)}건")
+
+    pairwise, pairwise_time = timed(
+        lambda: [[shorten.calculate_similarity(query, body) for body in bodies] for query in queries])
+
+    model, fit_time = timed(lambda: SimilarityModel.fit(bodies))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'model.npz')
+        model.save(path)
+        model, load_time = timed(lambda: SimilarityModel.load(path))
+    matrix, transform_time = timed(lambda: model.transform(bodies))
+    single, single_time = timed(
+        lambda: [model.one_vs_many(query, matrix, top_k=args.top_k, threshold=args.threshold) for query in queries])
+    batch, batch_time = timed(
+        lambda: model.many_vs_many(queries, matrix, top_k=args.top_k, threshold=args.threshold))
+    assert single == batch, "one_vs_many와 many_vs_many 결과가 다릅니다"
+
+    found = sum(1 for row in pairwise for score in row if score > args.threshold)
+    print(f"쌍마다 학습 (calculate_similarity): {pairwise_time:8.3f}s  (임계값 초과 쌍 {found}개)")
+    print(f"모델 학습 / 저장 후 로드:           {fit_time:8.3f}s / {load_time:.3f}s")
+    print(f"기사 목록 변환 (transform):         {transform_time:8.3f}s")
+    print(f"one_vs_many x {len(queries):<4}                 {single_time:8.3f}s")
+    print(f"many_vs_many                        {batch_time:8.3f}s  "
+          f"({pairwise_time / (batch_time + transform_time):.0f}x, 변환 포함)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+진입점의 시작 비용(python -X importtime)을 측정해 저장된 기준값(benchmarks/startup_baseline.json)과 비교합니다.
+
+항목마다 새 프로세스를 실행하고 다음을 기록합니다.
+- 실행 시간 (repeat번 중 가장 빠른 값)
+- import 시간 합계와 누적 시간이 가장 큰 최상위 import
+- 시작 시 읽지 않아야 하는 무거운 라이브러리(pandas, scipy, sklearn, bs4) 중 읽힌 것 (시간과 달리 잡음이 없으므로
+  기준값에 없던 라이브러리가 새로 읽히면 회귀로 봄)
+
+사용법:
+    python benchmarks/bench_startup.py                  # 측정 후 기준값과 비교
+    python benchmarks/bench_startup.py --check          # 회귀가 있으면 종료 코드 1
+    python benchmarks/bench_startup.py --save-baseline  # 현재 결과를 기준값으로 저장
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+BASELINE_FILE = os.path.join(BENCH_DIR, 'startup_baseline.json')
+
+# 시간은 (1 + tolerance)배를 넘고 차이가 FLOOR_SECONDS보다 클 때 회귀로 봄
+DEFAULT_TOLERANCE = 0.25
+FLOOR_SECONDS = 0.05
+
+HEAVY_MODULES = ['pandas', 'scipy', 'sklearn', 'bs4']
+
+# 이름 → python 인자 (작업 디렉터리는 빈 임시 디렉터리, 모듈 경로는 ROOT)
+ENTRY_POINTS = {
+    'import crawler': ['-c', 'import crawler'],
+    'import shorten': ['-c', 'import shorten'],
+    'crawler.py --help': [os.path.join(ROOT, 'crawler.py'), '--help'],
+    'shorten.py --help': [os.path.join(ROOT, 'shorten.py'), '--help'],
+    # 새 기사가 없는 증분 실행 (입력 파일이 없어 바로 종료)
+    'shorten.py --incremental (입력 없음)': [os.path.join(ROOT, 'shorten.py'), '--incremental'],
+}
+
+
+def parse_importtime(stderr):
+    """
+    -X importtime 출력에서 (모듈, 자체 시간(초), 누적 시간(초), 깊이) 목록을 읽습니다.
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        parts = line[len('import time:'):].split('|')
+        self_us, cumulative_us, name = int(parts[0]), int(parts[1]), parts[2]
+        # 최상위 import는 ' name', 한 단계 안쪽마다 공백 두 칸이 더 붙음
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        modules.append((name.strip(), self_us / 1e6, cumulative_us / 1e6, depth))
+    return modules
+
+
+def measure(args, repeat):
+    """한 항목을 repeat번 실행해 가장 빠른 실행 시간과 import 내역을 반환합니다."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    best = float('inf')
+    modules = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            completed = subprocess.run([sys.executable, '-X', 'importtime', *args], cwd=workdir, env=env,
+                                       capture_output=True, text=True)
+            elapsed = time.perf_counter() - start
+            if completed.returncode != 0:
+                raise RuntimeError(f"{args} 실행 실패:\n{completed.stderr[-2000:]}")
+            if elapsed < best:
+                best = elapsed
+                modules = parse_importtime(completed.stderr)
+
+    loaded = {name for name, _, _, _ in modules}
+    # 'import X' 항목은 X 자체가 아니라 X가 읽는 모듈 중에서 고름
+    level = 1 if args[0] == '-c' else 0
+    top = sorted((m for m in modules if m[3] == level), key=lambda m: -m[2])[:5]
+    return {
+        'seconds': round(best, 4),
+        'import_seconds': round(sum(m[1] for m in modules), 4),
+        'heavy_modules': [name for name in HEAVY_MODULES if name in loaded],
+        'top_imports': {name: round(cumulative, 4) for name, _, cumulative, _ in top},
+    }
+
+
+def compare(result, base, tolerance=DEFAULT_TOLERANCE):
+    """(출력 줄 목록, 회귀 목록)"""
+    lines, regressions = [], []
+    for key in ('seconds', 'import_seconds'):
+        value, old = result[key], base[key]
+        mark = ''
+        if value > old * (1 + tolerance) and value - old > FLOOR_SECONDS:
+            mark = '  <- 회귀'
+            regressions.append(f"{key} {old:.3f}초 → {value:.3f}초")
+        lines.append(f"  {key:<16}{value:8.3f}초  기준 {old:8.3f}초  x{value / old if old else 0:.2f}{mark}")
+    added = sorted(set(result['heavy_modules']) - set(base['heavy_modules']))
+    if added:
+        regressions.append(f"시작 시 새로 읽는 라이브러리: {', '.join(added)}")
+    return lines, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='기준값 파일')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준값으로 저장')
+    parser.add_argument('--check', action='store_true', help='회귀가 있으면 종료 코드 1')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {}
+    regressions = []
+    for name, command in ENTRY_POINTS.items():
+        result = results[name] = measure(command, args.repeat)
+        heavy = ', '.join(result['heavy_modules']) or '없음'
+        top = ', '.join(f"{module} {seconds:.3f}초" for module, seconds in result['top_imports'].items())
+        print(f"[{name}] {result['seconds']:.3f}초 (import {result['import_seconds']:.3f}초), 무거운 라이브러리: {heavy}")
+        print(f"  가장 오래 걸린 import: {top}")
+        base = baseline.get('results', {}).get(name)
+        if base:
+            lines, found = compare(result, base, args.tolerance)
+            print('\n'.join(lines))
+            regressions.extend(f"{name} {item}" for item in found)
+
+    if regressions:
+        print("\n회귀:")
+        for item in regressions:
+            print(f"  {item}")
+    if args.save_baseline:
+        baseline = {'python': sys.version.split()[0], 'results': results}
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        print(f"\n기준값을 {args.baseline}에 저장했습니다.")
+    if args.check and regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
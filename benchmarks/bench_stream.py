@@ -0,0 +1,75 @@
+"""
+전체 로드 방식과 스트리밍 방식 중복제거의 최대 메모리와 시간을 비교합니다.
+
+키워드가 많은 합성 코퍼스(이력이 쌓인 경우)를 JSON 파일로 쓴 뒤, json.load + DataFrame 전체 변환(load_articles → deduplicate_records
+→ write_articles)과 shorten.stream_deduplicate를 각각 tracemalloc으로 측정하고 결과 파일이 같은지 확인합니다.
+
+사용법: python benchmarks/bench_stream.py [--keywords 30] [--articles 300] [--max-buffered 5000]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import load_sentences, synthetic_articles  # noqa: E402
+import shorten  # noqa: E402
+
+
+def measure(func):
+    """실행 시간(초)과 tracemalloc 최대 메모리(MB)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        func()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--keywords', type=int, default=30)
+    parser.add_argument('--articles', type=int, default=300)
+    parser.add_argument('--max-buffered', type=int, default=5000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as directory:
+        input_file = os.path.join(directory, 'input.json')
+        sentences = load_sentences()
+        records = []
+        for k in range(args.keywords):
+            records.extend(synthetic_articles(args.articles, keyword=f'키워드{k:02d}', seed=k, sentences=sentences))
+        with open(input_file, 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False, indent=2)
+        print(f"기사 수: {len(records)}, 입력 파일 크기: {os.path.getsize(input_file) / 1024 / 1024:.1f}MB")
+        del records
+
+        full_output = os.path.join(directory, 'full.json')
+        stream_output = os.path.join(directory, 'stream.json')
+
+        def full():
+            rows = shorten.deduplicate_records(shorten.load_articles(input_file))
+            shorten.write_articles(rows, full_output)
+
+        def stream():
+            shorten.stream_deduplicate(input_file, stream_output, max_buffered=args.max_buffered)
+
+        for name, func in (('전체 로드', full), ('스트리밍', stream)):
+            elapsed, peak = measure(func)
+            print(f"{name:<6} {elapsed:7.2f}s  최대 메모리 {peak:8.1f}MB")
+
+        with open(full_output, 'rb') as a, open(stream_output, 'rb') as b:
+            print(f"결과 동일: {a.read() == b.read()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+스트리밍 본문 추출과 기존 BeautifulSoup 트리 방식의 CPU 시간과 최대 메모리를 비교합니다.
+
+메모리는 tracemalloc 기준(파이썬 힙)으로, 기사 한 건을 처리하는 동안의 최대 할당량입니다.
+
+사용법: python benchmarks/bench_streaming.py [--repeat 20]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_extract import legacy_extract, load_fixtures  # noqa: E402
+from extractor import ExtractorRegistry  # noqa: E402
+
+
+def peak_memory(extract, html, url):
+    tracemalloc.start()
+    try:
+        extract(html, url)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def cpu_time(extract, html, url, repeat):
+    start = time.process_time()
+    for _ in range(repeat):
+        extract(html, url)
+    return (time.process_time() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    streaming = ExtractorRegistry(backend='bs4', streaming=True)
+    if not streaming.streaming:
+        print("lxml이 설치되지 않아 스트리밍 추출을 비교할 수 없습니다.")
+        return
+
+    variants = {
+        'legacy': legacy_extract,
+        'registry/bs4': ExtractorRegistry(backend='bs4', streaming=False).extract,
+        'streaming': streaming.extract,
+    }
+    fixtures = load_fixtures()
+
+    print(f"{'fixture':<24}" + ''.join(f"{v + ' cpu':>18}{v + ' peak':>20}" for v in variants))
+    for name, url, html in fixtures:
+        expected = legacy_extract(html, url)[0]
+        row = f"{name:<24}"
+        for variant, extract in variants.items():
+            if extract(html, url)[0] != expected:
+                print(f"경고: {variant} 결과가 기존 방식과 다릅니다: {name}")
+            row += f"{cpu_time(extract, html, url, args.repeat):>16.2f}ms"
+            row += f"{peak_memory(extract, html, url) / 1024:>18.0f}KB"
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+기록 기간(일)이 늘어날 때 한 키워드의 유사도 그래프를 만드는 두 방식을 비교합니다.
+
+- 전체 비교: similarity_graph (같은 키워드의 모든 기사 쌍)
+- 발행일 구간: window_similarity_graph (발행일 차이가 --window-days일 이하인 쌍만)
+
+하루 기사 수를 고정하고 기간만 늘리므로 전체 비교는 기간의 제곱, 발행일 구간은 기간에 비례해 늘어납니다.
+기간별 시간, 비교한 쌍 수, 전체 비교에서 임계값을 넘는 쌍 중 구간 밖이라 놓친 쌍의 수를 출력합니다.
+(합성 기사의 같은 사건은 발행일이 최대 2일 차이이므로, 놓친 쌍은 문장 풀을 우연히 공유한 다른 사건의 기사 쌍)
+
+사용법: python benchmarks/bench_window.py [--per-day 100] [--days 10,30,60,120] [--window-days 3]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from scipy import sparse  # noqa: E402
+
+from corpus import load_sentences, synthetic_articles  # noqa: E402
+import shorten  # noqa: E402
+from article_store import publication_day  # noqa: E402
+
+
+# synthetic_articles의 발행일은 8/1부터 최대 61일이므로 긴 기간은 이 일수씩 나누어 만듦
+CHUNK_DAYS = 30
+
+
+def period_articles(per_day, days, sentences):
+    """days일 동안 하루 평균 per_day개인 기사와 기사별 날짜 번호"""
+    articles = []
+    day_numbers = []
+    for offset in range(0, days, CHUNK_DAYS):
+        chunk = min(CHUNK_DAYS, days - offset)
+        for article in synthetic_articles(per_day * chunk, seed=days * 1000 + offset, sentences=sentences,
+                                          days=chunk):
+            articles.append(article)
+            day_numbers.append(publication_day(article['발행일']) + offset)
+    return articles, np.array(day_numbers, dtype=np.int64)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--per-day', type=int, default=100, help='하루 기사 수')
+    parser.add_argument('--days', default='10,30,60,120', help='기록 기간(일) 목록')
+    parser.add_argument('--window-days', type=int, default=3)
+    parser.add_argument('--threshold', type=float, default=0.5)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    sentences = load_sentences()
+
+    print(f"{'기간':>5}{'기사':>8}{'전체 비교':>11}{'발행일 구간':>11}{'비교 쌍':>14}{'전체 쌍':>14}{'놓친 쌍':>9}")
+    for days in (int(d) for d in args.days.split(',')):
+        articles, day_numbers = period_articles(args.per_day, days, sentences)
+        texts = [shorten.preprocess_text(article['내용']) for article in articles]
+        matrix = shorten.vectorize_texts(texts)
+
+        start = time.perf_counter()
+        full = shorten.similarity_graph(matrix, args.threshold)
+        full_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        windowed = shorten.window_similarity_graph(matrix, day_numbers, args.window_days, args.threshold)
+        window_time = time.perf_counter() - start
+
+        missed = len(set(zip(*sparse.triu(full, 1).nonzero())) - set(zip(*sparse.triu(windowed, 1).nonzero())))
+        n = len(articles)
+        print(f"{days:>4}일{n:>8}{full_time:>10.2f}s{window_time:>10.2f}s"
+              f"{shorten.window_pair_count(day_numbers, args.window_days):>14}{n * (n - 1) // 2:>14}{missed:>9}")
+
+
+if __name__ == '__main__':
+    main()
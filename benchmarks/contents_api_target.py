@@ -0,0 +1,74 @@
+"""벤치마크 비교용: 파일마다 contents API로 올리는 게시 대상 (shard_publisher.publish_shards와 함께 사용)"""
+import base64
+import json
+import os
+import sys
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shard_publisher import API_TIMEOUT, GITHUB_API_URL, PublishConflict  # noqa: E402
+
+
+class ContentsApiTarget:
+    """
+    GitHub contents API로 저장소에 게시합니다. 파일마다 커밋이 하나씩 생깁니다.
+    (GitDataTarget 이전 방식. bench_publish.py에서 비교용으로만 사용)
+    Args:
+        repo: str, 'owner/name'
+        token: str, GitHub 토큰
+        branch: str, 대상 브랜치 (기본값: 저장소 기본 브랜치)
+        api_url: str, API 주소 (로컬 가짜 API로 바꿔 검증할 때 사용)
+        session: requests.Session, 공유 세션 (없으면 새로 생성)
+    """
+
+    def __init__(self, repo, token, branch=None, api_url=GITHUB_API_URL, session=None):
+        self.repo = repo
+        self.branch = branch
+        self.api_url = api_url.rstrip('/')
+        self.session = session or requests.Session()
+        self.session.headers.update({
+            'Authorization': f"Bearer {token}",
+            'Accept': 'application/vnd.github.v3+json',
+        })
+
+    def _url(self, path):
+        return f"{self.api_url}/repos/{self.repo}/contents/{path}"
+
+    def get(self, path):
+        """(내용, sha). 파일이 없으면 (None, None)"""
+        params = {'ref': self.branch} if self.branch else None
+        response = self.session.get(self._url(path), params=params, timeout=API_TIMEOUT)
+        if response.status_code == 404:
+            return None, None
+        response.raise_for_status()
+        data = response.json()
+        return base64.b64decode(data['content']), data['sha']
+
+    def sha(self, path):
+        """파일의 blob sha (없으면 None)"""
+        return self.get(path)[1]
+
+    def _send(self, method, path, payload):
+        if self.branch:
+            payload['branch'] = self.branch
+        response = self.session.request(method, self._url(path), data=json.dumps(payload), timeout=API_TIMEOUT)
+        # sha가 없거나(422) 현재 파일과 다름(409)
+        if response.status_code in (409, 422):
+            raise PublishConflict(f"{path}: {response.status_code} {response.text[:200]}")
+        response.raise_for_status()
+        return response
+
+    def put(self, path, content, sha=None, message=None):
+        """파일을 만들거나 바꿉니다. 새 sha를 반환합니다."""
+        payload = {'message': message or f"Update {path}", 'content': base64.b64encode(content).decode()}
+        if sha:
+            payload['sha'] = sha
+        return self._send('PUT', path, payload).json()['content']['sha']
+
+    def delete(self, path, sha, message=None):
+        self._send('DELETE', path, {'message': message or f"Delete {path}", 'sha': sha})
+
+    def commit(self, message=None):
+        """put/delete마다 이미 커밋되었으므로 할 일이 없음"""
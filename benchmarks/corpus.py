@@ -0,0 +1,79 @@
+"""news_data.json의 문장으로 벤치마크용 합성 한국어 기사 코퍼스를 만듭니다."""
+import json
+import os
+import random
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+NEWSPAPERS = ['조선일보', '중앙일보', '동아일보', '경향신문', '한겨레신문', '한국일보',
+              '매일경제', '한국경제', '서울경제', '아주경제', '기타', '기타', '기타']
+NEWSPAPER_CODES = {'조선일보': '023', '중앙일보': '025', '동아일보': '020', '경향신문': '032',
+                   '한겨레신문': '028', '한국일보': '469', '매일경제': '009', '한국경제': '015',
+                   '서울경제': '011', '아주경제': '277', '기타': '999'}
+
+
+def load_records(path=os.path.join(ROOT, 'news_data.json')):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_sentences(records=None):
+    records = load_records() if records is None else records
+    sentences = []
+    for record in records:
+        sentences.extend(s.strip() + '.' for s in record.get('내용', '').split('.') if len(s.strip()) > 10)
+    return sentences
+
+
+def synthetic_articles(n, keyword='키워드', seed=0, sentences=None, story_size=4, days=30):
+    """
+    n개의 합성 기사를 만듭니다. 기사들은 평균 story_size개씩 같은 '사건'을 다루며,
+    같은 사건의 기사는 문장을 공유하고 일부 문장만 바뀐 근접 중복입니다.
+    Args:
+        n: int, 기사 수
+        keyword: str, 키워드
+        seed: int, 난수 시드
+        sentences: list, 문장 풀 (기본값: news_data.json의 문장)
+        story_size: int, 사건당 평균 기사 수
+        days: int, 발행일 범위(일)
+    Returns:
+        list: crawler.py 출력과 같은 형식의 기사 목록
+    """
+    rnd = random.Random(seed)
+    sentences = load_sentences() if sentences is None else sentences
+    articles = []
+    story = None
+    for i in range(n):
+        if story is None or rnd.random() < 1 / story_size:
+            story = {
+                'sentences': rnd.sample(sentences, rnd.randint(6, 20)),
+                'day': rnd.randint(1, days),
+            }
+        body = [s if rnd.random() > 0.2 else rnd.choice(sentences) for s in story['sentences']]
+        newspaper = rnd.choice(NEWSPAPERS)
+        day = min(days, story['day'] + rnd.choice([0, 0, 0, 1, 2]))
+        articles.append({
+            '키워드': keyword,
+            '발행일': f"8/{day}/2026" if day <= 31 else f"9/{day - 31}/2026",
+            '제목': body[0][:30],
+            '링크': f"https://n.news.naver.com/mnews/article/{NEWSPAPER_CODES[newspaper]}/{seed:03d}{i:07d}",
+            '내용': ' '.join(body),
+            '신문사': newspaper,
+        })
+    return articles
+
+
+def synthetic_corpus(scale=1, seed=0, records=None):
+    """
+    news_data.json을 scale배로 키운 코퍼스를 만듭니다. 키워드 분포는 원본과 같습니다.
+    """
+    records = load_records() if records is None else records
+    sentences = load_sentences(records)
+    counts = {}
+    for record in records:
+        counts[record['키워드']] = counts.get(record['키워드'], 0) + 1
+    corpus = []
+    for i, (keyword, count) in enumerate(sorted(counts.items())):
+        corpus.extend(synthetic_articles(count * scale, keyword=keyword, seed=seed * 1000 + i,
+                                         sentences=sentences))
+    return corpus
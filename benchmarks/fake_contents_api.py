@@ -0,0 +1,254 @@
+"""
+벤치마크/검증용 로컬 가짜 GitHub API 서버
+(contents API의 GET/PUT/DELETE와 git data API의 blob/tree/commit/ref만 흉내 내고 요청 수, 전송 바이트, 커밋 수를 셈)
+"""
+import base64
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+BRANCH = 'main'
+
+
+def git_blob_sha(content):
+    """실제 API처럼 git blob sha (게시 코드와 독립적으로 계산)"""
+    return hashlib.sha1(b'blob %d\0' % len(content) + content).hexdigest()
+
+
+def _object_sha(kind, value):
+    """트리/커밋 객체 sha (실제 git 형식은 아니지만 같은 내용이면 같은 값)"""
+    return hashlib.sha1(f"{kind} {json.dumps(value, sort_keys=True)}".encode('utf-8')).hexdigest()
+
+
+class FakeContentsApi:
+    """
+    파일을 메모리에 두는 GitHub API 서버입니다. 브랜치는 main 하나이고 files는 브랜치 최신 커밋의 파일입니다.
+    실제 API처럼 contents API로 기존 파일을 바꿀 때 sha가 없으면 422, 현재 sha와 다르면 409로 응답하고,
+    fast-forward가 아닌 ref 갱신은 422로 거부합니다.
+    Args:
+        files: dict, 저장소 안 경로 → 내용(bytes)
+    """
+
+    def __init__(self, files=None):
+        self.files = dict(files or {})
+        self.blobs = {}
+        self.trees = {}
+        self.commit_objects = {}
+        self.head = None
+        self._commit_files('Initial commit')
+        self.requests = {'GET': 0, 'PUT': 0, 'DELETE': 0, 'POST': 0, 'PATCH': 0}
+        self.received_bytes = 0
+        self.commits = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def _add_blob(self, content):
+        sha = git_blob_sha(content)
+        self.blobs[sha] = content
+        return sha
+
+    def _add_tree(self, entries):
+        sha = _object_sha('tree', entries)
+        self.trees[sha] = entries
+        return sha
+
+    def _add_commit(self, tree, parents, message):
+        commit = {'tree': tree, 'parents': parents, 'message': message}
+        sha = _object_sha('commit', commit)
+        self.commit_objects[sha] = commit
+        return sha
+
+    def _commit_files(self, message):
+        """현재 files로 커밋을 만들어 브랜치를 옮김 (contents API의 PUT/DELETE)"""
+        tree = self._add_tree({path: self._add_blob(content) for path, content in self.files.items()})
+        self.head = self._add_commit(tree, [self.head] if self.head else [], message)
+
+    def commit_directly(self, files, message='Other commit'):
+        """다른 곳에서 브랜치에 커밋한 것처럼 파일을 바꿈 (경로 → 내용, None이면 삭제)"""
+        with self._lock:
+            for path, content in files.items():
+                if content is None:
+                    self.files.pop(path, None)
+                else:
+                    self.files[path] = content
+            self._commit_files(message)
+
+    def _make_handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _route(self):
+                """/repos/{owner}/{repo}/... 뒤의 경로 (contents/...는 ('contents', 파일 경로))"""
+                parts = urlsplit(self.path).path.split('/', 4)
+                if len(parts) < 4 or parts[1] != 'repos':
+                    return None, None
+                rest = parts[4] if len(parts) > 4 else ''
+                if rest.startswith('contents/'):
+                    return 'contents', rest[len('contents/'):]
+                return 'git', rest
+
+            def _reply(self, status, payload=None):
+                body = json.dumps(payload or {}).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _body(self):
+                length = int(self.headers.get('Content-Length', 0))
+                data = self.rfile.read(length)
+                with api._lock:
+                    api.received_bytes += length
+                return json.loads(data or b'{}')
+
+            def _count(self):
+                with api._lock:
+                    api.requests[self.command] += 1
+
+            def _check_sha(self, path, sha):
+                """(상태 코드, 메시지) 또는 None"""
+                current = api.files.get(path)
+                if current is not None and not sha:
+                    return 422, '"sha" wasn\'t supplied.'
+                if current is not None and sha != git_blob_sha(current):
+                    return 409, f"{path} does not match {sha}"
+                if current is None and sha:
+                    return 404, 'Not Found'
+                return None
+
+            def do_GET(self):
+                self._count()
+                kind, path = self._route()
+                if kind == 'contents':
+                    with api._lock:
+                        content = api.files.get(path)
+                    if content is None:
+                        return self._reply(404, {'message': 'Not Found'})
+                    return self._reply(200, {'path': path, 'sha': git_blob_sha(content), 'encoding': 'base64',
+                                             'content': base64.b64encode(content).decode()})
+                with api._lock:
+                    if path == '':
+                        return self._reply(200, {'default_branch': BRANCH})
+                    if path == f'git/ref/heads/{BRANCH}':
+                        return self._reply(200, {'object': {'sha': api.head, 'type': 'commit'}})
+                    name = path.rsplit('/', 1)[-1]
+                    if path.startswith('git/commits/') and name in api.commit_objects:
+                        commit = api.commit_objects[name]
+                        return self._reply(200, {'sha': name, 'tree': {'sha': commit['tree']},
+                                                 'parents': [{'sha': sha} for sha in commit['parents']]})
+                    if path.startswith('git/trees/') and name in api.trees:
+                        entries = [{'path': p, 'mode': '100644', 'type': 'blob', 'sha': sha,
+                                    'size': len(api.blobs[sha])} for p, sha in sorted(api.trees[name].items())]
+                        return self._reply(200, {'sha': name, 'tree': entries, 'truncated': False})
+                    if path.startswith('git/blobs/') and name in api.blobs:
+                        return self._reply(200, {'sha': name, 'encoding': 'base64',
+                                                 'content': base64.b64encode(api.blobs[name]).decode()})
+                self._reply(404, {'message': 'Not Found'})
+
+            def do_PUT(self):
+                self._count()
+                _, path = self._route()
+                payload = self._body()
+                with api._lock:
+                    error = self._check_sha(path, payload.get('sha'))
+                    if error is None:
+                        created = path not in api.files
+                        content = base64.b64decode(payload['content'])
+                        api.files[path] = content
+                        api._commit_files(payload.get('message'))
+                        api.commits += 1
+                if error is not None:
+                    return self._reply(error[0], {'message': error[1]})
+                self._reply(201 if created else 200, {'content': {'path': path, 'sha': git_blob_sha(content)},
+                                                      'commit': {'message': payload.get('message')}})
+
+            def do_DELETE(self):
+                self._count()
+                _, path = self._route()
+                payload = self._body()
+                with api._lock:
+                    error = self._check_sha(path, payload.get('sha')) if path in api.files else (404, 'Not Found')
+                    if error is None:
+                        del api.files[path]
+                        api._commit_files(payload.get('message'))
+                        api.commits += 1
+                if error is not None:
+                    return self._reply(error[0], {'message': error[1]})
+                self._reply(200, {'content': None})
+
+            def do_POST(self):
+                self._count()
+                _, path = self._route()
+                payload = self._body()
+                with api._lock:
+                    if path == 'git/blobs':
+                        return self._reply(201, {'sha': api._add_blob(base64.b64decode(payload['content']))})
+                    if path == 'git/trees':
+                        if payload.get('base_tree') and payload['base_tree'] not in api.trees:
+                            return self._reply(422, {'message': 'Invalid base_tree'})
+                        entries = dict(api.trees.get(payload.get('base_tree'), {}))
+                        for entry in payload['tree']:
+                            if 'content' in entry:
+                                entries[entry['path']] = api._add_blob(entry['content'].encode('utf-8'))
+                            elif entry['sha'] is None:
+                                entries.pop(entry['path'], None)
+                            elif entry['sha'] in api.blobs:
+                                entries[entry['path']] = entry['sha']
+                            else:
+                                return self._reply(422, {'message': f"Invalid sha {entry['sha']}"})
+                        return self._reply(201, {'sha': api._add_tree(entries)})
+                    if path == 'git/commits':
+                        sha = api._add_commit(payload['tree'], payload['parents'], payload['message'])
+                        return self._reply(201, {'sha': sha})
+                self._reply(404, {'message': 'Not Found'})
+
+            def do_PATCH(self):
+                self._count()
+                _, path = self._route()
+                payload = self._body()
+                with api._lock:
+                    if path != f'git/refs/heads/{BRANCH}' or payload['sha'] not in api.commit_objects:
+                        return self._reply(422, {'message': 'Reference cannot be updated'})
+                    commit = api.commit_objects[payload['sha']]
+                    if api.head not in commit['parents'] and not payload.get('force'):
+                        return self._reply(422, {'message': 'Update is not a fast forward'})
+                    api.head = payload['sha']
+                    api.files = {p: api.blobs[sha] for p, sha in api.trees[commit['tree']].items()}
+                    api.commits += 1
+                self._reply(200, {'object': {'sha': api.head, 'type': 'commit'}})
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def reset_counts(self):
+        with self._lock:
+            self.requests = {method: 0 for method in self.requests}
+            self.received_bytes = 0
+            self.commits = 0
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,83 @@
+"""벤치마크/검증용 로컬 가짜 gspread 워크시트 (네트워크 없이 요청 수와 전송 셀 수를 셈)"""
+import re
+
+_RANGE = re.compile(r'^([A-Z]*)(\d*)(?::([A-Z]*)(\d*))?$')
+
+
+def _column_index(letters):
+    index = 0
+    for ch in letters:
+        index = index * 26 + ord(ch) - ord('A') + 1
+    return index
+
+
+class FakeSpreadsheet:
+    def __init__(self):
+        self.modified = 0
+
+    def get_lastUpdateTime(self):
+        return f"2026-01-01T00:00:{self.modified:02d}Z"
+
+
+class FakeWorksheet:
+    """
+    gspread Worksheet의 row_values / batch_get / get_all_values만 흉내 냅니다.
+    Args:
+        rows: list, 헤더를 포함한 행 목록
+    """
+
+    title = 'Result'
+
+    def __init__(self, rows):
+        self.rows = [list(row) for row in rows]
+        self.spreadsheet = FakeSpreadsheet()
+        self.requests = 0
+        self.cells = 0
+
+    def append_row(self, row):
+        self.rows.append(list(row))
+        self.spreadsheet.modified += 1
+
+    def _cell(self, row, col):
+        if row <= len(self.rows) and col <= len(self.rows[row - 1]):
+            return self.rows[row - 1][col - 1]
+        return ''
+
+    def get_all_values(self):
+        self.requests += 1
+        width = max(len(row) for row in self.rows)
+        values = [row + [''] * (width - len(row)) for row in self.rows]
+        self.cells += sum(len(row) for row in values)
+        return values
+
+    def row_values(self, row):
+        self.requests += 1
+        values = list(self.rows[row - 1]) if row <= len(self.rows) else []
+        while values and values[-1] == '':
+            values.pop()
+        self.cells += len(values)
+        return values
+
+    def batch_get(self, ranges, major_dimension=None):
+        self.requests += 1
+        width = max(len(row) for row in self.rows)
+        results = []
+        for a1 in ranges:
+            col1, row1, col2, row2 = _RANGE.match(a1).groups()
+            first_col = _column_index(col1) if col1 else 1
+            last_col = _column_index(col2) if col2 else (first_col if col1 and ':' not in a1 else width)
+            first_row = int(row1) if row1 else 1
+            last_row = int(row2) if row2 else (first_row if ':' not in a1 else len(self.rows))
+            grid = [[self._cell(r, c) for c in range(first_col, last_col + 1)]
+                    for r in range(first_row, last_row + 1)]
+            if major_dimension == 'COLUMNS':
+                grid = [list(column) for column in zip(*grid)] if grid else []
+            # Sheets API처럼 끝의 빈 칸과 빈 줄을 잘라서 반환
+            for line in grid:
+                while line and line[-1] == '':
+                    line.pop()
+            while grid and not grid[-1]:
+                grid.pop()
+            self.cells += sum(len(line) for line in grid)
+            results.append(grid)
+        return results
@@ -0,0 +1,121 @@
+"""
+news_data.json의 본문으로 추출기 벤치마크용 HTML 픽스처를 만듭니다.
+
+실제 기사 페이지의 구조(메뉴, 스크립트, 광고, 기자 정보, 저작권 영역 등)를 흉내 낸
+결정적(deterministic) 페이지를 benchmarks/fixtures/ 아래에 저장합니다.
+
+사용법: python benchmarks/make_fixtures.py
+"""
+import json
+import os
+import random
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+SCRIPT = '<script type="text/javascript">window.__data = {"ads": [1, 2, 3], "tracking": "abcdef"};</script>'
+STYLE = '<style>.nav li { float: left; margin: 0 4px; } .ad { display: none; }</style>'
+
+
+def navigation(rnd, items=120):
+    links = ''.join(f'<li><a href="/section/{rnd.randint(100, 999)}">메뉴 {i}</a></li>' for i in range(items))
+    return f'<div id="gnb"><ul class="nav">{links}</ul></div>'
+
+
+def related(rnd, items=40):
+    links = ''.join(
+        f'<li><a href="/article/{rnd.randint(10000, 99999)}"><strong>관련 기사 제목 {i}</strong>'
+        f'<span class="press">언론사</span></a></li>' for i in range(items)
+    )
+    return f'<div class="related"><ul>{links}</ul></div>'
+
+
+def paragraphs(text, rnd):
+    """본문을 문장 단위로 나누어 <br>과 이미지 설명을 섞습니다."""
+    sentences = [s.strip() for s in text.split('.') if s.strip()]
+    parts = []
+    for i, sentence in enumerate(sentences):
+        parts.append(f'{sentence}.')
+        if i % 3 == 2:
+            parts.append('<br><br>')
+        if i % 7 == 6:
+            parts.append(f'<span class="end_photo_org"><img src="/img/{rnd.randint(1, 999)}.jpg">'
+                         f'<em class="img_desc">사진 설명 {i}</em></span>')
+    return ''.join(parts)
+
+
+def page(title, head_extra, body_html):
+    return (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">'
+        f'<title>{title}</title>{STYLE}{SCRIPT * 6}{head_extra}</head><body>'
+        f'{body_html}</body></html>'
+    )
+
+
+def build(records):
+    rnd = random.Random(42)
+    texts = sorted((r['내용'] for r in records if len(r.get('내용', '')) > 800), key=len)
+    long_text, mid_text, short_text = texts[-1], texts[len(texts) // 2], texts[len(texts) // 4]
+
+    chrome = navigation(rnd) + SCRIPT * 4
+    footer = related(rnd) + '<div id="footer"><p>회사 소개 | 이용 약관 | 개인정보처리방침</p></div>'
+
+    fixtures = {}
+    fixtures['naver_news.html'] = ('https://n.news.naver.com/mnews/article/028/0002819668?sid=103', page(
+        '네이버 뉴스', '',
+        chrome + '<div id="ct"><div class="media_end_head"><h2>기사 제목</h2></div>'
+        '<div id="contents" class="newsct_body"><div id="newsct_article">'
+        f'<article id="dic_area" class="go_trans _article_content">{paragraphs(long_text, rnd)}'
+        '<div class="reporter_area">홍길동 기자 hong@example.com</div>'
+        '<div class="copyright">Copyright ⓒ 한겨레신문사. All rights reserved.</div>'
+        f'{SCRIPT}</article></div></div></div>' + footer
+    ))
+    fixtures['naver_news_div.html'] = ('https://n.news.naver.com/mnews/article/023/0003900001?sid=101', page(
+        '네이버 뉴스', '',
+        chrome + '<div id="ct"><div id="newsct_article">'
+        f'<div id="dic_area">{paragraphs(mid_text, rnd)}<div class="promotion">구독하기</div>'
+        '<div class="copyright">무단 전재 및 재배포 금지</div></div></div></div>' + footer
+    ))
+    fixtures['naver_entertain.html'] = ('https://m.entertain.naver.com/article/109/0005000001', page(
+        '네이버 엔터', '',
+        chrome + f'<div class="end_ct"><div id="articeBody">{paragraphs(short_text, rnd)}'
+        '<iframe src="/ad"></iframe></div></div>' + footer
+    ))
+    fixtures['naver_sports.html'] = ('https://sports.news.naver.com/news?oid=001&aid=0014000001', page(
+        '네이버 스포츠', '',
+        chrome + f'<div id="newsEndContents">{paragraphs(mid_text, rnd)}'
+        '<div class="reporter_area">기자 정보</div></div>' + footer
+    ))
+    fixtures['businesspost.html'] = ('https://www.businesspost.co.kr/BP?command=article_view&num=300001', page(
+        '비즈니스포스트', '',
+        chrome + f'<div class="detail"><div id="articleBody">{paragraphs(long_text, rnd)}</div></div>' + footer
+    ))
+    fixtures['generic_content.html'] = ('https://www.example-news.co.kr/news/articleView.html?idxno=1001', page(
+        '지역 신문', '',
+        chrome + f'<div id="wrap"><div id="content"><h1>제목</h1><p>{paragraphs(mid_text, rnd)}</p>'
+        '<div class="copyright">저작권자 © 지역 신문</div></div></div>' + footer
+    ))
+    fixtures['no_body.html'] = ('https://www.example-portal.com/landing', page(
+        '포털', '', chrome + '<div id="main"><p>본문이 없는 페이지입니다.</p></div>' + footer
+    ))
+    return fixtures
+
+
+def main():
+    with open(os.path.join(ROOT, 'news_data.json'), 'r', encoding='utf-8') as f:
+        records = json.load(f)
+
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    index = {}
+    for name, (url, html) in build(records).items():
+        with open(os.path.join(FIXTURE_DIR, name), 'w', encoding='utf-8') as f:
+            f.write(html)
+        index[name] = url
+        print(f"{name}: {len(html.encode('utf-8'))} bytes")
+
+    with open(os.path.join(FIXTURE_DIR, 'index.json'), 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,325 @@
+"""
+오프라인에서 재현 가능한 파이프라인 벤치마크 모음입니다.
+
+news_data.json의 문장으로 만든 합성 한국어 코퍼스(corpus.py)를 사용하며 네트워크에 접근하지 않습니다.
+
+- 크롤링: 1x 코퍼스를 가짜 시트 행으로 만들고, 기사 페이지는 benchmarks/fixtures의 페이지 구조(make_fixtures.py)에
+  각 기사 본문을 넣어 로컬 스텁 서버에서 응답합니다. crawler.main(시트 읽기 → 크롤링 → 중복제거 → 저장) 전체를 실행합니다.
+- 1x/10x/100x: 코퍼스를 체크포인트 파일로 써 두고 shorten.main(읽기 → 중복제거 → 저장)을 실행합니다.
+  (페이지 파싱은 기사 수에 비례하므로 크롤링은 1x에서만 측정)
+
+항목마다 별도 프로세스와 빈 작업 디렉터리에서 실행하고, 실행 보고서(metrics.write_report)의 단계별 시간,
+단계별 최대 메모리(tracemalloc), 지연 시간 히스토그램, 결과 파일 해시를 저장된 기준값(benchmarks/baseline.json)과
+비교합니다.
+
+사용법:
+    python benchmarks/run_suite.py                      # 크롤링, 1x/10x/100x 실행 후 기준값과 비교
+    python benchmarks/run_suite.py --scales 1 10 --no-crawl
+    python benchmarks/run_suite.py --save-baseline      # 현재 결과를 기준값으로 저장
+    python benchmarks/run_suite.py --check              # 느려졌거나 결과가 바뀌면 종료 코드 1
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT)
+
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baseline.json')
+DEFAULT_SCALES = [1, 10, 100]
+
+# 이 비율 이상 느려지거나 메모리가 늘면 회귀로 표시 (작은 값의 측정 잡음은 MIN_* 이하 차이로 무시)
+DEFAULT_TOLERANCE = 0.25
+MIN_SECONDS = 0.05
+MIN_MB = 1.0
+
+# 기사 페이지 구조 (make_fixtures.py의 네이버 뉴스 두 가지 형태)
+LAYOUTS = ('article', 'div')
+
+
+def article_page(text, index):
+    """기사 본문을 make_fixtures.py의 네이버 뉴스 페이지 구조에 넣은 HTML"""
+    from make_fixtures import SCRIPT, navigation, page, paragraphs, related
+
+    rnd = random.Random(index)
+    chrome = navigation(rnd) + SCRIPT * 4
+    footer = related(rnd) + '<div id="footer"><p>회사 소개 | 이용 약관 | 개인정보처리방침</p></div>'
+    body = paragraphs(text, rnd)
+    if LAYOUTS[index % len(LAYOUTS)] == 'article':
+        content = (f'<article id="dic_area" class="go_trans _article_content">{body}'
+                   '<div class="reporter_area">홍길동 기자 hong@example.com</div>'
+                   f'<div class="copyright">Copyright ⓒ. All rights reserved.</div>{SCRIPT}</article>')
+    else:
+        content = (f'<div id="dic_area">{body}<div class="promotion">구독하기</div>'
+                   '<div class="copyright">무단 전재 및 재배포 금지</div></div>')
+    return page('네이버 뉴스', '', chrome + f'<div id="ct"><div id="newsct_article">{content}</div></div>' + footer)
+
+
+class ArticlePages:
+    """
+    스텁 서버용 경로 → HTML 매핑. 요청이 올 때 페이지를 만들어 100x 규모에서도 페이지를 모두 메모리에 두지 않습니다.
+    본문이 빈 기사는 본문이 없는 페이지(no_body.html)로 응답합니다.
+    """
+
+    def __init__(self, texts):
+        self.texts = texts  # 경로 → (기사 번호, 본문)
+        with open(os.path.join(BENCH_DIR, 'fixtures', 'no_body.html'), 'r', encoding='utf-8') as f:
+            self.no_body = f.read()
+
+    def get(self, path, default=None):
+        found = self.texts.get(path)
+        if found is None:
+            return default
+        index, text = found
+        return article_page(text, index) if text else self.no_body
+
+
+def sheet_rows(corpus, base_url):
+    """코퍼스를 스텁 서버 링크를 가진 시트 행과 경로별 본문으로 바꿉니다."""
+    from sheet_reader import SHEET_COLUMNS
+
+    rows = [SHEET_COLUMNS + ['비고']]
+    texts = {}
+    for index, article in enumerate(corpus):
+        # 원래 링크의 호스트를 경로에 남겨 신문사 판별(naver.com/article/<코드>)이 그대로 동작하게 함
+        path = '/' + article['링크'].split('://', 1)[1]
+        texts[path] = (index, article['내용'])
+        rows.append([article['키워드'], article['발행일'], article['제목'], base_url + path, ''])
+    return rows, texts
+
+
+def file_digest(path, base_url=None):
+    """결과 파일의 SHA-256 (base_url이 주어지면 실행마다 다른 스텁 서버 주소를 원래 링크 형태로 바꿔서 계산)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if base_url:
+        data = data.replace(f"{base_url}/".encode('utf-8'), b'https://')
+    return hashlib.sha256(data).hexdigest()
+
+
+def synthetic_input(scale):
+    """news_data.json을 scale배로 키운 합성 코퍼스 (일부 기사는 본문이 없는 페이지로 응답해 실패 경로도 포함)"""
+    from corpus import synthetic_corpus
+
+    corpus = synthetic_corpus(scale)
+    for article in corpus[::50]:
+        article['내용'] = ''
+    return corpus
+
+
+def summarize(report, output, articles, base_url=None, **extra):
+    """실행 보고서에서 비교에 쓰는 값만 모읍니다."""
+    return dict({
+        'articles': articles,
+        'written': report.get('written'),
+        'digest': file_digest(output, base_url),
+        'stages': report['stages'],
+        'stage_peak_mb': report.get('stage_peak_mb', {}),
+        'total_seconds': report['total_seconds'],
+        'max_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'latency_p50': {name: h['p50'] for name, h in report['histograms'].items()},
+        'counters': report['counters'],
+    }, **extra)
+
+
+def preload():
+    """
+    중복제거/시트 읽기 단계에서 처음 import하는 무거운 라이브러리를 미리 읽습니다.
+    import 비용은 bench_startup.py에서 따로 추적하고, 여기서는 단계별 처리 시간과 메모리만 비교합니다.
+    """
+    import pandas  # noqa: F401
+    import scipy.sparse.csgraph  # noqa: F401
+    import sklearn.feature_extraction.text  # noqa: F401
+    import sklearn.preprocessing  # noqa: F401
+    import sklearn.utils.extmath  # noqa: F401
+
+
+def run_crawl(workdir):
+    """
+    1x 코퍼스를 스텁 서버에서 크롤링하는 전체 파이프라인(crawler.main)을 실행합니다.
+    페이지 파싱 시간이 tracemalloc에 크게 왜곡되므로 메모리는 최대 RSS만 기록합니다.
+    """
+    from fake_sheet import FakeWorksheet
+    from stub_server import StubServer
+    import crawler
+
+    corpus = synthetic_input(1)
+    preload()
+    with StubServer(latency=0.0) as server:
+        rows, texts = sheet_rows(corpus, server.base_url)
+        server.pages = ArticlePages(texts)
+        report_path = os.path.join(workdir, 'run_report.json')
+        crawler.main(worksheet=FakeWorksheet(rows), report=report_path)
+
+    with open(report_path, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    return summarize(report, os.path.join(workdir, 'news_data.json'), len(corpus), base_url=server.base_url,
+                     scale='crawl')
+
+
+def run_dedup(workdir, scale, memory=True):
+    """scale배 코퍼스를 체크포인트로 써 두고 shorten.main(읽기 → 중복제거 → 저장)을 실행합니다."""
+    from record_stream import iter_records
+    import shorten
+
+    corpus = [article for article in synthetic_input(scale) if article['내용']]
+    with open(os.path.join(workdir, shorten.INPUT_FILE), 'w', encoding='utf-8') as f:
+        json.dump(corpus, f, ensure_ascii=False, indent=2)
+    articles = len(corpus)
+    del corpus
+
+    report_path = os.path.join(workdir, 'run_report.json')
+    preload()
+    if memory:
+        tracemalloc.start()
+    shorten.main(report=report_path)
+    if memory:
+        tracemalloc.stop()
+
+    with open(report_path, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    output = os.path.join(workdir, shorten.OUTPUT_FILE)
+    report['written'] = sum(1 for _ in iter_records(output))
+    return summarize(report, output, articles, scale=scale)
+
+
+def run_in_workdir(target, memory=True):
+    """임시 작업 디렉터리(빈 캐시/상태)에서 한 항목을 실행합니다."""
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            if target == 'crawl':
+                return run_crawl(workdir)
+            return run_dedup(workdir, int(target), memory=memory)
+        finally:
+            os.chdir(ROOT)
+
+
+def run_isolated(target, memory=True):
+    """항목마다 새 프로세스에서 실행 (모듈 상태, 추출기 학습, 최대 RSS가 섞이지 않도록)"""
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+        out = f.name
+    try:
+        command = [sys.executable, os.path.abspath(__file__), '--run', str(target), '--out', out]
+        if not memory:
+            command.append('--no-memory')
+        # 로컬 스텁 서버이므로 호스트별 요청 속도 제한 없이 파싱 비용을 측정
+        env = dict(os.environ, FETCH_RATE_PER_HOST=os.environ.get('FETCH_RATE_PER_HOST', '0'))
+        subprocess.run(command, check=True, env=env)
+        with open(out, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    finally:
+        os.remove(out)
+
+
+def compare(result, base, tolerance=DEFAULT_TOLERANCE):
+    """
+    기준값과 비교해 (표 줄 목록, 회귀 목록)을 반환합니다.
+    시간/메모리는 (1 + tolerance)배를 넘고 차이가 잡음 하한보다 클 때 회귀로 봅니다.
+    """
+    lines, regressions = [], []
+    for kind, unit, floor in (('stages', '초', MIN_SECONDS), ('stage_peak_mb', 'MB', MIN_MB)):
+        for name, value in result[kind].items():
+            old = base.get(kind, {}).get(name)
+            if old is None:
+                lines.append(f"  {name:<8} {value:>10.3f}{unit}  (기준값 없음)")
+                continue
+            ratio = value / old if old else float('inf')
+            flag = ''
+            if value > old * (1 + tolerance) and value - old > floor:
+                flag = '  <- 회귀'
+                regressions.append(f"{label(result['scale'])} {name} {old:.3f}{unit} → {value:.3f}{unit}")
+            lines.append(f"  {name:<8} {value:>10.3f}{unit}  기준 {old:>10.3f}{unit}  x{ratio:.2f}{flag}")
+    if base.get('digest') and base['digest'] != result['digest']:
+        regressions.append(f"{label(result['scale'])} 결과 파일이 기준값과 다릅니다 (기사 {base.get('written')} → {result['written']})")
+    return lines, regressions
+
+
+def label(target):
+    return '크롤링(1x)' if target == 'crawl' else f"{target}x"
+
+
+def print_result(result):
+    print(f"\n[{label(result['scale'])}] 기사 {result['articles']}개 → 저장 {result['written']}개, "
+          f"합계 {result['total_seconds']:.2f}초, 최대 RSS {result['max_rss_mb']}MB")
+    stages = ', '.join(f"{name} {seconds:.2f}초" for name, seconds in result['stages'].items())
+    print(f"  단계: {stages}")
+    if result['stage_peak_mb']:
+        peaks = ', '.join(f"{name} {mb:.1f}MB" for name, mb in result['stage_peak_mb'].items())
+        print(f"  단계별 최대 메모리: {peaks}")
+    latency = ', '.join(f"{name} {p50}" for name, p50 in sorted(result['latency_p50'].items()))
+    print(f"  지연 시간 p50(초): {latency}")
+
+
+def load_baseline(path=BASELINE_FILE):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='파이프라인 벤치마크 모음')
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES,
+                        help=f'news_data.json 대비 코퍼스 배율 (기본값: {DEFAULT_SCALES})')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='기준값 파일')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준값으로 저장')
+    parser.add_argument('--check', action='store_true', help='회귀가 있으면 종료 코드 1')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'회귀로 보는 증가 비율 (기본값: {DEFAULT_TOLERANCE})')
+    parser.add_argument('--no-crawl', action='store_true', help='스텁 서버 크롤링 항목을 건너뜀')
+    parser.add_argument('--no-memory', action='store_true', help='tracemalloc 없이 시간만 측정')
+    parser.add_argument('--run', help=argparse.SUPPRESS)
+    parser.add_argument('--out', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    sys.path.insert(0, BENCH_DIR)
+    if args.run is not None:
+        logging.disable(logging.WARNING)
+        result = run_in_workdir(args.run, memory=not args.no_memory)
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False)
+        return
+
+    baseline = load_baseline(args.baseline)
+    results = {}
+    regressions = []
+    targets = ([] if args.no_crawl else ['crawl']) + [str(scale) for scale in args.scales]
+    for target in targets:
+        result = results[target] = run_isolated(target, memory=not args.no_memory)
+        print_result(result)
+        base = baseline.get('results', {}).get(target)
+        if base is None:
+            print("  (기준값 없음)")
+            continue
+        lines, found = compare(result, base, args.tolerance)
+        print('\n'.join(lines))
+        regressions.extend(found)
+
+    if args.save_baseline:
+        baseline.setdefault('results', {}).update(results)
+        baseline['python'] = sys.version.split()[0]
+        baseline['memory'] = not args.no_memory
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        print(f"\n기준값을 {args.baseline}에 저장했습니다.")
+
+    if regressions:
+        print('\n회귀:')
+        for line in regressions:
+            print(f"  {line}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
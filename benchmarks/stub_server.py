@@ -0,0 +1,88 @@
+"""벤치마크용 로컬 스텁 HTTP 서버"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_PAGE = (
+    '<html><head><title>기사</title><script>var a = 1;</script></head><body>'
+    '<div id="header">메뉴</div>'
+    '<div id="dic_area">'
+    + '정부는 오늘 새로운 정책을 발표했다. ' * 40 +
+    '<div class="reporter_area">기자</div></div>'
+    '<div class="copyright">저작권</div></body></html>'
+)
+
+
+class StubServer:
+    """
+    고정 지연을 두고 HTML을 응답하는 로컬 서버입니다.
+    Args:
+        pages: dict, 경로 → HTML (없는 경로는 default_page로 응답)
+        latency: float, 응답 전 대기 시간(초)
+        default_page: str, 기본 응답 HTML
+        failures: dict, 경로 → 정상 응답 전에 보낼 오류 상태 코드 목록 (예: [503, 429])
+        failure_status: int, 주어지면 모든 요청에 이 상태 코드로 응답 (계속 실패하는 호스트)
+    """
+
+    def __init__(self, pages=None, latency=0.05, default_page=DEFAULT_PAGE, failures=None, failure_status=None):
+        self.pages = pages or {}
+        self.latency = latency
+        self.default_page = default_page
+        self.failures = {path: list(statuses) for path, statuses in (failures or {}).items()}
+        self.failure_status = failure_status
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                with stub._lock:
+                    stub.request_count += 1
+                    pending = stub.failures.get(path)
+                    status = pending.pop(0) if pending else stub.failure_status
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if status:
+                    self.send_response(status)
+                    if status == 429:
+                        self.send_header('Retry-After', '0')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                body = stub.pages.get(path, stub.default_page).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
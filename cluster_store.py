@@ -0,0 +1,282 @@
+import logging
+import os
+import sqlite3
+import time
+
+import numpy as np
+from scipy import sparse
+from sklearn.preprocessing import normalize
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLUSTER_PATH = os.path.join('.cache', 'clusters.sqlite3')
+DEFAULT_MODEL_PATH = os.path.join('.cache', 'cluster_model.npz')
+DEFAULT_TTL = 7 * 24 * 60 * 60  # 7일 동안 새 기사가 붙지 않은 묶음은 제거
+
+# 중심 벡터에 남기는 최대 단어 수 (가중치 상위)
+CENTROID_TERMS = 256
+
+# 새 기사 단어 중 모델 어휘에 없는 단어의 비율이 새 기사로 학습한 모델보다 이만큼 높거나,
+# 모델이 이 기간(초)보다 오래되면 다시 학습
+DEFAULT_MAX_OOV = 0.1
+DEFAULT_MAX_MODEL_AGE = 30 * 24 * 60 * 60
+
+
+class ClusterStore:
+    """
+    실행 간에 유지되는 키워드별 기사 묶음(유사 그룹)의 중심 벡터 저장소 (SQLite)입니다.
+    새 기사를 기존 묶음에 배정하거나 새 묶음을 열어, 과거 기사 전체를 다시 비교하지 않고
+    며칠에 걸친 같은 이야기의 후속 기사를 찾습니다.
+    벡터는 저장해 둔 SimilarityModel의 어휘/IDF를 사용하고, 새 기사에 어휘에 없는 단어가 많아지거나
+    모델이 오래되면 새 기사로 다시 학습한 뒤 저장된 중심 벡터를 새 어휘로 옮깁니다.
+    (모델 파일을 지우면 기존 중심 벡터와 열이 맞지 않으므로 저장소도 함께 지워야 함)
+    Args:
+        path: str, SQLite 파일 경로
+        model_path: str, 유사도 모델 파일 경로
+        ttl: float, 마지막으로 기사가 배정된 뒤 묶음을 유지하는 기간(초)
+        max_terms: int, 중심 벡터에 남기는 최대 단어 수
+        max_oov: float, 새 기사 단어 중 어휘에 없는 단어의 비율이 새 기사로 학습한 모델보다
+            이만큼 높으면 다시 학습 (어휘 수 상한 때문에 새로 학습해도 어휘 밖 단어가 남으므로 차이로 판단)
+        max_model_age: float, 모델 파일이 이 기간(초)보다 오래되면 다시 학습
+    """
+
+    def __init__(self, path=DEFAULT_CLUSTER_PATH, model_path=DEFAULT_MODEL_PATH, ttl=DEFAULT_TTL,
+                 max_terms=CENTROID_TERMS, max_oov=DEFAULT_MAX_OOV, max_model_age=DEFAULT_MAX_MODEL_AGE):
+        self.path = path
+        self.model_path = model_path
+        self.ttl = ttl
+        self.max_terms = max_terms
+        self.max_oov = max_oov
+        self.max_model_age = max_model_age
+        self._model = None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            '''CREATE TABLE IF NOT EXISTS clusters (
+                id INTEGER PRIMARY KEY,
+                keyword TEXT NOT NULL,
+                link TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                terms BLOB NOT NULL,
+                weights BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_clusters ON clusters(keyword, updated_at);'''
+        )
+        self._conn.commit()
+        self.prune()
+
+    def model(self, texts, now=None):
+        """
+        유사도 모델을 반환합니다. 저장된 모델이 없으면 texts로 학습해 저장합니다.
+        저장된 모델의 texts 어휘 밖 단어 비율이 texts로 새로 학습한 모델보다 max_oov 넘게 높거나
+        모델이 max_model_age보다 오래되면 새로 학습한 모델로 바꿉니다.
+        """
+        if self._model is None:
+            # similarity는 shorten을 import하므로 shorten이 이 모듈을 읽을 때 순환하지 않도록 여기서 import
+            from similarity import SimilarityModel, load_or_fit
+            saved = os.path.exists(self.model_path)
+            self._model = load_or_fit(texts, self.model_path)
+            if saved:
+                now = time.time() if now is None else now
+                age = now - os.path.getmtime(self.model_path)
+                fresh = SimilarityModel.fit(texts)
+                oov, fresh_oov = self._model.oov_share(texts), fresh.oov_share(texts)
+                if oov - fresh_oov > self.max_oov or age > self.max_model_age:
+                    logger.info(f"유사도 모델을 다시 학습합니다 (어휘 밖 단어 {oov:.1%} → {fresh_oov:.1%}, "
+                                f"모델 나이 {age / 86400:.1f}일)")
+                    self.refit(texts, fresh)
+        return self._model
+
+    def refit(self, texts, model=None):
+        """
+        texts로 모델을 다시 학습해 저장하고, 저장된 중심 벡터를 새 어휘로 옮깁니다.
+        단어 가중치는 새 IDF / 이전 IDF 비율로 바꾸어 다시 정규화하고(근사), 새 어휘에 없는 단어는 버립니다.
+        남는 단어가 없는 묶음은 제거합니다.
+        Args:
+            texts: list, 학습에 쓸 기사 본문
+            model: SimilarityModel, texts로 이미 학습한 모델 (없으면 학습)
+        """
+        from similarity import SimilarityModel
+        old = self._model if self._model is not None else SimilarityModel.load(self.model_path)
+        new = model if model is not None else SimilarityModel.fit(texts)
+        new_index = {term: i for i, term in enumerate(new.vocabulary)}
+        # 이전 어휘 번호 → 새 어휘 번호 (-1이면 새 어휘에 없음)
+        mapping = np.array([new_index.get(term, -1) for term in old.vocabulary], dtype=np.int64)
+        ratio = np.zeros(len(old.vocabulary))
+        kept = mapping >= 0
+        ratio[kept] = new.idf[mapping[kept]] / old.idf[kept]
+
+        updates, removed = [], []
+        for cluster_id, terms, weights in self._conn.execute('SELECT id, terms, weights FROM clusters'):
+            terms = np.frombuffer(terms, dtype=np.int32)
+            weights = np.frombuffer(weights, dtype=np.float32) * ratio[terms]
+            keep = mapping[terms] >= 0
+            if not keep.any():
+                removed.append((cluster_id,))
+                continue
+            vector = sparse.csr_matrix((weights[keep], (np.zeros(keep.sum(), dtype=np.int64), mapping[terms[keep]])),
+                                       shape=(1, len(new.vocabulary)))
+            updates.append((*self._encode(vector), cluster_id))
+        self._conn.executemany('UPDATE clusters SET terms = ?, weights = ? WHERE id = ?', updates)
+        self._conn.executemany('DELETE FROM clusters WHERE id = ?', removed)
+        self._conn.commit()
+        new.save(self.model_path)
+        self._model = new
+        logger.info(f"기사 묶음 {len(updates)}개를 새 어휘로 옮기고 {len(removed)}개를 제거했습니다.")
+        return new
+
+    def prune(self, now=None):
+        """ttl 동안 기사가 배정되지 않은 묶음을 제거합니다."""
+        now = time.time() if now is None else now
+        removed = self._conn.execute('DELETE FROM clusters WHERE updated_at < ?', (now - self.ttl,)).rowcount
+        self._conn.commit()
+        if removed:
+            logger.info(f"오래된 기사 묶음 {removed}개 제거")
+        return removed
+
+    def load(self, keyword, num_features):
+        """
+        키워드의 기사 묶음을 읽습니다.
+        Returns:
+            tuple: (묶음 id 배열, 묶음 크기 배열, 묶음 수 × num_features 중심 벡터 행렬)
+        """
+        rows = self._conn.execute(
+            'SELECT id, size, terms, weights FROM clusters WHERE keyword = ? ORDER BY id', (keyword,)
+        ).fetchall()
+        ids = np.array([row[0] for row in rows], dtype=np.int64)
+        sizes = np.array([row[1] for row in rows], dtype=np.int64)
+        terms = [np.frombuffer(row[2], dtype=np.int32) for row in rows]
+        weights = [np.frombuffer(row[3], dtype=np.float32) for row in rows]
+        indptr = np.concatenate([[0], np.cumsum([len(t) for t in terms])]).astype(np.int64)
+        centroids = sparse.csr_matrix(
+            (np.concatenate(weights or [np.empty(0, dtype=np.float32)]).astype(np.float64),
+             np.concatenate(terms or [np.empty(0, dtype=np.int32)]), indptr),
+            shape=(len(rows), num_features)
+        )
+        return ids, sizes, centroids
+
+    def _encode(self, vector):
+        """중심 벡터(1×V)를 가중치 상위 max_terms개 단어만 남겨 정규화한 뒤 (단어, 가중치) 바이트로 변환"""
+        vector = sparse.csr_matrix(vector)
+        vector.sort_indices()
+        terms, weights = vector.indices, vector.data
+        if len(weights) > self.max_terms:
+            keep = np.sort(np.argpartition(-weights, self.max_terms - 1)[:self.max_terms])
+            terms, weights = terms[keep], weights[keep]
+        norm = np.linalg.norm(weights)
+        if norm > 0:
+            weights = weights / norm
+        return terms.astype(np.int32).tobytes(), weights.astype(np.float32).tobytes()
+
+    def update(self, ids, centroids, sizes, now=None):
+        """
+        기존 묶음의 중심 벡터와 크기를 갱신합니다.
+        Args:
+            ids: array, 묶음 id
+            centroids: sparse matrix, 묶음별 새 중심 벡터 (정규화 전)
+            sizes: array, 묶음별 새 크기
+        """
+        now = time.time() if now is None else now
+        centroids = sparse.csr_matrix(centroids)
+        self._conn.executemany(
+            'UPDATE clusters SET size = ?, terms = ?, weights = ?, updated_at = ? WHERE id = ?',
+            [(int(size), *self._encode(centroids[i]), now, int(cluster_id))
+             for i, (cluster_id, size) in enumerate(zip(ids, sizes))]
+        )
+
+    def add(self, keyword, links, centroids, sizes, now=None):
+        """
+        새 묶음을 추가합니다. 빈 중심 벡터(어휘에 있는 단어가 없는 기사)는 저장하지 않습니다.
+        Args:
+            links: list, 묶음별 대표 기사 링크
+            centroids: sparse matrix, 묶음별 중심 벡터 (정규화 전)
+            sizes: array, 묶음별 기사 수
+        """
+        now = time.time() if now is None else now
+        centroids = sparse.csr_matrix(centroids)
+        rows = []
+        for i, (link, size) in enumerate(zip(links, sizes)):
+            if centroids.indptr[i] == centroids.indptr[i + 1]:
+                continue
+            rows.append((keyword, link, int(size), *self._encode(centroids[i]), now, now))
+        self._conn.executemany(
+            '''INSERT INTO clusters (keyword, link, size, terms, weights, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)''', rows
+        )
+        return len(rows)
+
+    def __len__(self):
+        return self._conn.execute('SELECT COUNT(*) FROM clusters').fetchone()[0]
+
+    def commit(self):
+        self._conn.commit()
+
+    def close(self):
+        self._conn.commit()
+        self._conn.close()
+
+
+def assign_to_clusters(keyword, vectors, store, similarity_threshold=0.5, now=None):
+    """
+    새 기사 벡터를 키워드의 기존 묶음에 배정하고, 배정된 묶음의 중심 벡터를 갱신합니다.
+    중심 벡터와의 코사인 유사도가 임계값을 넘는 묶음 중 가장 가까운 곳에 배정합니다.
+    Args:
+        keyword: str, 키워드
+        vectors: sparse matrix, 새 기사별 정규화된 TF-IDF 벡터 (store의 모델로 변환)
+        store: ClusterStore, 기사 묶음 저장소
+        similarity_threshold: float, 유사도 임계값
+    Returns:
+        ndarray: 기존 묶음에 배정된 기사면 True인 bool 배열
+    """
+    vectors = sparse.csr_matrix(vectors)
+    ids, sizes, centroids = store.load(keyword, vectors.shape[1])
+    assigned = np.full(vectors.shape[0], -1, dtype=np.int64)
+    if len(ids) and vectors.shape[0]:
+        similarities = (vectors @ centroids.T).toarray()
+        best = similarities.argmax(axis=1)
+        matched = similarities[np.arange(len(best)), best] > similarity_threshold
+        assigned[matched] = best[matched]
+
+    matched = np.flatnonzero(assigned >= 0)
+    if len(matched):
+        # 중심 벡터 = (기존 중심 × 기존 크기 + 새 기사 벡터의 합)의 방향
+        clusters = np.unique(assigned[matched])
+        membership = sparse.csr_matrix(
+            (np.ones(len(matched)), (np.searchsorted(clusters, assigned[matched]), matched)),
+            shape=(len(clusters), vectors.shape[0])
+        )
+        added = np.bincount(np.searchsorted(clusters, assigned[matched]), minlength=len(clusters))
+        totals = sparse.diags(sizes[clusters].astype(np.float64)) @ centroids[clusters] + membership @ vectors
+        store.update(ids[clusters], normalize(totals), sizes[clusters] + added, now=now)
+    return assigned >= 0
+
+
+def open_clusters(keyword, vectors, clusters, links, store, now=None):
+    """
+    이번 실행에서 만든 유사 그룹을 새 묶음으로 저장합니다.
+    Args:
+        keyword: str, 키워드
+        vectors: sparse matrix, 기사별 정규화된 TF-IDF 벡터
+        clusters: list, 유사 그룹별 기사 위치 배열 (vectors 행 번호)
+        links: list, vectors 행 순서의 기사 링크
+        store: ClusterStore, 기사 묶음 저장소
+    Returns:
+        int: 저장한 묶음 수
+    """
+    if not clusters:
+        return 0
+    vectors = sparse.csr_matrix(vectors)
+    members = np.concatenate(clusters).astype(np.int64)
+    sizes = np.array([len(cluster) for cluster in clusters], dtype=np.int64)
+    membership = sparse.csr_matrix(
+        (np.ones(len(members)), (np.repeat(np.arange(len(clusters)), sizes), members)),
+        shape=(len(clusters), vectors.shape[0])
+    )
+    return store.add(keyword, [links[cluster[0]] for cluster in clusters], normalize(membership @ vectors),
+                     sizes, now=now)
@@ -1,14 +1,18 @@
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
-import pandas as pd
+import argparse
 import os
 import json
-import requests
-from bs4 import BeautifulSoup
-import base64
-from datetime import datetime
 import logging
-import subprocess
+from functools import partial
+from article_cache import ArticleCache
+from article_store import DEFAULT_STORE_PATH, ArticleStore
+from extractor import extract_article
+from fetcher import DEFAULT_HEADERS, DEFAULT_MAX_WORKERS, DEFAULT_PER_HOST_LIMIT, DEFAULT_TIMEOUT, fetch_all, get_fetcher
+from metrics import DEFAULT_REPORT_PATH, StageTimer, increment, timed, write_report
+from pipeline_state import add_seen_links, get_retries, get_seen_links, load_state, save_state, update_retries
+from publishers import newspaper_from_url, newspapers_from_urls
+from shard_publisher import DEFAULT_SHARD_DIR, DirectoryTarget, GitDataTarget, publish_shards
+from sheet_reader import SheetReader, open_worksheet
+# shorten(pandas, sklearn)은 중복제거 단계에서만 import
 
 # 로깅 설정
 logging.basicConfig(
@@ -17,65 +21,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-print("1. 시작...")
-
-# 신문사 코드 매핑
-NEWSPAPER_CODES = {
-    '023': '조선일보',
-    '025': '중앙일보',
-    '020': '동아일보',
-    '032': '경향신문',
-    '028': '한겨레신문',
-    '469': '한국일보',
-    '009': '매일경제',
-    '015': '한국경제',
-    '011': '서울경제',
-    '277': '아주경제'
-}
-
-def get_google_sheets_data():
-    """구글 스프레드시트에서 데이터를 가져옵니다."""
+def get_google_sheets_data(worksheet=None, sheet_state=None):
+    """
+    구글 스프레드시트에서 필요한 열만 가져옵니다.
+    Args:
+        worksheet: 워크시트 (기본값: GOOGLE_CREDENTIALS로 연 Result 시트)
+        sheet_state: dict, 이전 실행의 시트 상태. 주어지면 마지막으로 읽은 행 다음부터 읽음
+    Returns:
+        tuple: (DataFrame (인덱스는 시트 행 번호), 새 시트 상태)
+    """
     try:
-        # 환경 변수에서 인증 정보 가져오기
-        credentials_json = os.environ.get('GOOGLE_CREDENTIALS')
-        if not credentials_json:
-            raise ValueError("GOOGLE_CREDENTIALS 환경 변수가 설정되지 않았습니다.")
-        
-        # 인증 정보를 임시 파일로 저장
-        with open('google_credentials.json', 'w') as f:
-            f.write(credentials_json)
-        
-        # 구글 API 인증
-        scope = [
-            "https://spreadsheets.google.com/feeds",
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive.file",
-            "https://www.googleapis.com/auth/drive"
-        ]
-        credentials = ServiceAccountCredentials.from_json_keyfile_name('google_credentials.json', scope)
-        client = gspread.authorize(credentials)
-        
-        # 스프레드시트 열기
-        spreadsheet = client.open_by_url('https://docs.google.com/spreadsheets/d/1HLTb59lcJQIZmaPMrJ0--hEsheyERIkCg5aBxSEFDtc/edit#gid=0')
-        worksheet = spreadsheet.worksheet("Result")
-        
-        # 모든 데이터 가져오기
-        data = worksheet.get_all_values()
-        
-        # 헤더와 데이터 분리
-        headers = data[0]
-        rows = data[1:]
-        
-        # 데이터프레임 생성
-        df = pd.DataFrame(rows, columns=headers)
+        worksheet = worksheet if worksheet is not None else open_worksheet()
+        df, sheet_state = SheetReader(worksheet).read(sheet_state)
         
         # 신문사 정보 추가
-        df['신문사'] = df['링크'].apply(extract_newspaper_from_url)
+        df['신문사'] = newspapers_from_urls(df['링크'])
         
         logger.info(f"스프레드시트에서 {len(df)}개의 행을 가져왔습니다.")
-        logger.info(f"헤더: {headers}")
-        
-        return df
+        return df, sheet_state
     
     except Exception as e:
         logger.error(f"구글 스프레드시트 데이터 가져오기 중 오류 발생: {str(e)}")
@@ -83,142 +46,285 @@ def get_google_sheets_data():
 
 def extract_newspaper_from_url(url):
     """URL에서 신문사 코드를 추출합니다."""
-    try:
-        if 'naver.com' in url:
-            # 네이버 뉴스 URL에서 신문사 코드 추출
-            code = url.split('/article/')[1].split('/')[0]
-            return NEWSPAPER_CODES.get(code, '기타')
-        return '기타'
-    except:
-        return '기타'
+    return newspaper_from_url(url)
 
-def crawl_article(url):
-    """기사 URL에서 내용을 크롤링합니다."""
+def extract_article_body(html, url=''):
+    """HTML에서 기사 본문 텍스트를 추출합니다."""
+    text, selector = extract_article(html, url)
+    if selector is None:
+        logger.warning(f"본문을 찾을 수 없습니다: {url}")
+        return ""
+    
+    logger.info(f"성공적으로 본문을 찾았습니다. 선택자: {selector}")
+    return text
+
+def crawl_article(url, session=None, cache=None):
+    """
+    기사 URL에서 내용을 크롤링합니다.
+    session은 fetcher.Fetcher(재시도, 호스트별 속도 제한, 서킷 브레이커) 또는 requests.Session이며,
+    없으면 프로세스 공용 Fetcher를 사용합니다.
+    """
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        # 캐시가 유효하면 네트워크 요청과 파싱을 모두 건너뜀
+        entry = cache.get(url) if cache is not None else None
+        if entry is not None and entry.is_fresh(cache.ttl):
+            cache.record('hit')
+            return entry.text
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # 다양한 뉴스 사이트에 대한 선택자
-        selectors = [
-            'div#dic_area',  # Naver 뉴스
-            'div.article-body',  # 일반적인 뉴스 사이트
-            'article',  # 일반적인 뉴스 사이트
-            'div.article-content',  # 일반적인 뉴스 사이트
-            'div.article-text',  # 일반적인 뉴스 사이트
-            'div#articleBody',  # 비즈니스포스트
-            'div#news_body_area',  # 비바100
-            'div#article-view-content-div',  # 뉴스프라임
-            'div.article_body',  # 딜사이트
-            'div#articeBody',  # 네이버 엔터테인먼트
-            'div.end_body',  # 네이버 엔터테인먼트 모바일
-            'div#newsEndContents',  # 네이버 스포츠
-            'div.article_txt',  # 추가 일반
-            'div#articleContent',  # 추가 일반
-            'div#newsContent',  # 추가 일반
-            'div.news_body',  # 추가 일반
-            'div#newsViewArea',  # 추가 일반
-            'div#content',  # 추가 일반
-            'div.article',  # 네이버 엔터테인먼트 추가
-            'div.article-content',  # 네이버 엔터테인먼트 추가
-            'div.article-body',  # 네이버 엔터테인먼트 추가
-        ]
-        
-        for selector in selectors:
-            article = soup.select_one(selector)
-            if article:
-                # 불필요한 요소 제거
-                for tag in article.select('script, style, iframe, .reporter_area, .copyright, .promotion'):
-                    tag.decompose()
-                
-                # 텍스트 정제
-                text = article.get_text(strip=True)
-                text = ' '.join(text.split())  # 연속된 공백 제거
-                
-                logger.info(f"성공적으로 본문을 찾았습니다. 선택자: {selector}")
-                return text
+        headers = dict(DEFAULT_HEADERS)
+        if entry is not None:
+            headers.update(entry.conditional_headers())
         
-        logger.warning(f"본문을 찾을 수 없습니다: {url}")
-        return ""
+        # 공유 세션이 있으면 커넥션 풀을 재사용
+        http = session if session is not None else get_fetcher()
+        with timed('crawl.fetch'):
+            response = http.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+        increment(f'crawl.status.{response.status_code}')
+        
+        # 변경되지 않은 기사는 캐시된 본문을 그대로 사용
+        if entry is not None and response.status_code == 304:
+            cache.touch(url)
+            cache.record('revalidated')
+            return entry.text
+        
+        response.raise_for_status()
+        with timed('crawl.parse'):
+            text = extract_article_body(response.text, url)
+        increment('crawl.bytes', len(response.content))
+        
+        if cache is not None:
+            cache.record('miss')
+            if text:
+                cache.put(url, text,
+                          etag=response.headers.get('ETag'),
+                          last_modified=response.headers.get('Last-Modified'))
+        return text
         
     except Exception as e:
+        increment('crawl.error')
         logger.error(f"기사 크롤링 중 오류 발생: {str(e)}")
         return ""
 
-def main():
+def crawl_articles(urls, max_workers=DEFAULT_MAX_WORKERS, per_host_limit=DEFAULT_PER_HOST_LIMIT, cache=None):
+    """여러 기사를 동시에 크롤링하고 입력 순서대로 본문을 반환합니다."""
+    logger.info(f"{len(urls)}개 기사 크롤링 시작 (동시 요청: {max_workers}, 호스트별: {per_host_limit})")
+    worker = partial(crawl_article, cache=cache)
+    return fetch_all(urls, worker, max_workers=max_workers, per_host_limit=per_host_limit)
+
+def load_cache():
+    """기사 캐시를 열고, 비어 있으면 기존 news_data.json의 본문으로 채웁니다."""
+    cache = ArticleCache()
+    if len(cache) == 0 and os.path.exists('news_data.json'):
+        try:
+            with open('news_data.json', 'r', encoding='utf-8') as f:
+                added = cache.seed(json.load(f), fetched_at=os.path.getmtime('news_data.json'))
+            logger.info(f"news_data.json에서 {added}개 본문을 캐시에 추가했습니다.")
+        except (OSError, ValueError) as e:
+            logger.warning(f"news_data.json으로 캐시를 채우지 못했습니다: {str(e)}")
+    return cache
+
+# 크롤링 결과 체크포인트 (shorten.py 단독 실행 시 입력)
+CHECKPOINT_FILE = 'temp_news_data.json'
+
+# 결과 기사에 포함하는 열
+ARTICLE_FIELDS = ['키워드', '발행일', '제목', '링크', '내용', '신문사']
+
+# 재시도 목록에 저장하는 시트 행의 열 (신문사 포함)
+RETRY_FIELDS = [field for field in ARTICLE_FIELDS if field != '내용']
+
+def add_retry_rows(df, retries):
+    """
+    재시도 목록의 행을 시트에서 새로 읽은 행 앞에 붙입니다. 새로 읽은 행과 링크가 같은 행은 붙이지 않습니다.
+    Args:
+        df: DataFrame, 시트에서 새로 읽은 행
+        retries: dict, pipeline_state.get_retries의 결과
+    """
+    new_links = set(df['링크'])
+    rows = [entry['row'] for link, entry in retries.items() if link not in new_links]
+    if not rows:
+        return df
+    import pandas as pd
+    return pd.concat([pd.DataFrame(rows, columns=RETRY_FIELDS), df], ignore_index=True)
+
+def crawl_rows(df):
+    """시트 행의 기사 본문을 크롤링해 기사 목록(dict)을 반환합니다."""
+    cache = load_cache()
+    try:
+        df = df.copy()
+        df['내용'] = crawl_articles(df['링크'].tolist(), cache=cache)
+        logger.info(cache.summary())
+    finally:
+        cache.close()
+    return df[ARTICLE_FIELDS].to_dict('records')
+
+def save_checkpoint(records, path=CHECKPOINT_FILE):
+    """
+    크롤링 결과를 체크포인트 파일로 저장합니다 (실패 시 shorten.py만 다시 실행할 수 있음).
+    경로가 .jsonl로 끝나면 한 줄에 기사 하나씩 씁니다 (shorten.py --stream 입력용).
+    """
+    with timed('write.checkpoint'), open(path, 'w', encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        else:
+            json.dump(records, f, ensure_ascii=False, indent=2)
+    increment('write.bytes', os.path.getsize(path))
+    logger.info(f"크롤링 결과를 {path}에 저장했습니다. 파일 크기: {os.path.getsize(path)} bytes")
+
+def main(incremental=False, checkpoint=None, store=None, worksheet=None, report=None, profile=None,
+         publish=None, publish_repo=None, **dedup_options):
+    """
+    크롤링 → 중복제거 → 저장을 한 프로세스에서 실행합니다. 기사는 메모리로 전달합니다.
+    Args:
+        incremental: bool, 이전 실행에서 처리하지 않은 새 행만 크롤링하고 기존 결과에 병합
+        checkpoint: str, 주어지면 크롤링 결과를 이 파일에도 저장
+        store: str, 주어지면 news_data.json에 새로 들어간 기사를 이 기사 저장소(article_store)의
+            오늘 파티션에도 추가
+        worksheet: 읽을 워크시트 (기본값: Result 시트)
+        report: str, 주어지면 단계별 시간, 카운터, 지연 시간 히스토그램을 이 파일(JSON)로 저장
+        profile: list, cProfile로 실행할 단계 이름 ('all'이면 모든 단계, 기본값: PROFILE_STAGES 환경 변수)
+        publish: str, 주어지면 news_data.json의 기사를 이 경로에 발행일별 샤드로 게시 (바뀐 샤드만 씀)
+        publish_repo: str, 주어지면 샤드와 news_data.json을 로컬 디렉터리 대신 이 저장소(owner/name)에
+            커밋 하나로 게시 (GITHUB_TOKEN 필요)
+        dedup_options: shorten.deduplicate_records 옵션 (clustering, lsh, history, workers 등)
+    Returns:
+        StageTimer: 단계별 소요 시간
+    """
+    timer = StageTimer(profile)
+    status = 'error'
+    counts = {}
     try:
-        # 구글 스프레드시트에서 데이터 가져오기
-        df = get_google_sheets_data()
+        # 구글 스프레드시트에서 데이터 가져오기 (증분 모드는 마지막으로 읽은 행 다음부터)
+        state = load_state() if incremental else {}
+        previous_sheet_state = state.get('sheet')
+        with timer.stage('시트 읽기'):
+            sheet_df, sheet_state = get_google_sheets_data(worksheet, previous_sheet_state if incremental else None)
+        
+        # 증분 모드: 이전 실행에서 처리한 링크는 제외하고, 이전 실행에서 실패한 행을 다시 시도
+        df = sheet_df
+        if incremental:
+            seen_links = get_seen_links(state)
+            df = df[~df['링크'].isin(seen_links)]
+            retries = get_retries(state)
+            logger.info(f"증분 모드: 이미 처리한 링크 {len(seen_links)}개, 새 행 {len(df)}개, "
+                        f"재시도할 행 {len(retries)}개")
+            df = add_retry_rows(df, retries)
+            if len(df) == 0:
+                logger.info("새로운 기사가 없습니다. 크롤링과 중복제거를 건너뜁니다.")
+                state['sheet'] = sheet_state
+                save_state(state)
+                status = 'skipped'
+                return timer
         
         # 기사 내용 크롤링
-        df['내용'] = df['링크'].apply(crawl_article)
-        
-        # 결과를 JSON 형식으로 변환
-        result = []
-        for _, row in df.iterrows():
-            article = {
-                '키워드': row['키워드'],
-                '발행일': row['발행일'],
-                '제목': row['제목'],
-                '링크': row['링크'],
-                '내용': row['내용'],
-                '신문사': row['신문사']
-            }
-            result.append(article)
-        
-        # 임시 파일로 저장
-        temp_file = 'temp_news_data.json'
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
-        
-        logger.info(f"크롤링 결과를 {temp_file}에 저장했습니다.")
-        
-        # 파일이 제대로 생성되었는지 확인
-        if not os.path.exists(temp_file):
-            raise FileNotFoundError(f"{temp_file} 파일이 생성되지 않았습니다.")
-        
-        file_size = os.path.getsize(temp_file)
-        if file_size == 0:
-            raise ValueError(f"{temp_file} 파일이 비어있습니다.")
-        
-        logger.info(f"임시 파일 크기: {file_size} bytes")
-        
-        # 파일 내용 확인
-        with open(temp_file, 'r', encoding='utf-8') as f:
-            content = f.read(500)
-            logger.info(f"파일 내용 시작 부분:\n{content}")
-        
-        # shorten.py 실행
+        with timer.stage('크롤링'):
+            records = crawl_rows(df)
+        counts['crawled'] = len(records)
+        
+        if checkpoint:
+            with timer.stage('체크포인트'):
+                save_checkpoint(records, checkpoint)
+        
+        # 증분 모드: 본문을 가져오지 못한 기사는 다음 실행에서 재시도하므로 이번 결과에 넣지 않음
+        # (빈 기사가 저장되면 재시도에 성공해도 같은 링크라 병합/저장소에서 제외됨)
+        dedup_records = records
+        if incremental:
+            dedup_records = [record for record in records if record['내용'] != '']
+            if len(dedup_records) < len(records):
+                logger.info(f"본문을 가져오지 못한 기사 {len(records) - len(dedup_records)}개는 "
+                            f"다음 실행에서 재시도하므로 중복제거에서 제외합니다.")
+        
+        # 중복제거 (같은 프로세스에서 메모리로 전달)
         logger.info("중복 제거를 시작합니다...")
-        try:
-            result = subprocess.run(['python', 'shorten.py'], check=True, capture_output=True, text=True)
-            logger.info(f"shorten.py 실행 결과: {result.stdout}")
-            if result.stderr:
-                logger.error(f"shorten.py 실행 중 오류: {result.stderr}")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"shorten.py 실행 실패: {str(e)}")
-            logger.error(f"오류 출력: {e.stderr}")
-            raise
-        
-        # 최종 파일 확인
-        if os.path.exists('news_data.json'):
-            final_size = os.path.getsize('news_data.json')
-            logger.info(f"최종 파일 크기: {final_size} bytes")
-            
-            # 파일 내용 확인
-            with open('news_data.json', 'r', encoding='utf-8') as f:
-                content = f.read(500)
-                logger.info(f"최종 파일 내용 시작 부분:\n{content}")
-        else:
-            raise FileNotFoundError("최종 news_data.json 파일이 생성되지 않았습니다.")
+        with timer.stage('중복제거'):
+            import shorten
+            deduplicated_rows = shorten.deduplicate_records(dedup_records, incremental=incremental,
+                                                            **dedup_options)
+        
+        with timer.stage('저장'):
+            written = shorten.write_articles(deduplicated_rows, shorten.OUTPUT_FILE, incremental=incremental)
+        counts['deduplicated'] = len(deduplicated_rows)
+        counts['written'] = len(written)
+        
+        # news_data.json과 같은 기사를 유지 (저장소에 없는 기사만 덧붙음)
+        if store:
+            with timer.stage('저장소'):
+                ArticleStore(store).append(written)
+        
+        # 바뀐 발행일 샤드와 manifest만 게시
+        # (저장소에 올릴 때는 news_data.json도 같은 커밋에 올림: 샤드로 옮기는 동안 기존 URL 유지)
+        if publish:
+            with timer.stage('게시'):
+                files = None
+                if publish_repo:
+                    target = GitDataTarget(publish_repo, os.environ['GITHUB_TOKEN'])
+                    with open(shorten.OUTPUT_FILE, 'rb') as f:
+                        files = {shorten.OUTPUT_FILE: f.read()}
+                else:
+                    target = DirectoryTarget()
+                counts['published_shards'] = publish_shards(written, target, publish, files=files)['uploaded']
+        
+        # 본문을 가져온 링크만 처리 완료로 기록하고, 실패한 행은 재시도 목록에 남김
+        # (시트 위치는 그대로 진행하므로 계속 실패하는 링크가 있어도 이후 행을 다시 읽지 않음)
+        if incremental:
+            crawled_links = [record['링크'] for record in records if record['내용'] != '']
+            failed_rows = [{field: record[field] for field in RETRY_FIELDS}
+                           for record in records if record['내용'] == '']
+            state['sheet'] = sheet_state
+            state, abandoned = update_retries(add_seen_links(state, crawled_links), failed_rows)
+            save_state(state)
+            logger.info(f"처리한 링크 {len(crawled_links)}개를 상태 파일에 기록했습니다. "
+                        f"재시도할 행: {len(state['retries'])}개")
+            if abandoned:
+                increment('crawl.abandoned', len(abandoned))
+                logger.warning(f"여러 번 실패한 링크 {len(abandoned)}개는 더 이상 재시도하지 않습니다: {abandoned}")
+        
+        logger.info(timer.summary())
+        status = 'ok'
+        return timer
         
     except Exception as e:
         logger.error(f"프로그램 실행 중 오류 발생: {str(e)}")
         raise
+    finally:
+        if report:
+            write_report(report, timer, command='crawler', status=status, incremental=incremental, **counts)
 
 if __name__ == "__main__":
-    main() 
+    parser = argparse.ArgumentParser(description='뉴스 기사 크롤링')
+    parser.add_argument('--incremental', action='store_true',
+                        help='이전 실행에서 처리하지 않은 새 행만 크롤링하고 기존 결과에 병합')
+    parser.add_argument('--checkpoint', nargs='?', const=CHECKPOINT_FILE, default=None,
+                        help=f'크롤링 결과를 파일로도 저장 (경로 생략 시 {CHECKPOINT_FILE})')
+    parser.add_argument('--store', nargs='?', const=DEFAULT_STORE_PATH, default=None,
+                        help=f'news_data.json에 새로 들어간 기사를 날짜별 기사 저장소에도 추가 (경로 생략 시 {DEFAULT_STORE_PATH})')
+    parser.add_argument('--publish', nargs='?', const=DEFAULT_SHARD_DIR, default=None,
+                        help=f'news_data.json의 기사를 발행일별 샤드와 manifest로 게시, 바뀐 샤드만 씀 '
+                             f'(경로 생략 시 {DEFAULT_SHARD_DIR})')
+    parser.add_argument('--publish-repo', metavar='OWNER/NAME',
+                        help='--publish의 샤드와 news_data.json을 로컬 대신 이 저장소에 커밋 하나로 올림 '
+                             '(GITHUB_TOKEN 필요)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='키워드별 그룹화에 사용할 프로세스 수 (0이면 CPU 수, 기본값: 1)')
+    parser.add_argument('--window-days', type=int, default=None, metavar='DAYS',
+                        help='중복제거 시 발행일 차이가 DAYS일 이하인 기사끼리만 비교 (기본값: 같은 키워드의 모든 기사 비교)')
+    parser.add_argument('--lsh', action='store_true',
+                        help='MinHash LSH 후보 쌍만 정확한 유사도로 비교 (대규모 키워드용 근사)')
+    parser.add_argument('--history', action='store_true',
+                        help='과거 실행의 기사와 중복인 새 기사를 제외 (--incremental 필요)')
+    parser.add_argument('--clusters', action='store_true',
+                        help='이전 실행의 기사 묶음(키워드별 중심 벡터)에 속하는 새 기사를 제외하고 '
+                             '이번 유사 그룹을 묶음으로 저장 (--incremental 필요)')
+    parser.add_argument('--report', default=DEFAULT_REPORT_PATH,
+                        help=f'단계별 시간과 지표를 저장할 실행 보고서 경로 (기본값: {DEFAULT_REPORT_PATH}, 빈 값이면 저장하지 않음)')
+    parser.add_argument('--profile', action='append', default=None, metavar='STAGE',
+                        help='cProfile로 실행할 단계 (예: 크롤링, 중복제거. 여러 번 지정 가능, all이면 모든 단계)')
+    args = parser.parse_args()
+    if args.publish_repo and not os.getenv('GITHUB_TOKEN'):
+        parser.error('--publish-repo에는 GITHUB_TOKEN 환경 변수가 필요합니다.')
+    # --publish-repo만 주면 기본 샤드 경로에 올림
+    publish = args.publish or (DEFAULT_SHARD_DIR if args.publish_repo else None)
+    main(incremental=args.incremental, checkpoint=args.checkpoint, store=args.store,
+         report=args.report, profile=args.profile, workers=args.workers or os.cpu_count(),
+         window_days=args.window_days, publish=publish, publish_repo=args.publish_repo,
+         lsh=args.lsh, history=args.history, clusters=args.clusters)
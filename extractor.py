@@ -0,0 +1,287 @@
+import logging
+import os
+import threading
+from urllib.parse import urlsplit
+
+import metrics
+from streaming_extractor import longest_text_block, stream_extract
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 본문에서 제거할 요소
+REMOVE_SELECTOR = 'script, style, iframe, .reporter_area, .copyright, .promotion'
+
+# 도메인을 모르는 사이트에 차례로 시도하는 일반 선택자 (중복 제거, 기존 순서 유지)
+GENERIC_SELECTORS = [
+    'div#dic_area',  # Naver 뉴스
+    'div.article-body',  # 일반적인 뉴스 사이트
+    'article',  # 일반적인 뉴스 사이트
+    'div.article-content',  # 일반적인 뉴스 사이트
+    'div.article-text',  # 일반적인 뉴스 사이트
+    'div#articleBody',  # 비즈니스포스트
+    'div#news_body_area',  # 비바100
+    'div#article-view-content-div',  # 뉴스프라임
+    'div.article_body',  # 딜사이트
+    'div#articeBody',  # 네이버 엔터테인먼트
+    'div.end_body',  # 네이버 엔터테인먼트 모바일
+    'div#newsEndContents',  # 네이버 스포츠
+    'div.article_txt',  # 추가 일반
+    'div#articleContent',  # 추가 일반
+    'div#newsContent',  # 추가 일반
+    'div.news_body',  # 추가 일반
+    'div#newsViewArea',  # 추가 일반
+    'div#content',  # 추가 일반
+    'div.article',  # 네이버 엔터테인먼트 추가
+]
+
+# 호스트 → 본문 선택자 (하위 도메인은 상위 도메인 항목을 사용)
+DOMAIN_SELECTORS = {
+    'n.news.naver.com': '#dic_area',  # 네이버 뉴스 (div/article 모두)
+    'news.naver.com': '#dic_area',
+    'm.news.naver.com': '#dic_area',
+    'entertain.naver.com': 'div#articeBody',  # 네이버 엔터테인먼트
+    'sports.news.naver.com': 'div#newsEndContents',  # 네이버 스포츠
+    'businesspost.co.kr': 'div#articleBody',  # 비즈니스포스트
+    'viva100.com': 'div#news_body_area',  # 비바100
+    'newsprime.co.kr': 'div#article-view-content-div',  # 뉴스프라임
+    'dealsite.co.kr': 'div.article_body',  # 딜사이트
+}
+
+# 파서 백엔드 (bs4, lxml, selectolax)
+DEFAULT_BACKEND = os.environ.get('EXTRACTOR_BACKEND', 'bs4')
+
+# 도메인/학습된 선택자를 트리 없이 스트리밍으로 먼저 추출 (lxml 필요)
+DEFAULT_STREAMING = os.environ.get('EXTRACTOR_STREAMING', '') == '1'
+
+
+def clean_text(text):
+    """연속된 공백을 하나로 줄입니다."""
+    return ' '.join(text.split())
+
+
+class Bs4Backend:
+    """BeautifulSoup(html.parser) 백엔드"""
+
+    name = 'bs4'
+
+    def parse(self, html):
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(html, 'html.parser')
+
+    def select_one(self, doc, selector):
+        return doc.select_one(selector)
+
+    def text(self, node):
+        for tag in node.select(REMOVE_SELECTOR):
+            tag.decompose()
+        return node.get_text(strip=True)
+
+
+class LxmlBackend:
+    """lxml + cssselect 백엔드 (선택자를 XPath로 한 번만 컴파일)"""
+
+    name = 'lxml'
+
+    def __init__(self):
+        import lxml.html
+        from lxml.cssselect import CSSSelector
+        self._lxml_html = lxml.html
+        self._css_selector = CSSSelector
+        self._compiled = {}
+        self._remove = CSSSelector(REMOVE_SELECTOR)
+        self._parser = lxml.html.HTMLParser(encoding='utf-8')
+
+    def _compile(self, selector):
+        compiled = self._compiled.get(selector)
+        if compiled is None:
+            compiled = self._compiled[selector] = self._css_selector(selector)
+        return compiled
+
+    def parse(self, html):
+        return self._lxml_html.document_fromstring(html.encode('utf-8'), parser=self._parser)
+
+    def select_one(self, doc, selector):
+        found = self._compile(selector)(doc)
+        return found[0] if found else None
+
+    def text(self, node):
+        # drop_tree는 뒤따르는 텍스트(tail)를 보존하므로 decompose와 같은 결과
+        for tag in self._remove(node):
+            tag.drop_tree()
+        for comment in node.xpath('.//comment()'):
+            comment.drop_tree()
+        return ''.join(part.strip() for part in node.itertext())
+
+
+class SelectolaxBackend:
+    """selectolax(lexbor) 백엔드"""
+
+    name = 'selectolax'
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+        self._parser = LexborHTMLParser
+
+    def parse(self, html):
+        return self._parser(html)
+
+    def select_one(self, doc, selector):
+        return doc.css_first(selector)
+
+    def text(self, node):
+        for tag in node.css(REMOVE_SELECTOR):
+            tag.decompose()
+        return node.text(deep=True, separator='', strip=True)
+
+
+BACKENDS = {
+    'bs4': Bs4Backend,
+    'lxml': LxmlBackend,
+    'selectolax': SelectolaxBackend,
+}
+
+
+def get_backend(name=DEFAULT_BACKEND):
+    """이름에 해당하는 파서 백엔드를 생성합니다. 설치되지 않은 경우 bs4를 사용합니다."""
+    if name not in BACKENDS:
+        raise ValueError(f"지원하지 않는 파서 백엔드입니다: {name}")
+    try:
+        return BACKENDS[name]()
+    except ImportError as e:
+        logger.warning(f"{name} 백엔드를 사용할 수 없어 bs4를 사용합니다: {str(e)}")
+        return Bs4Backend()
+
+
+class ExtractorRegistry:
+    """
+    호스트별 본문 선택자를 관리하는 추출기입니다.
+    등록된 도메인은 해당 선택자를 먼저 시도하고, 모르는 도메인은 일반 선택자를 항상 같은 순서로 시도합니다.
+    모르는 도메인에서 성공한 선택자는 호스트별로 기억해 다음 페이지를 스트리밍으로 먼저 추출하되,
+    그보다 앞선 일반 선택자에 일치하는 요소가 있으면 쓰지 않으므로 결과는 선택자 순서대로 시도한 것과 같습니다.
+    Args:
+        backend: str, 파서 백엔드 이름
+        domain_selectors: dict, 호스트 → 선택자 (기본값: DOMAIN_SELECTORS)
+        generic_selectors: list, 일반 선택자 목록 (기본값: GENERIC_SELECTORS)
+        streaming: bool, 등록/학습된 선택자를 스트리밍 파서로 먼저 추출할지 여부
+    """
+
+    def __init__(self, backend=DEFAULT_BACKEND, domain_selectors=None, generic_selectors=None,
+                 streaming=DEFAULT_STREAMING):
+        self.backend = get_backend(backend)
+        self.streaming = streaming and _streaming_available()
+        self.domain_selectors = dict(DOMAIN_SELECTORS if domain_selectors is None else domain_selectors)
+        self.generic_selectors = list(GENERIC_SELECTORS if generic_selectors is None else generic_selectors)
+        self.learned = {}
+        self.selector_hits = {}
+        self._lock = threading.Lock()
+
+    def domain_selector(self, host):
+        """호스트(또는 상위 도메인)에 등록된 선택자를 반환합니다."""
+        parts = host.split('.')
+        for i in range(len(parts) - 1):
+            selector = self.domain_selectors.get('.'.join(parts[i:]))
+            if selector:
+                return selector
+        return None
+
+    def lookup(self, host):
+        """등록된 선택자, 없으면 학습된 선택자를 반환합니다."""
+        return self.domain_selector(host) or self.learned.get(host)
+
+    def candidates(self, host, skip=None):
+        """시도할 선택자 목록 (등록된 선택자 먼저, 이후 일반 선택자 순서대로)"""
+        preferred = self.domain_selector(host)
+        if preferred is None or preferred == skip:
+            return [s for s in self.generic_selectors if s != skip]
+        return [preferred] + [s for s in self.generic_selectors if s != preferred]
+
+    def extract(self, html, url=''):
+        """
+        HTML에서 기사 본문을 추출합니다.
+        Args:
+            html: str, 페이지 HTML
+            url: str, 페이지 URL (도메인 선택자 조회용)
+        Returns:
+            tuple: (본문 텍스트, 사용한 선택자). 본문을 찾지 못하면 (None, None)
+        """
+        host = (urlsplit(url).hostname or '') if url else ''
+
+        # 선택자를 알고 있으면 트리를 만들지 않고 읽음 (학습된 선택자는 앞선 일반 선택자가 없는지도 확인)
+        streamed = None
+        if self.streaming:
+            registered = self.domain_selector(host)
+            selector = registered or self.learned.get(host)
+            if selector is not None:
+                earlier = [] if registered else self.generic_selectors[:self.generic_selectors.index(selector)]
+                try:
+                    text = stream_extract(html, selector, unless=earlier)
+                except ValueError:
+                    text = None
+                else:
+                    # 등록된 선택자가 없는 것을 확인했으면 트리에서 다시 시도하지 않음
+                    streamed = selector if registered else None
+                if text is not None:
+                    metrics.increment('extract.streamed')
+                    self._record(host, selector)
+                    return clean_text(text), selector
+
+        doc = self.backend.parse(html)
+        for selector in self.candidates(host, skip=streamed):
+            node = self.backend.select_one(doc, selector)
+            if node is not None:
+                text = clean_text(self.backend.text(node))
+                self._record(host, selector)
+                return text, selector
+        metrics.increment('extract.no_match')
+        return None, None
+
+    def _record(self, host, selector):
+        with self._lock:
+            self.selector_hits[selector] = self.selector_hits.get(selector, 0) + 1
+            metrics.increment(f'extract.selector.{selector}')
+            # 등록되지 않은 호스트만 마지막으로 성공한 선택자를 기억 (스트리밍 힌트로만 사용)
+            if host and self.domain_selector(host) is None:
+                self.learned[host] = selector
+
+
+_default_registry = None
+_default_lock = threading.Lock()
+
+
+def get_registry():
+    """프로세스 공용 추출기를 반환합니다."""
+    global _default_registry
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = ExtractorRegistry()
+        return _default_registry
+
+
+def extract_article(html, url=''):
+    """공용 추출기로 HTML에서 (본문, 선택자)를 추출합니다."""
+    return get_registry().extract(html, url)
+
+
+def _streaming_available():
+    try:
+        import lxml.etree  # noqa: F401
+        return True
+    except ImportError:
+        logger.warning("lxml이 설치되지 않아 스트리밍 추출을 사용하지 않습니다.")
+        return False
+
+
+def extract_longest_block(html):
+    """
+    본문 선택자가 모두 실패했을 때, 텍스트가 가장 긴 p/div 요소의 텍스트를 반환합니다.
+    lxml이 있으면 전체 트리를 만들지 않고 스트리밍으로 계산합니다.
+    """
+    if _streaming_available():
+        return longest_text_block(html) or ''
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    paragraphs = soup.find_all(['p', 'div'])
+    if not paragraphs:
+        return ''
+    return max(paragraphs, key=lambda p: len(p.get_text(strip=True))).get_text(strip=True)
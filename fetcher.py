@@ -0,0 +1,326 @@
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import metrics
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# 전체 동시 요청 수와 호스트별 동시 요청 수
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_PER_HOST_LIMIT = 8
+
+# (연결, 읽기) 타임아웃(초): 연결은 빨리 포기하고 큰 페이지는 읽을 시간을 줌
+DEFAULT_TIMEOUT = (5, 15)
+
+# 다시 시도할 응답 상태와 재시도 횟수 (첫 요청 제외)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_RETRIES = 3
+
+# 지수 백오프: 0 ~ min(BACKOFF_MAX, BACKOFF_BASE * 2^시도) 사이에서 무작위로 대기 (full jitter)
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30
+
+# 호스트별 초당 요청 수와 버스트 크기 (0이면 제한 없음)
+DEFAULT_RATE_PER_HOST = float(os.environ.get('FETCH_RATE_PER_HOST', '10'))
+DEFAULT_BURST = 10
+
+# 연속 실패가 이 횟수에 이르면 호스트 요청을 COOLDOWN초 동안 바로 실패 처리
+FAILURE_THRESHOLD = 5
+COOLDOWN = 60
+
+
+def create_session(pool_maxsize=DEFAULT_MAX_WORKERS):
+    """커넥션 풀을 공유하는 requests 세션을 생성합니다."""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_host(url):
+    """URL에서 호스트(포트 포함)를 추출합니다."""
+    try:
+        return urlsplit(url).netloc.lower()
+    except ValueError:
+        return ''
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수를 제한합니다."""
+
+    def __init__(self, per_host_limit=DEFAULT_PER_HOST_LIMIT):
+        self.per_host_limit = per_host_limit
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        """URL의 호스트에 해당하는 세마포어를 반환합니다."""
+        host = get_host(url)
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+
+class CircuitOpenError(requests.RequestException):
+    """연속 실패로 차단된 호스트에 요청하려 할 때 발생합니다."""
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 채워지는 토큰 버킷입니다. 토큰이 없으면 채워질 때까지 기다립니다.
+    Args:
+        rate: float, 초당 토큰 수
+        burst: int, 버킷 크기 (한 번에 보낼 수 있는 최대 요청 수)
+    """
+
+    def __init__(self, rate, burst=DEFAULT_BURST, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 하나를 가져옵니다. Returns: float, 기다린 시간(초)"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+class CircuitBreaker:
+    """
+    호스트별 연속 실패 수(재시도 후에도 실패한 요청)를 세어, threshold번 연속 실패한 호스트는
+    cooldown초 동안 요청하지 않습니다.
+    cooldown이 지나면 요청 하나만 시험으로 보내고, 성공하면 다시 열고 실패하면 cooldown을 다시 시작합니다.
+    """
+
+    def __init__(self, threshold=FAILURE_THRESHOLD, cooldown=COOLDOWN, clock=time.monotonic):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self._failures = {}
+        self._opened_at = {}
+        self._trial = set()
+        self._lock = threading.Lock()
+
+    def allow(self, host):
+        """요청을 보내도 되는지 확인합니다."""
+        return self.acquire(host) is not None
+
+    def acquire(self, host):
+        """
+        요청을 보내도 되는지 확인합니다. 시험 요청이면 호출한 쪽이 success/failure로 결과를 알려야 합니다.
+        Returns:
+            bool: 시험 요청이면 True, 일반 요청이면 False (보내면 안 되면 None)
+        """
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return False
+            if self._clock() - opened_at < self.cooldown or host in self._trial:
+                return None
+            self._trial.add(host)
+            return True
+
+    def success(self, host):
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+            self._trial.discard(host)
+
+    def failure(self, host):
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if failures >= self.threshold or host in self._trial:
+                if host not in self._opened_at or host in self._trial:
+                    logger.warning(f"{host}: 연속 {failures}회 실패로 {self.cooldown}초 동안 요청을 중단합니다.")
+                self._opened_at[host] = self._clock()
+                self._trial.discard(host)
+
+
+def backoff_delay(attempt, response=None, base=BACKOFF_BASE, maximum=BACKOFF_MAX):
+    """
+    재시도 전 대기 시간(초). 응답에 Retry-After가 있으면 그 값을, 없으면 full jitter 지수 백오프를 사용합니다.
+    """
+    if response is not None:
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return min(maximum, max(0.0, float(retry_after)))
+            except ValueError:
+                try:
+                    return min(maximum, max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time()))
+                except (TypeError, ValueError):
+                    pass
+    return random.uniform(0, min(maximum, base * 2 ** attempt))
+
+
+class Fetcher:
+    """
+    커넥션 풀 세션 위에 재시도, 호스트별 요청 속도 제한, 서킷 브레이커를 더한 HTTP 클라이언트입니다.
+    get은 requests.Session.get처럼 응답을 반환하며, 재시도 후에도 429/5xx이면 마지막 응답을 반환합니다.
+    Args:
+        session: requests.Session (없으면 새로 생성)
+        timeout: tuple, (연결, 읽기) 타임아웃(초)
+        retries: int, 429/5xx/연결 오류 시 재시도 횟수
+        rate_per_host: float, 호스트별 초당 요청 수 (0이면 제한 없음)
+        burst: int, 호스트별 버스트 크기
+        breaker: CircuitBreaker (없으면 기본값으로 생성)
+        backoff_base: float, 지수 백오프의 첫 대기 상한(초)
+    """
+
+    def __init__(self, session=None, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+                 rate_per_host=DEFAULT_RATE_PER_HOST, burst=DEFAULT_BURST, breaker=None,
+                 backoff_base=BACKOFF_BASE, sleep=time.sleep):
+        self.session = session if session is not None else create_session()
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.rate_per_host = rate_per_host
+        self.burst = burst
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        self._sleep = sleep
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate_per_host, self.burst, sleep=self._sleep)
+            return bucket
+
+    def get(self, url, headers=None, timeout=None):
+        """
+        URL을 요청합니다.
+        Raises:
+            CircuitOpenError: 호스트가 연속 실패로 차단된 경우
+            requests.RequestException: 재시도 후에도 연결/타임아웃 오류가 난 경우
+        """
+        host = get_host(url)
+        timeout = timeout if timeout is not None else self.timeout
+        # 시험 요청은 이 호출의 재시도까지 포함하며, 결과를 알리지 못하고 끝나면 실패로 처리
+        trial = False
+        settled = False
+        try:
+            for attempt in range(self.retries + 1):
+                if not trial:
+                    trial = self.breaker.acquire(host)
+                    if trial is None:
+                        metrics.increment('fetch.circuit_open')
+                        raise CircuitOpenError(f"연속 실패로 요청을 중단한 호스트입니다: {host}")
+                if self.rate_per_host > 0:
+                    waited = self._bucket(host).acquire()
+                    if waited:
+                        metrics.observe('fetch.rate_wait', waited)
+
+                # 재시도로 복구되는 일시적 오류는 서킷 브레이커의 실패로 세지 않음
+                try:
+                    response = self.session.get(url, headers=headers, timeout=timeout)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    if attempt == self.retries:
+                        settled = True
+                        self.breaker.failure(host)
+                        raise
+                    response, error = None, e
+                else:
+                    if response.status_code not in RETRY_STATUSES:
+                        settled = True
+                        self.breaker.success(host)
+                        return response
+                    if attempt == self.retries:
+                        settled = True
+                        self.breaker.failure(host)
+                        return response
+                    error = f"HTTP {response.status_code}"
+
+                delay = backoff_delay(attempt, response, base=self.backoff_base)
+                metrics.increment('fetch.retry')
+                logger.info(f"요청 재시도 {attempt + 1}/{self.retries} ({delay:.1f}초 후): {url} - {error}")
+                self._sleep(delay)
+        finally:
+            if trial and not settled:
+                self.breaker.failure(host)
+
+    def close(self):
+        self.session.close()
+
+
+_default_fetcher = None
+_default_lock = threading.Lock()
+
+
+def get_fetcher():
+    """프로세스 공용 Fetcher를 반환합니다 (단건 요청용)."""
+    global _default_fetcher
+    with _default_lock:
+        if _default_fetcher is None:
+            _default_fetcher = Fetcher()
+        return _default_fetcher
+
+
+def fetch_all(urls, worker, max_workers=DEFAULT_MAX_WORKERS,
+              per_host_limit=DEFAULT_PER_HOST_LIMIT, session=None):
+    """
+    URL 목록을 제한된 동시성으로 처리합니다.
+    Args:
+        urls: list, 처리할 URL 목록
+        worker: callable, worker(url, fetcher) 형태의 처리 함수 (fetcher.get으로 요청)
+        max_workers: int, 전체 동시 요청 수
+        per_host_limit: int, 호스트별 동시 요청 수
+        session: requests.Session, 공유 세션 (없으면 새로 생성)
+    Returns:
+        list: 입력 순서와 같은 순서의 처리 결과
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+
+    own_session = session is None
+    if own_session:
+        session = create_session(pool_maxsize=max_workers)
+    limiter = HostLimiter(per_host_limit)
+    fetcher = Fetcher(session)
+
+    def run(url):
+        with limiter.get(url):
+            return worker(url, fetcher)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # executor.map은 입력 순서대로 결과를 돌려줍니다
+            return list(executor.map(run, urls))
+    finally:
+        if own_session:
+            session.close()
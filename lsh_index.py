@@ -0,0 +1,182 @@
+import logging
+import os
+import sqlite3
+import zlib
+
+import numpy as np
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = os.path.join('.cache', 'lsh_index.sqlite3')
+
+# 한국어는 형태소 분석 없이 문자 단위 shingle을 사용
+SHINGLE_SIZE = 4
+NUM_PERM = 126
+NUM_BANDS = 42  # 밴드당 3행: 자카드 유사도 약 0.29부터 후보가 될 확률이 절반을 넘음
+
+# shingle 해시를 32비트로 줄일 때 사용하는 소수 (2^32보다 작은 가장 큰 소수)
+_PRIME = 4294967291
+
+
+class MinHasher:
+    """
+    문자 shingle 집합의 MinHash 시그니처를 계산합니다.
+    Args:
+        num_perm: int, 해시 함수(순열) 수
+        shingle_size: int, shingle 길이(문자 수)
+        seed: int, 해시 함수 계수의 난수 시드 (같은 인덱스에는 같은 값을 사용해야 함)
+    """
+
+    def __init__(self, num_perm=NUM_PERM, shingle_size=SHINGLE_SIZE, seed=1):
+        rnd = np.random.RandomState(seed)
+        # multiply-shift 해시: ((a * x + b) mod 2^64) >> 32, a는 홀수
+        self.a = rnd.randint(0, 2 ** 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self.b = rnd.randint(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+
+    def shingles(self, text):
+        """전처리된 텍스트의 shingle 해시 배열 (문자 코드에 대한 다항식 롤링 해시, 중복 제거)"""
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+        k = min(self.shingle_size, len(codes))
+        if k == 0:
+            return np.zeros(0, dtype=np.uint64)
+        count = len(codes) - k + 1
+        hashes = np.zeros(count, dtype=np.uint64)
+        for offset in range(k):
+            # uint64 범위에서 자연스럽게 넘치는 곱셈을 해시로 사용
+            hashes = hashes * np.uint64(1000003) + codes[offset:offset + count]
+        return np.unique(hashes % np.uint64(_PRIME))
+
+    def signature(self, text):
+        """
+        MinHash 시그니처를 계산합니다.
+        Returns:
+            ndarray: uint32 (num_perm,) 배열. 빈 텍스트이면 None
+        """
+        hashes = self.shingles(text)
+        if len(hashes) == 0:
+            return None
+        values = (self.a[:, None] * hashes[None, :] + self.b[:, None]) >> np.uint64(32)
+        return values.min(axis=1).astype(np.uint32)
+
+
+def band_keys(signature, num_bands=NUM_BANDS):
+    """시그니처를 밴드로 나누어 밴드별 버킷 키(밴드 번호 포함)를 반환합니다."""
+    rows = len(signature) // num_bands
+    keys = []
+    for band in range(num_bands):
+        chunk = signature[band * rows:(band + 1) * rows].tobytes()
+        keys.append((band << 32) | zlib.crc32(chunk))
+    return keys
+
+
+def candidate_pairs(signatures, num_bands=NUM_BANDS):
+    """
+    같은 밴드 버킷에 들어간 기사 쌍을 후보로 반환합니다.
+    Args:
+        signatures: list, 기사별 시그니처 (None이면 후보에서 제외)
+    Returns:
+        tuple: (i 배열, j 배열), i < j
+    """
+    buckets = {}
+    for i, signature in enumerate(signatures):
+        if signature is None:
+            continue
+        for key in band_keys(signature, num_bands):
+            buckets.setdefault(key, []).append(i)
+
+    pairs = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                pairs.add((members[x], members[y]))
+
+    if not pairs:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    pairs = np.array(sorted(pairs), dtype=np.int64)
+    return pairs[:, 0], pairs[:, 1]
+
+
+class LshIndex:
+    """
+    실행 간에 유지되는 키워드별 MinHash LSH 인덱스 (SQLite)입니다.
+    과거 기사의 밴드 버킷을 저장해 새 기사와 비슷한 과거 기사를 전체 비교 없이 찾습니다.
+    Args:
+        path: str, SQLite 파일 경로
+        num_bands: int, 밴드 수
+        hasher: MinHasher, 시그니처 계산기
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH, num_bands=NUM_BANDS, hasher=None):
+        self.path = path
+        self.num_bands = num_bands
+        self.hasher = hasher or MinHasher()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            '''CREATE TABLE IF NOT EXISTS docs (
+                id INTEGER PRIMARY KEY,
+                keyword TEXT NOT NULL,
+                link TEXT NOT NULL,
+                text TEXT NOT NULL,
+                UNIQUE (keyword, link)
+            );
+            CREATE TABLE IF NOT EXISTS buckets (
+                keyword TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                doc_id INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_buckets ON buckets(keyword, bucket);'''
+        )
+        self._conn.commit()
+
+    def add(self, keyword, link, text, signature=None):
+        """기사를 인덱스에 추가합니다. 이미 있으면 건너뜁니다."""
+        signature = self.hasher.signature(text) if signature is None else signature
+        if signature is None:
+            return False
+        cursor = self._conn.execute(
+            'INSERT OR IGNORE INTO docs (keyword, link, text) VALUES (?, ?, ?)', (keyword, link, text)
+        )
+        if cursor.rowcount == 0:
+            return False
+        doc_id = cursor.lastrowid
+        self._conn.executemany(
+            'INSERT INTO buckets VALUES (?, ?, ?)',
+            [(keyword, key, doc_id) for key in band_keys(signature, self.num_bands)]
+        )
+        return True
+
+    def query(self, keyword, signature):
+        """
+        같은 밴드 버킷을 공유하는 과거 기사를 반환합니다.
+        Returns:
+            list: (link, text) 목록
+        """
+        if signature is None:
+            return []
+        keys = band_keys(signature, self.num_bands)
+        placeholders = ','.join('?' * len(keys))
+        return self._conn.execute(
+            f'''SELECT link, text FROM docs WHERE id IN (
+                SELECT DISTINCT doc_id FROM buckets WHERE keyword = ? AND bucket IN ({placeholders}))''',
+            [keyword] + keys
+        ).fetchall()
+
+    def __len__(self):
+        return self._conn.execute('SELECT COUNT(*) FROM docs').fetchone()[0]
+
+    def commit(self):
+        self._conn.commit()
+
+    def close(self):
+        self._conn.commit()
+        self._conn.close()
@@ -0,0 +1,261 @@
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPORT_PATH = os.path.join('.cache', 'run_report.json')
+DEFAULT_PROFILE_DIR = os.path.join('.cache', 'profile')
+
+# 지연 시간 히스토그램 구간 상한(초). 마지막 구간은 그보다 긴 값
+LATENCY_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 30, 60)
+
+# 프로파일할 단계 (쉼표로 구분, 'all'이면 모든 단계)
+PROFILE_STAGES_ENV = 'PROFILE_STAGES'
+
+
+class Histogram:
+    """고정 구간 지연 시간 히스토그램 (프로세스 간 합칠 수 있음)"""
+
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        index = 0
+        while index < len(LATENCY_BUCKETS) and value > LATENCY_BUCKETS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, raw):
+        """snapshot()으로 얻은 다른 히스토그램을 더합니다."""
+        if not raw['count']:
+            return
+        self.counts = [a + b for a, b in zip(self.counts, raw['counts'])]
+        self.count += raw['count']
+        self.total += raw['total']
+        self.min = raw['min'] if self.min is None else min(self.min, raw['min'])
+        self.max = raw['max'] if self.max is None else max(self.max, raw['max'])
+
+    def quantile(self, q):
+        """q 분위수가 속한 구간의 상한 (마지막 구간이면 최댓값)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.max
+        return self.max
+
+    def raw(self):
+        return {'counts': list(self.counts), 'count': self.count, 'total': self.total,
+                'min': self.min, 'max': self.max}
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'total': round(self.total, 6),
+            'mean': round(self.total / self.count, 6) if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.quantile(0.5),
+            'p90': self.quantile(0.9),
+            'p99': self.quantile(0.99),
+            'buckets': dict(zip([str(b) for b in LATENCY_BUCKETS] + ['inf'], self.counts)),
+        }
+
+
+class Metrics:
+    """
+    카운터와 지연 시간 히스토그램 모음입니다. 크롤링 스레드에서 함께 쓰므로 잠금으로 보호합니다.
+    이름은 'crawl.fetch', 'extract.selector.div#dic_area'처럼 점으로 구분합니다.
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, seconds):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timed(self, name):
+        """with 블록의 실행 시간을 name 히스토그램에 기록합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def snapshot(self):
+        """다른 프로세스로 보낼 수 있는 원시 값 (merge의 입력)"""
+        with self._lock:
+            return {'counters': dict(self.counters),
+                    'histograms': {name: h.raw() for name, h in self.histograms.items()}}
+
+    def merge(self, snapshot):
+        """프로세스 풀 작업 등에서 모은 snapshot을 더합니다."""
+        with self._lock:
+            for name, value in snapshot['counters'].items():
+                self.counters[name] = self.counters.get(name, 0) + value
+            for name, raw in snapshot['histograms'].items():
+                self.histograms.setdefault(name, Histogram()).merge(raw)
+
+    def reset(self):
+        with self._lock:
+            self.counters = {}
+            self.histograms = {}
+
+    def report(self):
+        with self._lock:
+            return {'counters': dict(sorted(self.counters.items())),
+                    'histograms': {name: self.histograms[name].summary() for name in sorted(self.histograms)}}
+
+
+# 프로세스 공용 지표
+METRICS = Metrics()
+
+
+def increment(name, value=1):
+    METRICS.increment(name, value)
+
+
+def observe(name, seconds):
+    METRICS.observe(name, seconds)
+
+
+def timed(name):
+    return METRICS.timed(name)
+
+
+def profile_stages_from_env():
+    """PROFILE_STAGES 환경 변수의 단계 이름 집합"""
+    value = os.environ.get(PROFILE_STAGES_ENV, '')
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+class StageTimer:
+    """
+    파이프라인 단계별 소요 시간을 기록합니다. profile에 포함된 단계는 cProfile로 실행해
+    profile_dir/<단계>.prof에 저장하고 누적 시간 상위 함수를 로그로 남깁니다.
+    tracemalloc이 켜져 있으면 단계별 최대 메모리(MB)도 memory에 기록합니다.
+
+        timer = StageTimer(profile={'중복제거'})
+        with timer.stage('중복제거'):
+            ...
+        logger.info(timer.summary())
+    Args:
+        profile: set, 프로파일할 단계 이름 ('all'이면 모든 단계, 기본값: PROFILE_STAGES 환경 변수)
+        profile_dir: str, 프로파일 결과 디렉터리
+    """
+
+    def __init__(self, profile=None, profile_dir=DEFAULT_PROFILE_DIR):
+        self.timings = {}
+        self.memory = {}
+        self.profile = set(profile) if profile is not None else profile_stages_from_env()
+        self.profile_dir = profile_dir
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+
+    def _profiled(self, name):
+        return 'all' in self.profile or name in self.profile
+
+    @contextmanager
+    def stage(self, name):
+        """with 블록의 실행 시간을 name 단계에 더합니다 (예외가 나도 기록)."""
+        profiler = cProfile.Profile() if self._profiled(name) else None
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            elapsed = time.perf_counter() - start
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+                self.memory[name] = max(self.memory.get(name, 0.0), peak)
+            logger.info(f"[{name}] {elapsed:.2f}초")
+            if profiler is not None:
+                self._save_profile(name, profiler)
+
+    def _save_profile(self, name, profiler):
+        os.makedirs(self.profile_dir, exist_ok=True)
+        path = os.path.join(self.profile_dir, re.sub(r'[^\w.-]', '_', name) + '.prof')
+        profiler.dump_stats(path)
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(15)
+        logger.info(f"[{name}] 프로파일 저장: {path}\n{out.getvalue()}")
+
+    @property
+    def total(self):
+        return sum(self.timings.values())
+
+    def summary(self):
+        """실행 로그용 단계별 시간 문자열"""
+        stages = ', '.join(f"{name} {seconds:.2f}초" for name, seconds in self.timings.items())
+        return f"단계별 소요 시간: {stages} (합계 {self.total:.2f}초)"
+
+
+def write_report(path=DEFAULT_REPORT_PATH, timer=None, metrics=METRICS, **extra):
+    """
+    실행 보고서(JSON)를 원자적으로 저장합니다.
+    Args:
+        path: str, 보고서 파일 경로
+        timer: StageTimer, 단계별 소요 시간
+        metrics: Metrics, 카운터와 히스토그램
+        extra: 보고서에 함께 넣을 값 (status, 기사 수 등)
+    """
+    report = {'finished_at': datetime.now().isoformat(timespec='seconds')}
+    if timer is not None:
+        report['started_at'] = timer.started_at
+        report['stages'] = {name: round(seconds, 6) for name, seconds in timer.timings.items()}
+        report['total_seconds'] = round(timer.total, 6)
+        if timer.memory:
+            report['stage_peak_mb'] = {name: round(mb, 3) for name, mb in timer.memory.items()}
+    report.update(extra)
+    report.update(metrics.report())
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, path)
+    logger.info(f"실행 보고서를 {path}에 저장했습니다.")
+    return report
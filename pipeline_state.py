@@ -0,0 +1,81 @@
+import json
+import logging
+import os
+from datetime import datetime
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = os.path.join('.cache', 'pipeline_state.json')
+
+# 크롤링에 실패한 행을 다시 시도하는 최대 횟수 (넘으면 포기)
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def load_state(path=DEFAULT_STATE_PATH):
+    """이전 실행의 파이프라인 상태를 읽습니다. 없으면 빈 상태를 반환합니다."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"파이프라인 상태 파일을 읽지 못했습니다. 전체 실행으로 진행합니다: {str(e)}")
+        return {}
+
+
+def save_state(state, path=DEFAULT_STATE_PATH):
+    """파이프라인 상태를 원자적으로 저장합니다."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    state = dict(state, updated_at=datetime.now().isoformat(timespec='seconds'))
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+def get_seen_links(state):
+    """이미 처리한 기사 링크 집합을 반환합니다."""
+    return set(state.get('seen_links', []))
+
+
+def add_seen_links(state, links):
+    """처리한 기사 링크를 상태에 추가합니다."""
+    seen = get_seen_links(state)
+    seen.update(links)
+    state['seen_links'] = sorted(seen)
+    return state
+
+
+def get_retries(state):
+    """
+    이전 실행에서 크롤링에 실패해 다시 시도할 행을 반환합니다.
+    Returns:
+        dict: 링크 → {'row': 시트 행 (dict), 'attempts': 지금까지 실패한 횟수}
+    """
+    return dict(state.get('retries', {}))
+
+
+def update_retries(state, failed_rows, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    """
+    이번 실행에서 실패한 행으로 재시도 목록을 바꿉니다. 재시도 목록의 행은 매 실행 다시 크롤링하므로
+    이번에 실패하지 않은 링크는 목록에서 빠지고, max_attempts번 실패한 링크는 포기합니다.
+    Args:
+        failed_rows: list, 이번 실행에서 실패한 행 (dict, '링크' 포함)
+    Returns:
+        tuple: (상태, 포기한 링크 목록)
+    """
+    previous = state.get('retries', {})
+    retries = {}
+    abandoned = []
+    for row in failed_rows:
+        link = row['링크']
+        attempts = previous.get(link, {}).get('attempts', 0) + 1
+        if attempts >= max_attempts:
+            abandoned.append(link)
+            continue
+        retries[link] = {'row': row, 'attempts': attempts}
+    state['retries'] = retries
+    return state, abandoned
@@ -0,0 +1,62 @@
+# 네이버 뉴스 언론사 코드 → (신문사, 그룹, 그룹 내 우선순위)
+PUBLISHERS = {
+    '023': ('조선일보', '보수', 1),
+    '025': ('중앙일보', '보수', 2),
+    '020': ('동아일보', '보수', 3),
+    '032': ('경향신문', '진보', 1),
+    '028': ('한겨레신문', '진보', 2),
+    '469': ('한국일보', '진보', 3),
+    '009': ('매일경제', '경제', 1),
+    '015': ('한국경제', '경제', 2),
+    '011': ('서울경제', '경제', 3),
+    '277': ('아주경제', '경제', 4),
+}
+
+# 등록되지 않은 신문사
+UNKNOWN = '기타'
+
+# 아래 조회표는 모두 PUBLISHERS에서 import 시 한 번만 만듦
+NEWSPAPER_CODES = {code: name for code, (name, _, _) in PUBLISHERS.items()}
+
+NEWSPAPER_GROUPS = {}
+for _name, _group, _priority in PUBLISHERS.values():
+    NEWSPAPER_GROUPS.setdefault(_group, {})[_name] = _priority
+
+NEWSPAPER_GROUP = {name: group for name, group, _ in PUBLISHERS.values()}
+NEWSPAPER_PRIORITY = {name: priority for name, _, priority in PUBLISHERS.values()}
+
+
+def get_newspaper_group(newspaper):
+    """신문사가 속한 그룹을 반환"""
+    return NEWSPAPER_GROUP.get(newspaper, UNKNOWN)
+
+
+def get_newspaper_priority(newspaper):
+    """신문사의 우선순위를 반환"""
+    return NEWSPAPER_PRIORITY.get(newspaper, float('inf'))
+
+
+def newspaper_from_url(url):
+    """URL 하나에서 신문사를 찾습니다. 네이버 뉴스가 아니거나 코드를 모르면 '기타'."""
+    if not isinstance(url, str) or 'naver.com' not in url:
+        return UNKNOWN
+    # 첫 번째 '/article/' 다음 경로 조각이 언론사 코드
+    _, found, rest = url.partition('/article/')
+    if not found:
+        return UNKNOWN
+    return NEWSPAPER_CODES.get(rest.partition('/')[0], UNKNOWN)
+
+
+def newspapers_from_urls(urls):
+    """
+    URL 열 전체에서 신문사를 한 번에 찾습니다.
+    pandas의 apply/str.extract는 행마다 오버헤드가 커서 값 목록을 한 번만 순회합니다.
+    Args:
+        urls: Series, 기사 URL
+    Returns:
+        Series: 신문사 (같은 인덱스)
+    """
+    import pandas as pd
+    
+    urls = pd.Series(urls, dtype=object)
+    return pd.Series([newspaper_from_url(url) for url in urls.tolist()], index=urls.index)
@@ -1,93 +1,37 @@
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
 import pandas as pd
 import os
 import json
 import requests
-from bs4 import BeautifulSoup
-import base64
-from datetime import datetime
+from article_cache import ArticleCache
+from article_store import normalize_date
+from extractor import GENERIC_SELECTORS, extract_article, extract_longest_block
+from fetcher import DEFAULT_TIMEOUT, get_fetcher
+from publishers import NEWSPAPER_GROUPS, NEWSPAPER_PRIORITY, newspapers_from_urls
+from shard_publisher import MANIFEST_FILE, GitDataTarget, publish_shards
+from sheet_reader import SheetReader, open_worksheet
 
-print("1. 시작...")
+# 기사 본문 캐시 (crawler.py와 같은 파일을 공유)
+article_cache = ArticleCache()
 
 # ✅ STEP 1: Google Sheets에서 데이터 불러오기
-def get_google_sheets_data():
-    print("2. Google 서비스 계정 키 파일 읽기 시도...")
+def get_google_sheets_data(worksheet=None):
+    print("2. Google 서비스 계정 키로 워크시트 열기 시도...")
     
     try:
-        # 환경 변수에서 JSON 문자열을 읽어서 파싱
-        credentials_json = os.environ.get('GOOGLE_CREDENTIALS')
-        if not credentials_json:
-            print("환경 변수 내용:")
-            print(os.environ)
-            raise ValueError("GOOGLE_CREDENTIALS 환경 변수가 설정되지 않았습니다.")
-            
-        print("3. JSON 데이터 길이:", len(credentials_json))
-        print("4. JSON 데이터 시작 부분:", credentials_json[:100])  # 처음 100자만 출력
-        
-        # JSON 문자열을 파일로 저장하여 디버깅
-        with open('temp_credentials.json', 'w') as f:
-            f.write(credentials_json)
-        print("5. 임시 credentials 파일 저장 완료")
-        
-        credentials_dict = json.loads(credentials_json)
-        
-        # 스코프 설정
-        scope = [
-            "https://spreadsheets.google.com/feeds",
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive.file",
-            "https://www.googleapis.com/auth/drive"
-        ]
-        
-        credentials = ServiceAccountCredentials.from_json_keyfile_dict(credentials_dict, scope)
-        gc = gspread.authorize(credentials)
-        print("6. Google Sheets 인증 성공")
-        
-        # 스프레드시트 열기
-        spreadsheet = gc.open_by_url('https://docs.google.com/spreadsheets/d/1HLTb59lcJQIZmaPMrJ0--hEsheyERIkCg5aBxSEFDtc/edit#gid=0')
-        
-        # Result 워크시트 선택
-        worksheet = spreadsheet.worksheet("Result")
+        # 워크시트를 주입하지 않으면 GOOGLE_CREDENTIALS로 Result 시트를 엶
+        if worksheet is None:
+            worksheet = open_worksheet()
+            print("6. Google Sheets 인증 성공")
         print(f"7. 선택된 워크시트: {worksheet.title}")
         
-        # 전체 데이터 가져오기
-        all_values = worksheet.get_all_values()
-        print(f"8. 전체 데이터 행 수: {len(all_values)}")
-        
-        # 헤더 확인
-        headers = all_values[0]
-        print("9. 헤더:", headers)
-        
-        # 데이터프레임 생성
-        df = pd.DataFrame(all_values[1:], columns=headers)
+        # 헤더의 모든 열을 한 번의 범위 요청으로 가져오기
+        df, _ = SheetReader(worksheet, columns=None).read()
+        print("9. 헤더:", df.columns.tolist())
+        df = df.reset_index(drop=True)
         print(f"10. DataFrame 생성 완료. 행 수: {len(df)}")
         
-        # 신문사 정보 추출 (URL에서)
-        def extract_newspaper(url):
-            if 'naver.com' in url:
-                # 네이버 뉴스 URL에서 신문사 코드 추출
-                newspaper_codes = {
-                    '023': '조선일보',
-                    '025': '중앙일보',
-                    '020': '동아일보',
-                    '032': '경향신문',
-                    '028': '한겨레신문',
-                    '469': '한국일보',
-                    '009': '매일경제',
-                    '015': '한국경제',
-                    '011': '서울경제',
-                    '277': '아주경제'
-                }
-                try:
-                    code = url.split('/article/')[1].split('/')[0]
-                    return newspaper_codes.get(code, '기타')
-                except:
-                    return '기타'
-            return '기타'
-        
-        # 신문사 열 추가
-        df['신문사'] = df['링크'].apply(extract_newspaper)
+        # 신문사 정보 추출 (URL에서, 열 전체를 한 번에)
+        df['신문사'] = newspapers_from_urls(df['링크'])
         print("11. 신문사 정보 추출 완료")
         
         return df
@@ -101,67 +45,47 @@ def get_google_sheets_data():
 def extract_article_text(url):
     try:
         print(f"\n크롤링 시도: {url}")
+        
+        # 캐시가 유효하면 네트워크 요청과 파싱을 모두 건너뜀
+        entry = article_cache.get(url)
+        if entry is not None and entry.is_fresh(article_cache.ttl):
+            article_cache.record('hit')
+            print("캐시된 본문을 사용합니다.")
+            return entry.text
+        
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
-        res = requests.get(url, headers=headers, timeout=10)
+        if entry is not None:
+            headers.update(entry.conditional_headers())
+        # 429/5xx는 백오프 후 재시도하고, 계속 실패하는 호스트는 잠시 요청하지 않음
+        res = get_fetcher().get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+        if entry is not None and res.status_code == 304:
+            article_cache.touch(url)
+            article_cache.record('revalidated')
+            print("변경되지 않은 기사입니다. 캐시된 본문을 사용합니다.")
+            return entry.text
         res.raise_for_status()  # HTTP 에러 체크
         print(f"HTTP 상태 코드: {res.status_code}")
+        article_cache.record('miss')
         
-        soup = BeautifulSoup(res.text, 'html.parser')
-        
-        # 다양한 뉴스 사이트에 대한 선택자
-        selectors = [
-            'div#dic_area',  # Naver 뉴스
-            'div.article-body',  # 일반적인 뉴스 사이트
-            'article',  # 일반적인 뉴스 사이트
-            'div.article-content',  # 일반적인 뉴스 사이트
-            'div.article-text',  # 일반적인 뉴스 사이트
-            'div#articleBody',  # 비즈니스포스트
-            'div#news_body_area',  # 비바100
-            'div#article-view-content-div',  # 뉴스프라임
-            'div.article_body',  # 딜사이트
-            'div#articeBody',  # 네이버 엔터테인먼트
-            'div.end_body',  # 네이버 엔터테인먼트 모바일
-            'div#newsEndContents',  # 네이버 스포츠
-            'div.article_txt',  # 추가 일반
-            'div#articleContent',  # 추가 일반
-            'div#newsContent',  # 추가 일반
-            'div.news_body',  # 추가 일반
-            'div#newsViewArea',  # 추가 일반
-            'div#content',  # 추가 일반
-            'div.article',  # 네이버 엔터테인먼트 추가
-            'div.article-content',  # 네이버 엔터테인먼트 추가
-            'div.article-body',  # 네이버 엔터테인먼트 추가
-        ]
+        # 도메인별 선택자를 먼저 시도하는 추출기
+        text, selector = extract_article(res.text, url)
+        if selector is not None:
+            print(f"성공적으로 본문을 찾았습니다. 선택자: {selector}")
+            article_cache.put(url, text,
+                              etag=res.headers.get('ETag'),
+                              last_modified=res.headers.get('Last-Modified'))
+            return text
         
-        for selector in selectors:
-            article = soup.select_one(selector)
-            if article:
-                # 불필요한 요소 제거
-                for tag in article.select('script, style, iframe, .reporter_area, .copyright, .promotion'):
-                    tag.decompose()
-                
-                # 텍스트 정제
-                text = article.get_text(strip=True)
-                text = ' '.join(text.split())  # 연속된 공백 제거
-                
-                print(f"성공적으로 본문을 찾았습니다. 선택자: {selector}")
-                return text
-        
-        print("본문을 찾을 수 없습니다. 사용 가능한 선택자:")
-        for selector in selectors:
-            elements = soup.select(selector)
-            print(f"{selector}: {len(elements)}개 발견")
+        # 모든 선택자가 일치하지 않았으므로 선택자별 개수는 출력하지 않음
+        print(f"본문을 찾을 수 없습니다. 시도한 선택자 수: {len(GENERIC_SELECTORS)}")
             
         # 마지막 시도: 본문으로 추정되는 가장 긴 텍스트 블록 찾기
-        paragraphs = soup.find_all(['p', 'div'])
-        if paragraphs:
-            longest_text = max(paragraphs, key=lambda p: len(p.get_text(strip=True)))
-            text = longest_text.get_text(strip=True)
-            if len(text) > 100:  # 최소 100자 이상인 경우만 본문으로 간주
-                print("본문으로 추정되는 텍스트를 찾았습니다.")
-                return text
+        text = extract_longest_block(res.text)
+        if len(text) > 100:  # 최소 100자 이상인 경우만 본문으로 간주
+            print("본문으로 추정되는 텍스트를 찾았습니다.")
+            return text
             
         return "본문 없음"
 
@@ -172,36 +96,6 @@ def extract_article_text(url):
         print(f"예상치 못한 에러: {e}")
         return f"[크롤링 에러] {e}"
 
-# 신문사 그룹 및 우선순위 정의
-NEWSPAPER_GROUPS = {
-    'group1': {
-        'newspapers': ['조선일보', '중앙일보', '동아일보'],
-        'priority': {'조선일보': 1, '중앙일보': 2, '동아일보': 3}
-    },
-    'group2': {
-        'newspapers': ['경향신문', '한겨레신문', '한국일보'],
-        'priority': {'경향신문': 1, '한겨레신문': 2, '한국일보': 3}
-    },
-    'group3': {
-        'newspapers': ['매일경제', '한국경제', '서울경제', '아주경제'],
-        'priority': {'매일경제': 1, '한국경제': 2, '서울경제': 3, '아주경제': 4}
-    }
-}
-
-def get_newspaper_group(newspaper):
-    """신문사가 속한 그룹을 반환"""
-    for group_name, group_info in NEWSPAPER_GROUPS.items():
-        if newspaper in group_info['newspapers']:
-            return group_name
-    return None
-
-def get_newspaper_priority(newspaper):
-    """신문사의 우선순위를 반환"""
-    for group_info in NEWSPAPER_GROUPS.values():
-        if newspaper in group_info['priority']:
-            return group_info['priority'][newspaper]
-    return float('inf')  # 우선순위가 없는 경우 가장 낮은 우선순위
-
 def select_articles_by_length(group, threshold=0.2):
     """기사 길이와 신문사 우선순위를 고려하여 기사 선택"""
     # 기사 길이 계산 (본문의 길이)
@@ -220,7 +114,7 @@ def select_articles_by_length(group, threshold=0.2):
         candidates = group.copy()
     
     # 신문사 우선순위 추가
-    candidates['priority'] = candidates['신문사'].apply(get_newspaper_priority)
+    candidates['priority'] = candidates['신문사'].map(NEWSPAPER_PRIORITY).fillna(float('inf'))
     
     # 우선순위 기준으로 정렬
     candidates = candidates.sort_values(['priority'])
@@ -251,19 +145,19 @@ def deduplicate_articles(df):
         selected_articles = []
         used_groups = set()
         
-        # 발행일 기준으로 정렬 (최신순)
-        group = group.sort_values('발행일', ascending=False)
+        # 발행일 기준으로 정렬 (최신순, 'M/D/YYYY' 문자열이 아닌 날짜 순서로. 알 수 없는 발행일은 마지막)
+        group = group.sort_values('발행일', ascending=False, key=lambda dates: dates.map(normalize_date))
         
         # 각 그룹별로 기사 선택
-        for group_name, group_info in NEWSPAPER_GROUPS.items():
+        for group_name, newspapers in NEWSPAPER_GROUPS.items():
             if group_name in used_groups:
                 continue
                 
             print(f"\n  그룹: {group_name}")
-            print(f"  - 신문사 목록: {group_info['newspapers']}")
+            print(f"  - 신문사 목록: {list(newspapers)}")
             
             # 해당 그룹의 기사들만 필터링
-            group_articles = group[group['신문사'].isin(group_info['newspapers'])]
+            group_articles = group[group['신문사'].isin(list(newspapers))]
             print(f"  - 그룹 내 기사 수: {len(group_articles)}")
             
             if len(group_articles) > 0:
@@ -292,6 +186,8 @@ try:
     df = get_google_sheets_data()  # DataFrame 가져오기
     df['본문'] = df['링크'].apply(extract_article_text)
     print("11. 기사 본문 크롤링 완료")
+    print(f"  - {article_cache.summary()}")
+    article_cache.close()
     
     # 중복제거
     df = deduplicate_articles(df)
@@ -310,56 +206,29 @@ except Exception as e:
     exit(1)
 
 # ✅ STEP 5: GitHub Repository 업데이트 함수
-def update_github_repo(json_data, github_token, repo_name, file_path='news_batch.json'):
+def update_github_repo(json_data, github_token, repo_name, file_path='news_batch.json', prefix='news_batch'):
     try:
         print("16. GitHub Repository 업데이트 시도...")
         print(f"  - 저장소: {repo_name}")
         print(f"  - 파일 경로: {file_path}")
+        print(f"  - 샤드 경로: {prefix}")
         print(f"  - JSON 데이터 크기: {len(json_data)} bytes")
         
-        # GitHub API 엔드포인트
-        url = f"https://api.github.com/repos/{repo_name}/contents/{file_path}"
-        print(f"  - API URL: {url}")
-        
-        # 기존 파일 정보 가져오기
-        headers = {
-            "Authorization": f"Bearer {github_token}",
-            "Accept": "application/vnd.github.v3+json"
-        }
-        
-        # 기존 파일의 SHA 가져오기
-        print("  - 기존 파일 정보 요청 중...")
-        response = requests.get(url, headers=headers)
-        print(f"  - 기존 파일 응답 상태: {response.status_code}")
-        
-        sha = None
-        if response.status_code == 200:
-            sha = response.json()['sha']
-            print("  - 기존 파일 SHA 획득")
-        else:
-            print("  - 새 파일 생성")
-        
-        # 파일 업데이트
-        payload = {
-            "message": f"Update news data {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "content": base64.b64encode(json_data.encode()).decode(),
-            "sha": sha
-        }
-        print("  - 업데이트 요청 전송 중...")
-        
-        response = requests.put(url, headers=headers, data=json.dumps(payload))
-        print(f"  - 업데이트 응답 상태: {response.status_code}")
-        print(f"  - 응답 내용: {response.text}")
+        # 발행일별 샤드 중 바뀐 것, manifest, 기존 news_batch.json을 커밋 하나로 올림
+        # (news_batch.json은 샤드로 옮기는 동안 기존 URL을 쓰는 곳을 위해 계속 올림)
+        print("  - 바뀐 샤드 업로드 중...")
+        stats = publish_shards(json.loads(json_data), GitDataTarget(repo_name, github_token), prefix,
+                               files={file_path: json_data.encode('utf-8')})
+        print(f"  - 올린 샤드: {stats['uploaded']}개, 그대로인 샤드: {stats['unchanged']}개, "
+              f"삭제한 샤드: {stats['deleted']}개")
+        print(f"  - 전송 크기: {stats['bytes']} bytes")
         
-        if response.status_code in [200, 201]:
-            raw_url = response.json()['content']['download_url']
-            print(f"✅ GitHub Repository 업데이트 성공!")
-            print(f"🌐 Raw URL: {raw_url}")
-            return raw_url
-        else:
-            print(f"❌ GitHub Repository 업데이트 실패: {response.status_code}")
-            print(f"  - 에러 메시지: {response.text}")
-            return None
+        raw_url = f"https://raw.githubusercontent.com/{repo_name}/HEAD/{file_path}"
+        manifest_url = f"https://raw.githubusercontent.com/{repo_name}/HEAD/{prefix}/{MANIFEST_FILE}"
+        print(f"✅ GitHub Repository 업데이트 성공!")
+        print(f"🌐 Raw URL: {raw_url}")
+        print(f"🌐 Manifest URL: {manifest_url}")
+        return raw_url
     except Exception as e:
         print(f"❌ GitHub Repository 업데이트 중 오류 발생: {e}")
         return None
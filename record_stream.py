@@ -0,0 +1,177 @@
+import json
+import logging
+import math
+import os
+import shutil
+import tempfile
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 파일에서 한 번에 읽는 문자 수
+READ_CHUNK_SIZE = 64 * 1024
+
+# KeywordSpool이 메모리에 들고 있는 최대 기사 수 (넘으면 키워드별 임시 파일로 내보냄)
+DEFAULT_MAX_BUFFERED = 5000
+
+
+def iter_records(path, chunk_size=READ_CHUNK_SIZE):
+    """
+    기사 파일을 한 건씩 읽습니다. 전체 파일을 메모리에 올리지 않습니다.
+    JSON 배열(news_data.json, temp_news_data.json)과 JSON Lines(.jsonl)를 모두 지원합니다.
+    Returns:
+        generator: 기사(dict)
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = f.read(chunk_size)
+        pos = _skip_whitespace(buffer, 0)
+        # 첫 조각이 공백뿐이면 형식을 알 수 있을 때까지 더 읽음
+        while pos == len(buffer):
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            buffer += chunk
+            pos = _skip_whitespace(buffer, pos)
+        if pos == len(buffer) or buffer[pos] != '[':
+            # JSON Lines: 한 줄에 기사 하나
+            f.seek(0)
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        pos += 1
+        eof = False
+        while True:
+            pos = _skip_whitespace(buffer, pos)
+            if pos < len(buffer) and buffer[pos] == ',':
+                pos = _skip_whitespace(buffer, pos + 1)
+            if pos < len(buffer) and buffer[pos] == ']':
+                return
+            try:
+                if pos == len(buffer):
+                    raise json.JSONDecodeError('더 읽어야 함', buffer, pos)
+                # 배열 원소는 객체이므로 닫는 괄호까지 읽혀야만 디코딩에 성공함
+                record, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+            yield record
+
+
+def _skip_whitespace(text, pos):
+    while pos < len(text) and text[pos] in ' \t\r\n':
+        pos += 1
+    return pos
+
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+class KeywordSpool:
+    """
+    기사를 키워드별로 모읍니다. 메모리에는 최대 max_buffered건만 두고,
+    넘으면 키워드별 임시 JSON Lines 파일로 내보냅니다 (키워드 수만큼의 외부 버킷 정렬).
+    키워드가 없는 기사는 groupby와 같이 제외합니다.
+    Args:
+        max_buffered: int, 메모리에 둘 최대 기사 수
+        directory: str, 임시 파일 위치 (기본값: 시스템 임시 디렉터리)
+    """
+
+    def __init__(self, max_buffered=DEFAULT_MAX_BUFFERED, directory=None):
+        self.max_buffered = max_buffered
+        self.counts = {}
+        self.dropped = 0
+        self._directory = tempfile.mkdtemp(prefix='keyword_spool_', dir=directory)
+        self._buffers = {}
+        self._paths = {}
+        self._buffered = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __contains__(self, keyword):
+        return keyword in self.counts
+
+    def add(self, record):
+        keyword = record.get('키워드')
+        if _is_missing(keyword):
+            self.dropped += 1
+            return
+        self._buffers.setdefault(keyword, []).append(json.dumps(record, ensure_ascii=False))
+        self.counts[keyword] = self.counts.get(keyword, 0) + 1
+        self._buffered += 1
+        if self._buffered >= self.max_buffered:
+            self.flush()
+
+    def flush(self):
+        """메모리의 기사를 키워드별 파일 끝에 덧붙입니다."""
+        for keyword, lines in self._buffers.items():
+            path = self._paths.get(keyword)
+            if path is None:
+                path = self._paths[keyword] = os.path.join(self._directory, f"{len(self._paths)}.jsonl")
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+        self._buffers = {}
+        self._buffered = 0
+
+    def keywords(self):
+        """키워드 목록 (정렬, groupby와 같은 순서)"""
+        return sorted(self.counts)
+
+    def records(self, keyword):
+        """키워드의 기사를 추가한 순서대로 반환합니다."""
+        records = []
+        path = self._paths.get(keyword)
+        if path is not None:
+            with open(path, 'r', encoding='utf-8') as f:
+                records.extend(json.loads(line) for line in f)
+        records.extend(json.loads(line) for line in self._buffers.get(keyword, []))
+        return records
+
+    def close(self):
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+
+class JsonArrayWriter:
+    """
+    기사를 하나씩 JSON 배열 파일로 씁니다. 결과는 json.dump(rows, indent=2)와 같습니다.
+    임시 파일에 쓴 뒤 정상 종료 시에만 대상 파일을 교체합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._temp_path = f"{path}.tmp"
+        self._f = open(self._temp_path, 'w', encoding='utf-8')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._f.close()
+            os.remove(self._temp_path)
+
+    def write(self, record):
+        self._f.write('[\n' if self.count == 0 else ',\n')
+        # 문자열 안의 줄바꿈은 이스케이프되므로 줄 단위 들여쓰기가 안전함
+        self._f.write('  ' + json.dumps(record, ensure_ascii=False, indent=2).replace('\n', '\n  '))
+        self.count += 1
+
+    def close(self):
+        self._f.write('\n]' if self.count else '[]')
+        self._f.close()
+        os.replace(self._temp_path, self.path)
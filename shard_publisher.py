@@ -0,0 +1,378 @@
+import argparse
+import base64
+import hashlib
+import json
+import logging
+import os
+import posixpath
+from datetime import datetime
+
+import requests
+
+from article_store import normalize_date
+from metrics import increment, timed
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARD_DIR = 'news_shards'
+MANIFEST_FILE = 'manifest.json'
+
+# 발행일을 알 수 없는 기사의 샤드 이름 (날짜 샤드 뒤에 정렬됨)
+UNKNOWN_SHARD = 'unknown'
+
+GITHUB_API_URL = 'https://api.github.com'
+API_TIMEOUT = 30
+
+
+class PublishConflict(Exception):
+    """게시 대상의 파일 sha가 요청한 sha와 다름 (다른 곳에서 파일이 바뀌었거나 manifest가 없음)"""
+
+
+def git_blob_sha(content):
+    """git이 파일 내용에 붙이는 sha (contents API의 sha와 같음)"""
+    return hashlib.sha1(b'blob %d\0' % len(content) + content).hexdigest()
+
+
+def shard_name(record):
+    """기사가 들어갈 샤드 이름 (발행일 'YYYY-MM-DD')"""
+    return normalize_date(record.get('발행일')) or UNKNOWN_SHARD
+
+
+def build_shards(records):
+    """
+    기사를 발행일별 샤드로 나눕니다. 샤드 안의 기사는 입력 순서를 유지합니다.
+    Returns:
+        dict: 샤드 이름 → 기사 목록 (이름 순)
+    """
+    shards = {}
+    for record in records:
+        shards.setdefault(shard_name(record), []).append(record)
+    return dict(sorted(shards.items()))
+
+
+def shard_content(rows):
+    """샤드 파일 내용 (news_data.json과 같은 형식). 같은 기사 목록이면 항상 같은 바이트"""
+    return json.dumps(rows, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+class DirectoryTarget:
+    """
+    로컬 디렉터리에 게시합니다 (게시 결과를 git으로 커밋하는 경우).
+    Args:
+        root: str, 게시 경로의 기준 디렉터리
+    """
+
+    def __init__(self, root='.'):
+        self.root = root
+
+    def _path(self, path):
+        return os.path.join(self.root, *path.split('/'))
+
+    def get(self, path):
+        """(내용, sha). 파일이 없으면 (None, None)"""
+        try:
+            with open(self._path(path), 'rb') as f:
+                content = f.read()
+        except FileNotFoundError:
+            return None, None
+        return content, git_blob_sha(content)
+
+    def sha(self, path):
+        """파일의 blob sha (없으면 None)"""
+        return self.get(path)[1]
+
+    def put(self, path, content, sha=None, message=None):
+        """파일을 원자적으로 씁니다. sha가 현재 파일과 다르면 PublishConflict. 새 sha를 반환합니다."""
+        _, current = self.get(path)
+        if current != sha:
+            raise PublishConflict(path)
+        full_path = self._path(path)
+        os.makedirs(os.path.dirname(full_path) or '.', exist_ok=True)
+        temp_path = f"{full_path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(content)
+        os.replace(temp_path, full_path)
+        return git_blob_sha(content)
+
+    def delete(self, path, sha, message=None):
+        _, current = self.get(path)
+        if current != sha:
+            raise PublishConflict(path)
+        os.remove(self._path(path))
+
+    def commit(self, message=None):
+        """파일을 바로 쓰므로 할 일이 없음 (git 커밋은 워크플로에서)"""
+
+
+class GitDataTarget:
+    """
+    GitHub git data API로 저장소에 게시합니다. put/delete는 메모리에 모아 두었다가 commit에서
+    트리 하나와 커밋 하나로 올리므로, 바뀐 파일 수와 관계없이 게시 한 번에 커밋이 하나만 생깁니다.
+    Args:
+        repo: str, 'owner/name'
+        token: str, GitHub 토큰
+        branch: str, 대상 브랜치 (기본값: 저장소 기본 브랜치)
+        api_url: str, API 주소 (로컬 가짜 API로 바꿔 검증할 때 사용)
+        session: requests.Session, 공유 세션 (없으면 새로 생성)
+    """
+
+    def __init__(self, repo, token, branch=None, api_url=GITHUB_API_URL, session=None):
+        self.repo = repo
+        self.branch = branch
+        self.api_url = api_url.rstrip('/')
+        self.session = session or requests.Session()
+        self.session.headers.update({
+            'Authorization': f"Bearer {token}",
+            'Accept': 'application/vnd.github.v3+json',
+        })
+        self._head = None      # 브랜치 최신 커밋 sha
+        self._base_tree = None  # 그 커밋의 트리 sha
+        self._files = None     # 경로 → blob sha
+        self._changes = {}     # 아직 커밋하지 않은 변경: 경로 → 내용 (None이면 삭제)
+
+    def _request(self, method, path, payload=None, params=None):
+        url = f"{self.api_url}/repos/{self.repo}" + (f"/{path}" if path else '')
+        # 트리 요청에 넣은 한글 본문이 \uXXXX로 늘어나지 않도록 UTF-8로 보냄
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload is not None else None
+        return self.session.request(method, url, data=data, params=params, timeout=API_TIMEOUT)
+
+    def _json(self, method, path, payload=None, params=None):
+        response = self._request(method, path, payload, params)
+        response.raise_for_status()
+        return response.json()
+
+    def _load(self):
+        """브랜치 최신 커밋의 파일 목록을 읽습니다 (커밋 전까지 한 번만)."""
+        if self._files is not None:
+            return
+        if self.branch is None:
+            self.branch = self._json('GET', '')['default_branch']
+        self._head = self._json('GET', f"git/ref/heads/{self.branch}")['object']['sha']
+        self._base_tree = self._json('GET', f"git/commits/{self._head}")['tree']['sha']
+        tree = self._json('GET', f"git/trees/{self._base_tree}", params={'recursive': 1})
+        if tree.get('truncated'):
+            logger.warning("저장소 트리가 잘려서 왔습니다. 일부 파일의 sha를 알 수 없습니다.")
+        self._files = {entry['path']: entry['sha'] for entry in tree['tree'] if entry['type'] == 'blob'}
+
+    def sha(self, path):
+        """파일의 blob sha (없으면 None). 내용은 받지 않음"""
+        if path in self._changes:
+            content = self._changes[path]
+            return None if content is None else git_blob_sha(content)
+        self._load()
+        return self._files.get(path)
+
+    def get(self, path):
+        """(내용, sha). 파일이 없으면 (None, None). 커밋하지 않은 변경도 반영됨"""
+        if path in self._changes:
+            content = self._changes[path]
+            return (None, None) if content is None else (content, git_blob_sha(content))
+        sha = self.sha(path)
+        if sha is None:
+            return None, None
+        return base64.b64decode(self._json('GET', f"git/blobs/{sha}")['content']), sha
+
+    def put(self, path, content, sha=None, message=None):
+        """변경을 모아 둡니다. sha가 현재 파일과 다르면 PublishConflict. 새 sha를 반환합니다."""
+        if self.sha(path) != sha:
+            raise PublishConflict(path)
+        self._changes[path] = content
+        return git_blob_sha(content)
+
+    def delete(self, path, sha, message=None):
+        if sha is None or self.sha(path) != sha:
+            raise PublishConflict(path)
+        self._changes[path] = None
+
+    def _tree_entry(self, path, content):
+        entry = {'path': path, 'mode': '100644', 'type': 'blob'}
+        if content is None:
+            return dict(entry, sha=None)
+        try:
+            # 텍스트 파일은 트리 요청에 내용을 넣어 blob 요청을 따로 보내지 않음
+            return dict(entry, content=content.decode('utf-8'))
+        except UnicodeDecodeError:
+            blob = self._json('POST', 'git/blobs', {'content': base64.b64encode(content).decode(),
+                                                    'encoding': 'base64'})
+            return dict(entry, sha=blob['sha'])
+
+    def commit(self, message=None):
+        """
+        모아 둔 변경을 커밋 하나로 올리고 브랜치를 옮깁니다. 그 사이 브랜치가 바뀌었으면
+        최신 커밋 위에 한 번 더 커밋합니다.
+        Returns:
+            str: 커밋 sha (변경이 없으면 None)
+        """
+        if not self._changes:
+            return None
+        self._load()
+        entries = [self._tree_entry(path, content) for path, content in sorted(self._changes.items())]
+        message = message or f"Update {len(entries)} files"
+        for attempt in range(2):
+            tree = self._json('POST', 'git/trees', {'base_tree': self._base_tree, 'tree': entries})
+            commit = self._json('POST', 'git/commits', {'message': message, 'tree': tree['sha'],
+                                                        'parents': [self._head]})
+            response = self._request('PATCH', f"git/refs/heads/{self.branch}", {'sha': commit['sha']})
+            if response.status_code != 422:
+                break
+            if attempt == 1:
+                raise PublishConflict(f"{self.branch}: {response.text[:200]}")
+            logger.warning(f"{self.branch} 브랜치가 그 사이 바뀌어 최신 커밋 위에 다시 커밋합니다.")
+            self._files = None
+            self._load()
+        response.raise_for_status()
+        self._changes = {}
+        self._files = None
+        return commit['sha']
+
+
+def _put(target, path, content, sha, message):
+    """
+    sha로 파일을 바꿉니다. 대상의 sha가 manifest와 다르면 현재 sha를 다시 읽어 한 번 더 시도하고,
+    이미 같은 내용이면 올리지 않습니다.
+    Returns:
+        bool: 올렸으면 True
+    """
+    try:
+        target.put(path, content, sha=sha, message=message)
+        return True
+    except PublishConflict:
+        _, current = target.get(path)
+        if current == git_blob_sha(content):
+            return False
+        logger.warning(f"{path}의 sha가 manifest와 달라 현재 sha로 다시 올립니다.")
+        target.put(path, content, sha=current, message=message)
+        return True
+
+
+def publish_shards(records, target, prefix=DEFAULT_SHARD_DIR, message=None, files=None):
+    """
+    기사를 발행일별 샤드로 나누어 바뀐 샤드만 게시하고, 마지막에 manifest를 갱신합니다.
+    바뀌었는지는 이전 manifest에 기록한 샤드별 sha와 비교하므로 바뀌지 않은 샤드는 요청하지 않습니다.
+    (manifest를 마지막에 쓰므로 manifest가 가리키는 샤드는 항상 올라가 있음.
+    GitDataTarget이면 바뀐 샤드, manifest, files가 커밋 하나로 올라감)
+
+        news_shards/2026-08-22.json  # 그날 발행된 기사 (news_data.json과 같은 형식)
+        news_shards/manifest.json    # {"updated_at": ..., "total": 기사 수,
+                                     #  "shards": {"2026-08-22": {"path", "sha", "count", "bytes"}}}
+    Args:
+        records: list, 게시할 전체 기사 목록 (news_data.json과 같은 형식)
+        target: DirectoryTarget 또는 GitDataTarget
+        prefix: str, 게시 경로 ('/'로 구분)
+        message: str, 커밋 메시지 (GitDataTarget)
+        files: dict, 함께 게시할 파일 (경로 → 내용 bytes). 내용이 바뀐 경우에만 올림
+    Returns:
+        dict: {'uploaded', 'unchanged', 'deleted', 'bytes'}
+    """
+    message = message or f"Update news shards {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    manifest_path = posixpath.join(prefix, MANIFEST_FILE)
+    manifest_content, manifest_sha = target.get(manifest_path)
+    previous = json.loads(manifest_content)['shards'] if manifest_content else {}
+
+    stats = {'uploaded': 0, 'unchanged': 0, 'deleted': 0, 'bytes': 0}
+    entries = {}
+    for name, rows in build_shards(records).items():
+        content = shard_content(rows)
+        sha = git_blob_sha(content)
+        entries[name] = {'path': f"{name}.json", 'sha': sha, 'count': len(rows), 'bytes': len(content)}
+        old = previous.get(name)
+        if old is not None and old['sha'] == sha:
+            stats['unchanged'] += 1
+            continue
+        with timed('publish.upload'):
+            uploaded = _put(target, posixpath.join(prefix, f"{name}.json"), content,
+                            old['sha'] if old else None, message)
+        if uploaded:
+            stats['uploaded'] += 1
+            stats['bytes'] += len(content)
+        else:
+            stats['unchanged'] += 1
+
+    # 더 이상 기사가 없는 샤드 제거
+    for name in sorted(set(previous) - set(entries)):
+        path = posixpath.join(prefix, previous[name]['path'])
+        try:
+            target.delete(path, previous[name]['sha'], message=message)
+        except PublishConflict:
+            _, current = target.get(path)
+            if current is None:
+                continue
+            target.delete(path, current, message=message)
+        stats['deleted'] += 1
+
+    if manifest_content is None or previous != entries:
+        manifest = {'updated_at': datetime.now().isoformat(timespec='seconds'), 'total': len(records),
+                    'shards': entries}
+        content = json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')
+        _put(target, manifest_path, content, manifest_sha, message)
+        stats['bytes'] += len(content)
+
+    for path, content in (files or {}).items():
+        sha = target.sha(path)
+        if sha != git_blob_sha(content):
+            target.put(path, content, sha=sha, message=message)
+            stats['bytes'] += len(content)
+    target.commit(message)
+
+    increment('publish.uploaded_shards', stats['uploaded'])
+    increment('publish.unchanged_shards', stats['unchanged'])
+    increment('publish.bytes', stats['bytes'])
+    logger.info(f"샤드 게시 완료: 올림 {stats['uploaded']}개, 그대로 {stats['unchanged']}개, "
+                f"삭제 {stats['deleted']}개, 전송 {stats['bytes']} bytes")
+    return stats
+
+
+def load_shards(target, prefix=DEFAULT_SHARD_DIR):
+    """
+    manifest의 샤드를 모두 읽어 기사 목록을 만듭니다. 샤드(발행일) 순으로 이어 붙인 뒤 키워드로 안정 정렬하므로
+    키워드 순서는 news_data.json과 같고, 같은 키워드 안에서는 발행일 순입니다.
+    Returns:
+        list: 기사 목록 (manifest가 없으면 빈 목록)
+    """
+    manifest_content, _ = target.get(posixpath.join(prefix, MANIFEST_FILE))
+    if manifest_content is None:
+        return []
+    rows = []
+    for name, entry in json.loads(manifest_content)['shards'].items():
+        content, _ = target.get(posixpath.join(prefix, entry['path']))
+        if content is None:
+            raise FileNotFoundError(f"manifest에 있는 샤드 {name}이(가) 없습니다.")
+        rows.extend(json.loads(content))
+    return sorted(rows, key=lambda row: row['키워드'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기사를 발행일별 샤드로 게시/복원')
+    parser.add_argument('input', nargs='?', help='게시할 news_data.json 형식 파일')
+    parser.add_argument('--prefix', default=DEFAULT_SHARD_DIR, help=f'샤드 경로 (기본값: {DEFAULT_SHARD_DIR})')
+    parser.add_argument('--repo', help='주어지면 로컬 디렉터리 대신 이 저장소(owner/name)에 커밋 하나로 게시 '
+                                       '(GITHUB_TOKEN 필요)')
+    parser.add_argument('--branch', help='--repo의 대상 브랜치')
+    parser.add_argument('--restore', metavar='FILE', help='샤드의 기사를 모아 news_data.json 형식 파일로 저장')
+    args = parser.parse_args()
+
+    if args.repo:
+        token = os.getenv('GITHUB_TOKEN')
+        if not token:
+            parser.error('--repo에는 GITHUB_TOKEN 환경 변수가 필요합니다.')
+        target = GitDataTarget(args.repo, token, branch=args.branch)
+    else:
+        target = DirectoryTarget()
+
+    if args.restore:
+        rows = load_shards(target, args.prefix)
+        with open(args.restore, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+        print(f"{len(rows)}개 기사를 {args.restore}에 저장했습니다.")
+        return
+    if not args.input:
+        parser.error('게시할 파일 또는 --restore가 필요합니다.')
+    with open(args.input, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+    publish_shards(records, target, args.prefix)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
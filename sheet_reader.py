@@ -0,0 +1,129 @@
+import json
+import logging
+import os
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+SPREADSHEET_URL = 'https://docs.google.com/spreadsheets/d/1HLTb59lcJQIZmaPMrJ0--hEsheyERIkCg5aBxSEFDtc/edit#gid=0'
+WORKSHEET_NAME = 'Result'
+
+# 크롤러가 사용하는 열
+SHEET_COLUMNS = ['키워드', '발행일', '제목', '링크']
+
+SCOPE = [
+    "https://spreadsheets.google.com/feeds",
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive.file",
+    "https://www.googleapis.com/auth/drive"
+]
+
+
+def open_worksheet(credentials_json=None, url=SPREADSHEET_URL, name=WORKSHEET_NAME):
+    """GOOGLE_CREDENTIALS 환경 변수(JSON 문자열)로 인증해 워크시트를 엽니다."""
+    import gspread
+    from oauth2client.service_account import ServiceAccountCredentials
+
+    credentials_json = credentials_json or os.environ.get('GOOGLE_CREDENTIALS')
+    if not credentials_json:
+        raise ValueError("GOOGLE_CREDENTIALS 환경 변수가 설정되지 않았습니다.")
+    credentials = ServiceAccountCredentials.from_json_keyfile_dict(json.loads(credentials_json), SCOPE)
+    client = gspread.authorize(credentials)
+    return client.open_by_url(url).worksheet(name)
+
+
+def column_letter(index):
+    """1부터 시작하는 열 번호를 A1 표기의 열 문자로 바꿉니다 (1 → A, 27 → AA)."""
+    letters = ''
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+class SheetReader:
+    """
+    워크시트에서 필요한 열만, 마지막으로 처리한 행 다음부터 한 번의 batch_get으로 읽습니다.
+    스프레드시트 수정 시각(revision)이 이전 실행과 같으면 값을 전혀 요청하지 않습니다.
+    Args:
+        worksheet: gspread Worksheet (row_values, batch_get, spreadsheet를 가진 객체면 됨)
+        columns: list, 읽을 열 이름 (None이면 헤더의 모든 열)
+    """
+
+    def __init__(self, worksheet, columns=SHEET_COLUMNS):
+        self.worksheet = worksheet
+        self.columns = columns
+
+    def revision(self):
+        """스프레드시트 마지막 수정 시각. 알 수 없으면 None (변경 감지를 하지 않음)."""
+        try:
+            return self.worksheet.spreadsheet.get_lastUpdateTime()
+        except Exception as e:
+            logger.warning(f"시트 수정 시각을 가져오지 못했습니다: {str(e)}")
+            return None
+
+    def read(self, state=None):
+        """
+        시트 행을 읽습니다.
+        Args:
+            state: dict, 이전 실행의 시트 상태 (revision, header, last_row, last_link). None이면 전체를 읽음
+        Returns:
+            tuple: (DataFrame (인덱스는 시트 행 번호), 새 시트 상태)
+        """
+        state = state or {}
+        revision = self.revision()
+        if revision is not None and state.get('revision') == revision:
+            logger.info(f"시트가 바뀌지 않았습니다 (수정 시각: {revision}). 읽기를 건너뜁니다.")
+            return self._frame([], self.columns or state.get('header', []), state.get('last_row', 1) + 1), state
+
+        header = state.get('header') or self.worksheet.row_values(1)
+        last_row = state.get('last_row', 1)
+        df, header_now, anchor = self._fetch(header, last_row + 1, state.get('last_link') and last_row)
+        if header_now != header or (last_row > 1 and anchor != state.get('last_link')):
+            # 열이 바뀌었거나 이미 읽은 행이 수정/삭제됨: 처음부터 다시 읽음
+            logger.info("시트 헤더나 이미 읽은 행이 바뀌어 처음부터 다시 읽습니다.")
+            header = header_now
+            last_row = 1
+            df, _, _ = self._fetch(header, 2, None)
+
+        new_state = {
+            'revision': revision,
+            'header': header,
+            'last_row': last_row + len(df),
+            'last_link': df['링크'].iloc[-1] if len(df) and '링크' in df else state.get('last_link'),
+        }
+        logger.info(f"시트 {last_row + 1}행부터 {len(df)}개 행, {len(df.columns)}개 열을 읽었습니다.")
+        return df, new_state
+
+    def _fetch(self, header, start_row, anchor_row):
+        """헤더 행, 필요한 열(start_row부터 끝까지), 확인용 행의 링크를 한 번에 요청합니다."""
+        columns = list(header) if self.columns is None else self.columns
+        missing = [name for name in columns if name not in header]
+        if missing:
+            raise ValueError(f"시트에 필요한 열이 없습니다: {missing}")
+        letters = [column_letter(header.index(name) + 1) for name in columns]
+        ranges = ['1:1'] + [f"{letter}{start_row}:{letter}" for letter in letters]
+        if anchor_row:
+            link_letter = column_letter(header.index('링크') + 1)
+            ranges.append(f"{link_letter}{anchor_row}")
+
+        results = self.worksheet.batch_get(ranges, major_dimension='COLUMNS')
+        header_now = [column[0] if column else '' for column in results[0]]
+        while header_now and header_now[-1] == '':
+            header_now.pop()
+        values = [result[0] if result else [] for result in results[1:len(columns) + 1]]
+        anchor = None
+        if anchor_row:
+            anchor = results[-1][0][0] if results[-1] and results[-1][0] else ''
+        return self._frame(values, columns, start_row), header_now, anchor
+
+    @staticmethod
+    def _frame(values, columns, start_row):
+        import pandas as pd
+        
+        # 열마다 끝의 빈 칸이 잘려 오므로 가장 긴 열에 맞춰 채움
+        values = values or [[]] * len(columns)
+        n_rows = max((len(column) for column in values), default=0)
+        data = {name: list(column) + [''] * (n_rows - len(column)) for name, column in zip(columns, values)}
+        return pd.DataFrame(data, columns=columns,
+                            index=pd.RangeIndex(start_row, start_row + n_rows, name='행'))
@@ -1,11 +1,19 @@
+import argparse
 import json
 import logging
 import re
+import sys
+from functools import lru_cache
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import pandas as pd
 import os
+from concurrent.futures import ProcessPoolExecutor
+# pandas, scipy, sklearn은 import에만 수 초가 걸리므로 필요한 함수 안에서 import
+# (입력이 없거나 작은 실행, --help는 이 비용을 내지 않음)
+from article_store import publication_day
+from lsh_index import LshIndex, MinHasher, candidate_pairs
+from metrics import DEFAULT_REPORT_PATH, METRICS, StageTimer, increment, timed, write_report
+from publishers import NEWSPAPER_GROUP, NEWSPAPER_PRIORITY
+from record_stream import DEFAULT_MAX_BUFFERED, JsonArrayWriter, KeywordSpool, iter_records
 
 # 로깅 설정
 logging.basicConfig(
@@ -14,257 +22,1121 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# 신문사 그룹 정의
-NEWSPAPER_GROUPS = {
-    '보수': {
-        '조선일보': 1,
-        '중앙일보': 2,
-        '동아일보': 3
-    },
-    '진보': {
-        '경향신문': 1,
-        '한겨레신문': 2,
-        '한국일보': 3
-    },
-    '경제': {
-        '매일경제': 1,
-        '한국경제': 2,
-        '서울경제': 3,
-        '아주경제': 4
-    }
-}
+# 유사도 행렬을 블록 단위로 계산할 때 한 블록의 최대 원소 수
+SIMILARITY_BLOCK_SIZE = 4_000_000
+
+# 후보 쌍 유사도를 한 번에 계산하는 쌍 수
+PAIR_BATCH_SIZE = 10000
+
+# 기사 선택 시 그룹별 대표 기사를 고르는 순서
+SELECTION_GROUPS = ['보수', '진보', '경제']
+
+# 전처리 결과에 남기는 문자열 (한글, 숫자). 나머지 문자는 모두 구분자로 취급
+TEXT_TOKEN = re.compile(r'[가-힣0-9]+')
 
-def get_newspaper_group(newspaper):
-    """신문사가 속한 그룹을 반환"""
-    for group_name, newspapers in NEWSPAPER_GROUPS.items():
-        if newspaper in newspapers:
-            return group_name
-    return '기타'
+# 발행일을 알 수 없는 기사의 날짜 번호 (발행일 구간 비교에서 모든 기사와 비교)
+UNKNOWN_DAY = -1
 
-def get_newspaper_priority(newspaper):
-    """신문사의 우선순위를 반환"""
-    for group in NEWSPAPER_GROUPS.values():
-        if newspaper in group:
-            return group[newspaper]
-    return float('inf')
+# 같은 본문의 전처리 결과를 재사용할 최대 개수 (calculate_similarity 등 단건 호출용)
+PREPROCESS_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=PREPROCESS_CACHE_SIZE)
+def _normalize(text):
+    return ' '.join(TEXT_TOKEN.findall(text))
 
 def preprocess_text(text):
-    """텍스트 전처리"""
+    """
+    텍스트 전처리: 한글, 숫자만 남기고 나머지는 공백 하나로 구분합니다.
+    ([^가-힣0-9\s]를 공백으로 바꾼 뒤 연속 공백을 줄이고 양끝을 자른 것과 같은 결과를 한 번의 스캔으로 계산)
+    """
     if not isinstance(text, str):
         return ""
-    
-    # 한글, 숫자, 공백만 남기기
-    text = re.sub(r'[^가-힣0-9\s]', ' ', text)
-    # 연속된 공백 제거
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    return _normalize(text)
 
-def calculate_similarity(text1, text2):
-    """두 텍스트 간의 코사인 유사도 계산"""
+def preprocess_texts(texts):
+    """
+    본문 목록을 전처리합니다 (preprocess_text와 같은 _normalize 사용).
+    같은 본문(여러 키워드에 걸친 같은 기사, 전재 기사)은 한 번만 계산합니다.
+    Returns:
+        list: 입력 순서의 전처리된 텍스트
+    """
+    normalized = {}
+    result = []
+    for text in texts:
+        if not isinstance(text, str):
+            result.append("")
+            continue
+        value = normalized.get(text)
+        if value is None:
+            value = normalized[text] = _normalize(text)
+        result.append(value)
+    return result
+
+def calculate_similarity(text1, text2, model=None):
+    """
+    두 텍스트 간의 코사인 유사도 계산
+    한 기사를 여러 기사와 비교할 때는 similarity.SimilarityModel을 한 번 학습(또는 로드)해
+    one_vs_many/many_vs_many로 한꺼번에 계산하세요.
+    Args:
+        model: SimilarityModel, 학습된 모델 (없으면 두 텍스트로 학습)
+    """
     if not text1 or not text2:
         return 0.0
-        
-    # 텍스트 전처리
-    text1 = preprocess_text(text1)
-    text2 = preprocess_text(text2)
     
-    vectorizer = TfidfVectorizer(
-        max_features=10000,  # 최대 특성 수 제한
-        min_df=2,  # 최소 문서 빈도
-        max_df=0.95  # 최대 문서 빈도
-    )
+    from similarity import SimilarityModel
     
     try:
-        tfidf_matrix = vectorizer.fit_transform([text1, text2])
-        similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-        return similarity
+        if model is None:
+            model = SimilarityModel.fit([text1, text2])
+        return model.similarity(text1, text2)
     except Exception as e:
         logger.error(f"유사도 계산 중 오류: {e}")
         return 0.0
 
-def find_similar_articles(group, similarity_threshold=0.5):
+# TF-IDF 어휘 수 상한
+MAX_FEATURES = 10000
+
+def vectorize_texts(texts, weights=None):
+    """
+    전처리된 텍스트 목록을 TF-IDF 희소 행렬로 변환
+    Args:
+        texts: list, 전처리된 텍스트
+        weights: array, 텍스트별 기사 수. 주어지면 같은 본문이 weights번 있는 전체 목록으로 학습한 것과
+            같은 어휘/IDF를 사용해 텍스트별 한 행씩만 계산 (collapse_duplicates 결과용)
+    """
+    with timed('dedup.vectorize'):
+        if weights is None:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            return TfidfVectorizer(max_features=MAX_FEATURES).fit_transform(texts)
+        return weighted_tfidf(texts, np.asarray(weights, dtype=np.float64))
+
+def weighted_tfidf(texts, weights, max_features=MAX_FEATURES):
+    """
+    TfidfVectorizer(max_features)와 같은 계산을 문서별 가중치(중복 수)로 수행합니다.
+    어휘 상한의 단어 빈도와 IDF의 문서 빈도, 문서 수를 가중치로 세므로 결과 행은
+    중복을 모두 넣고 학습한 TfidfVectorizer의 행과 같습니다.
+    """
+    from sklearn.feature_extraction.text import CountVectorizer
+    from sklearn.preprocessing import normalize
+    
+    vectorizer = CountVectorizer(dtype=np.float64)
+    counts, _, idf = limit_and_idf(vectorizer.fit_transform(texts).tocsr(), weights, max_features)
+    counts.data *= idf[counts.indices]
+    return normalize(counts, norm='l2', copy=False)
+
+def limit_and_idf(counts, weights, max_features=MAX_FEATURES):
+    """
+    단어 빈도 행렬에서 빈도 상위 max_features개 어휘만 남기고 IDF를 계산합니다.
+    Args:
+        counts: csr_matrix, CountVectorizer로 만든 문서×어휘 빈도 행렬
+        weights: array, 문서별 가중치(중복 수)
+    Returns:
+        tuple: (남긴 어휘의 빈도 행렬, 남긴 어휘의 원래 열 번호 배열, 어휘별 IDF 배열)
+    """
+    columns = np.arange(counts.shape[1])
+    if counts.shape[1] > max_features:
+        # CountVectorizer._limit_features와 같은 순서로 빈도 상위 어휘를 선택
+        frequencies = np.asarray(counts.T @ weights).ravel()
+        keep = np.zeros(counts.shape[1], dtype=bool)
+        keep[(-frequencies).argsort()[:max_features]] = True
+        columns = np.flatnonzero(keep)
+        counts = counts[:, columns]
+    
+    # TfidfTransformer(smooth_idf=True, norm='l2')
+    row_weights = np.repeat(weights, np.diff(counts.indptr))
+    document_frequency = np.bincount(counts.indices, weights=row_weights, minlength=counts.shape[1]) + 1.0
+    idf = np.full_like(document_frequency, fill_value=weights.sum() + 1)
+    idf /= document_frequency
+    np.log(idf, out=idf)
+    idf += 1.0
+    return counts, columns, idf
+
+def collapse_duplicates(keys):
+    """
+    키(전처리된 본문 등)가 같은 기사를 하나로 묶습니다. 원래 위치는 inverse로 보존합니다.
+    Args:
+        keys: list, 기사별 해시 가능한 키
+    Returns:
+        tuple: (대표 기사 위치 배열 (첫 등장 순), 기사별 대표 번호 배열, 대표별 기사 수 배열)
+    """
+    index = {}
+    first = []
+    inverse = np.empty(len(keys), dtype=np.int64)
+    for i, key in enumerate(keys):
+        unique = index.get(key)
+        if unique is None:
+            unique = index[key] = len(first)
+            first.append(i)
+        inverse[i] = unique
+    return np.array(first, dtype=np.int64), inverse, np.bincount(inverse, minlength=len(first))
+
+def expand_clusters(clusters, inverse):
+    """
+    대표 번호로 만든 유사 그룹을 원래 기사 위치(오름차순)로 펼칩니다.
+    같은 본문의 기사는 유사도 행/열이 같으므로 전체 기사로 묶은 결과와 같습니다.
+    """
+    if len(inverse) == 0:
+        return []
+    order = np.argsort(inverse, kind='stable')
+    members = np.split(order, np.cumsum(np.bincount(inverse))[:-1])
+    return [np.sort(np.concatenate([members[u] for u in cluster])) for cluster in clusters]
+
+def similarity_graph(tfidf_matrix, similarity_threshold=0.5):
+    """
+    유사도가 임계값을 넘는 기사 쌍만 남긴 희소 인접 행렬을 만듭니다.
+    전체 N×N 밀집 행렬 대신 행 블록 단위로 유사도를 계산하고 바로 임계값을 적용하므로
+    메모리는 SIMILARITY_BLOCK_SIZE로 제한됩니다.
+    Args:
+        tfidf_matrix: sparse matrix, 기사별 TF-IDF 벡터
+        similarity_threshold: float, 유사도 임계값
+    Returns:
+        csr_matrix: (i, j) 원소가 임계값을 넘는 코사인 유사도인 N×N 행렬
+    """
+    from scipy import sparse
+    from sklearn.preprocessing import normalize
+    from sklearn.utils.extmath import safe_sparse_dot
+    
+    matrix = normalize(sparse.csr_matrix(tfidf_matrix))
+    n = matrix.shape[0]
+    transposed = matrix.T.tocsr()
+    rows_per_block = max(1, SIMILARITY_BLOCK_SIZE // max(n, 1))
+    
+    blocks = []
+    for start in range(0, n, rows_per_block):
+        # 블록 크기만큼만 밀집 행렬로 계산하고 임계값을 넘는 원소만 희소 행렬로 보관
+        block = safe_sparse_dot(matrix[start:start + rows_per_block], transposed, dense_output=True)
+        mask = block > similarity_threshold
+        rows, cols = np.nonzero(mask)
+        blocks.append(sparse.csr_matrix((block[mask], (rows, cols)), shape=block.shape))
+    
+    if not blocks:
+        return sparse.csr_matrix((0, 0))
+    return sparse.vstack(blocks, format='csr')
+
+def window_similarity_graph(tfidf_matrix, days, window_days, similarity_threshold=0.5):
+    """
+    발행일 차이가 window_days일 이하인 기사 쌍만 비교해 similarity_graph와 같은 형식의 행렬을 만듭니다.
+    기사를 발행일 순으로 정렬하고 같은 날 기사 블록마다 앞뒤 window_days일의 기사만 계산하므로,
+    하루 기사 수가 비슷하면 계산량은 전체 기간이 아니라 기사 수에 비례합니다.
+    발행일을 알 수 없는 기사(UNKNOWN_DAY)는 모든 기사와 비교합니다.
+    Args:
+        tfidf_matrix: sparse matrix, 기사별 TF-IDF 벡터
+        days: array, 기사별 날짜 번호 (date.toordinal)
+        window_days: int, 비교할 최대 발행일 차이(일)
+        similarity_threshold: float, 유사도 임계값
+    Returns:
+        csr_matrix: 구간 안의 (i, j) 원소만 임계값을 넘는 코사인 유사도인 N×N 행렬
+    """
+    from scipy import sparse
+    from sklearn.preprocessing import normalize
+    from sklearn.utils.extmath import safe_sparse_dot
+    
+    matrix = normalize(sparse.csr_matrix(tfidf_matrix))
+    n = matrix.shape[0]
+    days = np.asarray(days, dtype=np.int64)
+    rows_per_block = max(1, SIMILARITY_BLOCK_SIZE // max(n, 1))
+    
+    # 발행일 순으로 정렬한 기사 (같은 날짜는 원래 순서)
+    known = np.flatnonzero(days != UNKNOWN_DAY)
+    known = known[np.argsort(days[known], kind='stable')]
+    known_days = days[known]
+    ordered = matrix[known]
+    
+    def edges(block, columns, row_ids, column_ids):
+        values = safe_sparse_dot(block, columns.T.tocsr(), dense_output=True)
+        mask = values > similarity_threshold
+        rows, cols = np.nonzero(mask)
+        return row_ids[rows], column_ids[cols], values[mask]
+    
+    found = []
+    starts = np.flatnonzero(np.r_[True, known_days[1:] != known_days[:-1]]) if len(known) else []
+    for start, end in zip(starts, np.r_[starts[1:], len(known)] if len(known) else []):
+        day = known_days[start]
+        left = np.searchsorted(known_days, day - window_days, side='left')
+        right = np.searchsorted(known_days, day + window_days, side='right')
+        for block_start in range(start, end, rows_per_block):
+            block_end = min(end, block_start + rows_per_block)
+            found.append(edges(ordered[block_start:block_end], ordered[left:right],
+                               known[block_start:block_end], known[left:right]))
+    
+    # 발행일을 모르는 기사는 모든 기사와 비교하고, 발행일을 아는 기사 쪽 원소는 대칭으로 추가
+    unknown = np.flatnonzero(days == UNKNOWN_DAY)
+    for block_start in range(0, len(unknown), rows_per_block):
+        block = unknown[block_start:block_start + rows_per_block]
+        rows, cols, values = edges(matrix[block], matrix, block, np.arange(n))
+        found.append((rows, cols, values))
+        mirrored = days[cols] != UNKNOWN_DAY
+        found.append((cols[mirrored], rows[mirrored], values[mirrored]))
+    
+    if not found:
+        return sparse.csr_matrix((n, n))
+    rows, cols, values = (np.concatenate(parts) for parts in zip(*found))
+    return sparse.csr_matrix((values, (rows, cols)), shape=(n, n))
+
+def window_pair_count(days, window_days):
+    """발행일 차이가 window_days일 이하인 (또는 발행일을 모르는 기사가 포함된) 기사 쌍의 수"""
+    days = np.asarray(days, dtype=np.int64)
+    unknown = int((days == UNKNOWN_DAY).sum())
+    known = np.sort(days[days != UNKNOWN_DAY])
+    within = np.searchsorted(known, known + window_days, side='right') \
+        - np.searchsorted(known, known - window_days, side='left')
+    return (int(within.sum()) - len(known)) // 2 + unknown * (unknown - 1) // 2 + unknown * len(known)
+
+def pair_similarities(matrix, left, right):
+    """정규화된 행렬에서 (left[k], right[k]) 쌍의 코사인 유사도만 계산"""
+    similarities = np.zeros(len(left))
+    for start in range(0, len(left), PAIR_BATCH_SIZE):
+        end = start + PAIR_BATCH_SIZE
+        products = matrix[left[start:end]].multiply(matrix[right[start:end]])
+        similarities[start:end] = np.asarray(products.sum(axis=1)).ravel()
+    return similarities
+
+def candidate_similarity_graph(tfidf_matrix, left, right, similarity_threshold=0.5):
+    """
+    후보 쌍(LSH 등)에 대해서만 정확한 유사도를 계산해 similarity_graph와 같은 형식의 행렬을 만듭니다.
+    후보에 없는 쌍은 유사하지 않은 것으로 간주합니다.
+    """
+    from scipy import sparse
+    from sklearn.preprocessing import normalize
+    
+    matrix = normalize(sparse.csr_matrix(tfidf_matrix))
+    n = matrix.shape[0]
+    similarities = pair_similarities(matrix, left, right)
+    keep = similarities > similarity_threshold
+    left, right, similarities = left[keep], right[keep], similarities[keep]
+    
+    # 자기 자신과의 유사도 (빈 벡터가 아닌 기사만)
+    diagonal = np.flatnonzero(np.diff(matrix.indptr) > 0)
+    rows = np.concatenate([left, right, diagonal])
+    cols = np.concatenate([right, left, diagonal])
+    data = np.concatenate([similarities, similarities, np.ones(len(diagonal))])
+    return sparse.csr_matrix((data, (rows, cols)), shape=(n, n))
+
+def greedy_clusters(graph):
+    """
+    앞 기사부터 차례로, 아직 묶이지 않은 유사 기사들을 하나의 그룹으로 묶습니다.
+    Returns:
+        list: 그룹별 기사 위치(오름차순) 배열
+    """
+    used = np.zeros(graph.shape[0], dtype=bool)
+    clusters = []
+    
+    for i in range(graph.shape[0]):
+        if used[i]:
+            continue
+        
+        neighbors = graph.indices[graph.indptr[i]:graph.indptr[i + 1]]
+        members = np.sort(neighbors[~used[neighbors]])
+        if len(members):
+            clusters.append(members)
+            used[members] = True
+    
+    return clusters
+
+def component_clusters(graph):
+    """
+    유사도 그래프의 연결 요소를 그룹으로 만듭니다. (A~B, B~C이면 A, B, C가 한 그룹)
+    Returns:
+        list: 첫 기사 위치 순으로 정렬된 그룹별 기사 위치 배열
+    """
+    from scipy.sparse.csgraph import connected_components
+    
+    _, labels = connected_components(graph, directed=False)
+    # 자기 자신과의 유사도도 없는 기사(빈 본문)는 그룹에 넣지 않음
+    has_edge = np.diff(graph.indptr) > 0
+    clusters = {}
+    for i in np.flatnonzero(has_edge):
+        clusters.setdefault(labels[i], []).append(i)
+    return [np.array(members) for members in clusters.values()]
+
+CLUSTERING_METHODS = {
+    'greedy': greedy_clusters,
+    'components': component_clusters,
+}
+
+def cluster_texts(texts, similarity_threshold=0.5, tfidf_matrix=None, clustering='greedy', hasher=None,
+                  weights=None, days=None, window_days=None):
+    """
+    전처리된 텍스트를 유사 기사 그룹으로 나눕니다.
+    Args:
+        texts: list, 전처리된 텍스트 (tfidf_matrix가 있고 hasher가 없으면 None 가능)
+        similarity_threshold: float, 유사도 임계값
+        tfidf_matrix: sparse matrix, texts 순서의 TF-IDF 벡터 (없으면 texts로 학습)
+        clustering: str, 'greedy' 또는 'components'
+        hasher: MinHasher, 주어지면 MinHash LSH 후보 쌍만 정확한 유사도로 비교
+        weights: array, texts가 collapse_duplicates로 묶은 고유 본문일 때 본문별 기사 수 (TF-IDF 학습용)
+        days: array, texts 순서의 날짜 번호 (window_days와 함께 사용)
+        window_days: int, 주어지면 발행일 차이가 이 일수 이하인 기사끼리만 비교
+    Returns:
+        list: 그룹별 기사 위치 배열
+    """
+    if tfidf_matrix is None:
+        tfidf_matrix = vectorize_texts(texts, weights)
+    
+    window = window_days is not None and days is not None
+    if window:
+        days = np.asarray(days, dtype=np.int64)
+        n = tfidf_matrix.shape[0]
+        logger.info(f"발행일 {window_days}일 이내 비교 쌍: {window_pair_count(days, window_days)}개 "
+                    f"(전체 쌍: {n * (n - 1) // 2}개)")
+    
+    if hasher is not None:
+        with timed('dedup.lsh'):
+            left, right = candidate_pairs([hasher.signature(text) for text in texts])
+        if window:
+            keep = (np.abs(days[left] - days[right]) <= window_days) \
+                | (days[left] == UNKNOWN_DAY) | (days[right] == UNKNOWN_DAY)
+            left, right = left[keep], right[keep]
+        logger.info(f"LSH 후보 쌍: {len(left)}개 (전체 쌍: {len(texts) * (len(texts) - 1) // 2}개)")
+        with timed('dedup.similarity'):
+            graph = candidate_similarity_graph(tfidf_matrix, left, right, similarity_threshold)
+    elif window:
+        with timed('dedup.similarity'):
+            graph = window_similarity_graph(tfidf_matrix, days, window_days, similarity_threshold)
+    else:
+        with timed('dedup.similarity'):
+            graph = similarity_graph(tfidf_matrix, similarity_threshold)
+    
+    with timed('dedup.cluster'):
+        clusters = CLUSTERING_METHODS[clustering](graph)
+    increment('dedup.clustered_articles', tfidf_matrix.shape[0])
+    increment('dedup.clusters', len(clusters))
+    return clusters
+
+def find_similar_articles(group, similarity_threshold=0.5, tfidf_matrix=None, clustering='greedy',
+                          hasher=None):
     """
     주어진 그룹 내에서 유사한 기사들을 찾아 그룹화합니다.
     Args:
         group: DataFrame, 같은 키워드의 기사들
         similarity_threshold: float, 유사도 임계값 (기본값: 0.5)
+        tfidf_matrix: sparse matrix, group 행 순서의 TF-IDF 벡터 (없으면 그룹 내에서 학습)
+        clustering: str, 'greedy'(기본값) 또는 'components'
+        hasher: MinHasher, 주어지면 MinHash LSH 후보 쌍만 정확한 유사도로 비교
     Returns:
         list: 유사한 기사들의 그룹 리스트
     """
-    # 텍스트 전처리
-    texts = group['내용'].apply(preprocess_text).tolist()
+    if tfidf_matrix is not None and hasher is None:
+        clusters = cluster_texts(None, similarity_threshold, tfidf_matrix, clustering)
+        return [group.iloc[members] for members in clusters]
+    
+    # 텍스트 전처리 후 같은 본문은 한 번만 벡터화/비교
+    texts = preprocess_texts(group['내용'].tolist())
+    first, inverse, counts = collapse_duplicates(texts)
+    if tfidf_matrix is not None:
+        from scipy import sparse
+        tfidf_matrix = sparse.csr_matrix(tfidf_matrix)[first]
+    clusters = cluster_texts([texts[i] for i in first], similarity_threshold, tfidf_matrix, clustering, hasher,
+                             weights=counts)
+    return [group.iloc[members] for members in expand_clusters(clusters, inverse)]
+
+def _cluster_job(job):
+    """
+    프로세스 풀 작업: (고유 본문 텍스트, 임계값, 고유 본문 TF-IDF 행렬, 그룹화 방식, LSH 여부, 기사별 고유 본문 번호,
+    고유 본문별 날짜 번호, 발행일 구간) → 그룹별 기사 위치 배열
+    """
+    texts, similarity_threshold, tfidf_matrix, clustering, lsh, inverse, days, window_days = job
+    hasher = MinHasher() if lsh else None
+    clusters = cluster_texts(texts, similarity_threshold, tfidf_matrix, clustering, hasher,
+                             weights=np.bincount(inverse), days=days, window_days=window_days)
+    return expand_clusters(clusters, inverse)
+
+def _pooled_cluster_job(job):
+    """자식 프로세스용 _cluster_job: 이 작업에서 기록한 지표를 결과와 함께 돌려줌"""
+    METRICS.reset()
+    return _cluster_job(job), METRICS.snapshot()
+
+def _job_size(job):
+    texts, _, tfidf_matrix = job[:3]
+    return tfidf_matrix.shape[0] if tfidf_matrix is not None else len(texts)
+
+def run_cluster_jobs(jobs, workers=1):
+    """
+    키워드별 그룹화 작업을 실행합니다. workers가 2 이상이면 프로세스 풀로 나누어 실행하고,
+    결과는 항상 작업 순서(키워드 순)대로 반환합니다.
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        return [_cluster_job(job) for job in jobs]
+    
+    # 큰 그룹부터 제출해 마지막에 큰 작업 하나만 남는 상황을 줄임
+    order = sorted(range(len(jobs)), key=lambda i: -_job_size(jobs[i]))
+    results = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        futures = {executor.submit(_pooled_cluster_job, jobs[i]): i for i in order}
+        for future, i in futures.items():
+            results[i], snapshot = future.result()
+            METRICS.merge(snapshot)
+    return results
+
+def find_history_duplicates(keyword, group, index, similarity_threshold=0.5, texts=None):
+    """
+    이전 실행에서 인덱스에 저장된 같은 키워드의 기사와 유사한 기사를 찾습니다.
+    LSH 버킷을 공유하는 과거 기사에 대해서만 정확한 유사도를 계산합니다.
+    Args:
+        keyword: str, 키워드
+        group: DataFrame, 같은 키워드의 새 기사들
+        index: LshIndex, 과거 기사 인덱스
+        similarity_threshold: float, 유사도 임계값
+        texts: list, group 행 순서의 전처리된 텍스트 (없으면 여기서 전처리)
+    Returns:
+        ndarray: 과거 기사와 중복인 행이면 True인 bool 배열
+    """
+    if texts is None:
+        texts = preprocess_texts(group['내용'].tolist())
+    return history_duplicates(keyword, texts, group['링크'].tolist(), index, similarity_threshold)
+
+def history_duplicates(keyword, texts, links, index, similarity_threshold=0.5):
+    """find_history_duplicates와 같지만 DataFrame 대신 전처리된 텍스트와 링크 목록을 받습니다."""
+    signatures = [index.hasher.signature(text) for text in texts]
+    
+    # 새 기사별 후보 과거 기사 (같은 링크는 같은 기사이므로 제외)
+    past_texts = []
+    left, right = [], []
+    for i, signature in enumerate(signatures):
+        for past_link, past_text in index.query(keyword, signature):
+            if past_link == links[i]:
+                continue
+            left.append(i)
+            right.append(len(texts) + len(past_texts))
+            past_texts.append(past_text)
     
-    # TF-IDF 벡터화
-    vectorizer = TfidfVectorizer(max_features=10000)
-    tfidf_matrix = vectorizer.fit_transform(texts)
+    duplicates = np.zeros(len(texts), dtype=bool)
+    if left:
+        from sklearn.preprocessing import normalize
+        matrix = normalize(vectorize_texts(texts + past_texts).tocsr())
+        similarities = pair_similarities(matrix, np.array(left), np.array(right))
+        duplicates[np.array(left)[similarities > similarity_threshold]] = True
     
-    # 코사인 유사도 계산
-    similarity_matrix = cosine_similarity(tfidf_matrix)
+    # 이번 기사들을 다음 실행을 위해 인덱스에 추가
+    for link, text, signature in zip(links, texts, signatures):
+        index.add(keyword, link, text, signature)
+    return duplicates
+
+def _is_missing(value):
+    """DataFrame에서 결측값(NaN)이 되는 값"""
+    return value is None or (isinstance(value, float) and value != value)
+
+class ArticleTable:
+    """
+    중복제거에 필요한 값(키워드, 신문사, 링크, 본문, 길이)만 열 단위로 담은 기사 목록입니다.
+    DataFrame을 만들지 않고 원본 dict를 참조하며, 키워드/신문사 문자열은 intern해 같은 값을 공유합니다.
+    row()는 pd.DataFrame(records).to_dict('records')의 행과 같습니다
+    (모든 기사의 키를 처음 나온 순서로 합친 열, 없는 키와 None은 NaN).
+    문자열이 아닌 값이 있는 등 이 규칙으로 재현할 수 없는 입력은 DataFrame으로 한 번 정규화합니다.
+    Args:
+        records: list, 기사 dict 목록
+        normalized: bool, True이면 records가 이미 DataFrame.to_dict('records') 결과이므로 그대로 사용
+    """
     
-    # 유사한 기사 그룹화
-    similar_groups = []
-    used_indices = set()
+    __slots__ = ('records', 'columns', 'keywords', 'newspapers', 'links', 'texts', 'lengths', '_key')
     
-    for i in range(len(texts)):
-        if i in used_indices:
-            continue
-            
-        # 유사도가 threshold(0.5) 이상인 기사 찾기
-        similar_indices = np.where(similarity_matrix[i] > similarity_threshold)[0]
-        similar_indices = [idx for idx in similar_indices if idx not in used_indices]
+    def __init__(self, records, normalized=False):
+        columns, simple = self._columns(records)
+        if not simple and not normalized:
+            import pandas as pd
+            records = pd.DataFrame(records).to_dict('records')
+            normalized = True
+        self.records = records
+        self.columns = columns
+        # 모든 기사가 이 순서의 키를 가지고 결측값이 없으면 row()는 원본 dict를 복사하기만 함
+        self._key = None if normalized else tuple(columns)
         
-        if similar_indices:
-            group_articles = group.iloc[similar_indices]
-            similar_groups.append(group_articles)
-            used_indices.update(similar_indices)
+        intern = sys.intern
+        nan = float('nan')
+        self.keywords = [None if _is_missing(v := record.get('키워드')) else intern(v) if isinstance(v, str) else v
+                         for record in records]
+        self.newspapers = [nan if _is_missing(v := record.get('신문사')) else intern(v) if isinstance(v, str) else v
+                           for record in records]
+        self.links = [record.get('링크', nan) for record in records]
+        self.texts = [record.get('내용', nan) for record in records]
+        # Series.str.len()과 같이 본문이 없는 기사가 하나라도 있으면 모든 길이가 float
+        lengths = [len(text) if isinstance(text, str) else nan for text in self.texts]
+        self.lengths = np.array(lengths, dtype=np.int64 if nan not in lengths else np.float64)
     
-    return similar_groups
+    @staticmethod
+    def _columns(records):
+        """(처음 나온 순서로 합친 키 목록, 값이 모두 문자열/결측값이고 열마다 문자열이 하나 이상인지)"""
+        columns = {}
+        has_text = set()
+        simple = True
+        for record in records:
+            for key, value in record.items():
+                if key not in columns:
+                    columns[key] = None
+                if isinstance(value, str):
+                    has_text.add(key)
+                elif not _is_missing(value):
+                    simple = False
+        return list(columns), simple and len(has_text) == len(columns)
+    
+    @classmethod
+    def from_frame(cls, df):
+        return cls(df.to_dict('records'), normalized=True)
+    
+    def __len__(self):
+        return len(self.records)
+    
+    def groups(self):
+        """
+        키워드별 기사 위치 (DataFrame.groupby('키워드').indices와 같이 키워드 정렬, 키워드 없는 기사 제외)
+        Returns:
+            list: (키워드, 위치 배열) 목록
+        """
+        positions = {}
+        for i, keyword in enumerate(self.keywords):
+            if keyword is not None:
+                positions.setdefault(keyword, []).append(i)
+        return [(keyword, np.array(positions[keyword], dtype=np.int64)) for keyword in sorted(positions)]
+    
+    def row(self, i):
+        """출력용 기사 dict (새 dict)"""
+        record = self.records[i]
+        if self._key is None or (tuple(record) == self._key and not any(map(_is_missing, record.values()))):
+            return dict(record)
+        nan = float('nan')
+        row = {}
+        for column in self.columns:
+            value = record.get(column, nan)
+            row[column] = nan if value is None else value
+        return row
+    
+    def days(self):
+        """기사별 발행일의 날짜 번호 배열 (알 수 없는 발행일은 UNKNOWN_DAY). 같은 발행일 문자열은 한 번만 해석"""
+        parsed = {}
+        days = np.full(len(self.records), UNKNOWN_DAY, dtype=np.int64)
+        for i, record in enumerate(self.records):
+            value = record.get('발행일')
+            if not isinstance(value, str):
+                continue
+            day = parsed.get(value)
+            if day is None:
+                day = parsed[value] = publication_day(value) or UNKNOWN_DAY
+            days[i] = day
+        return days
+    
+    def selection_arrays(self):
+        """select_articles_from_arrays에 넘길 기사별 (신문사 번호, 신문사 그룹 번호, 우선순위, -길이)"""
+        return _selection_arrays(self.newspapers, self.lengths)
+
+def _selection_arrays(newspapers, lengths):
+    """
+    기사별 신문사 값에서 선택 기준 배열을 만듭니다.
+    신문사 번호는 처음 나온 순서 (pd.factorize와 같이 결측값은 -1)
+    """
+    codes = {}
+    paper_codes = np.array([-1 if _is_missing(newspaper) else codes.setdefault(newspaper, len(codes))
+                            for newspaper in newspapers], dtype=np.int64)
+    group_index = {newspaper: SELECTION_GROUPS.index(group)
+                   for newspaper, group in NEWSPAPER_GROUP.items() if group in SELECTION_GROUPS}
+    group_codes = np.array([group_index.get(newspaper, len(SELECTION_GROUPS)) for newspaper in newspapers],
+                           dtype=np.int64)
+    priorities = np.array([NEWSPAPER_PRIORITY.get(newspaper, np.inf) for newspaper in newspapers], dtype=float)
+    return paper_codes, group_codes, priorities, -np.asarray(lengths, dtype=float)
+
+def select_from_clusters(newspapers, lengths, clusters):
+    """
+    모든 유사 그룹에서 한 번에 기사를 선택합니다.
+    그룹(보수/진보/경제)마다 가장 긴 기사(같으면 신문사 우선순위, 그다음 원래 순서)를 고르고,
+    3개 미만이면 이미 선택된 신문사를 제외한 나머지 기사에서 같은 순서로 채웁니다.
+    Args:
+        newspapers: Series, 기사별 신문사
+        lengths: Series, 기사별 본문 길이
+        clusters: list, 유사 그룹별 기사 위치 배열
+    Returns:
+        list: 유사 그룹별 선택된 기사 위치 배열 (선택 순서)
+    """
+    if not clusters:
+        return []
+    return select_from_arrays(_selection_arrays(newspapers.tolist(), lengths.to_numpy(dtype=float)), clusters)
+
+def select_from_arrays(arrays, clusters):
+    """
+    select_from_clusters와 같지만 기사별 선택 기준 배열(_selection_arrays 결과)을 받습니다.
+    Returns:
+        list: 유사 그룹별 선택된 기사 위치 배열 (선택 순서)
+    """
+    if not clusters:
+        return []
+    all_paper_codes, all_group_codes, all_priorities, all_neg_lengths = arrays
+    sizes = np.array([len(members) for members in clusters])
+    members = np.concatenate(clusters).astype(np.int64)
+    cluster_ids = np.repeat(np.arange(len(clusters)), sizes)
+    # 그룹 안에서의 원래 순서 (정렬 시 마지막 기준)
+    order = np.arange(len(members)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    
+    # 선택 대상 기사 안에서 처음 나온 순서로 신문사 번호를 다시 매김 (pd.factorize(newspapers.iloc[members]))
+    paper_codes = all_paper_codes[members]
+    valid = paper_codes >= 0
+    unique_codes, first_seen, inverse = np.unique(paper_codes[valid], return_index=True, return_inverse=True)
+    renumber = np.empty(len(unique_codes), dtype=np.int64)
+    renumber[np.argsort(first_seen)] = np.arange(len(unique_codes))
+    paper_codes = np.full(len(members), -1, dtype=np.int64)
+    paper_codes[valid] = renumber[inverse]
+    group_codes = all_group_codes[members]
+    priorities = all_priorities[members]
+    neg_lengths = all_neg_lengths[members]
+
+    # 1단계: (유사 그룹, 신문사 그룹)별 첫 번째 기사
+    in_group = np.flatnonzero(group_codes < len(SELECTION_GROUPS))
+    ranked = in_group[np.lexsort((order[in_group], priorities[in_group], neg_lengths[in_group],
+                                  group_codes[in_group], cluster_ids[in_group]))]
+    first = np.ones(len(ranked), dtype=bool)
+    first[1:] = (cluster_ids[ranked][1:] != cluster_ids[ranked][:-1]) | \
+                (group_codes[ranked][1:] != group_codes[ranked][:-1])
+    picked = ranked[first]
+    picked_counts = np.bincount(cluster_ids[picked], minlength=len(clusters))
+
+    # 2단계: 선택된 신문사를 제외한 기사에서 부족한 수만큼 추가
+    # (유사 그룹, 신문사) 키. 결측 신문사(-1)가 다른 유사 그룹의 키와 겹치지 않도록 신문사 번호에 1을 더함
+    n_papers = paper_codes.max() + 2
+    keys = cluster_ids * n_papers + paper_codes + 1
+    used = np.isin(keys, keys[picked])
+    rest = np.flatnonzero(~used & (picked_counts[cluster_ids] < 3))
+    rest = rest[np.lexsort((order[rest], priorities[rest], neg_lengths[rest], cluster_ids[rest]))]
+    # 유사 그룹 안에서의 순위 (rest는 유사 그룹 순으로 정렬되어 있으므로 그룹 시작 위치와의 차이)
+    rest_ids = cluster_ids[rest]
+    starts = np.flatnonzero(np.concatenate([[True], rest_ids[1:] != rest_ids[:-1]]))
+    rest_rank = np.arange(len(rest)) - np.repeat(starts, np.diff(np.append(starts, len(rest))))
+    keep = rest_rank < 3 - picked_counts[cluster_ids[rest]]
+    extra = rest[keep]
+
+    # 유사 그룹 → (1단계: 그룹 순서, 2단계: 길이 순위) 순으로 정렬 후 그룹별로 나눔
+    chosen = np.concatenate([picked, extra])
+    stage = np.concatenate([np.zeros(len(picked), dtype=np.int64), np.ones(len(extra), dtype=np.int64)])
+    sub_order = np.concatenate([group_codes[picked], rest_rank[keep]])
+    chosen = chosen[np.lexsort((sub_order, stage, cluster_ids[chosen]))]
+    counts = np.bincount(cluster_ids[chosen], minlength=len(clusters))
+    return np.split(members[chosen], np.cumsum(counts)[:-1])
 
 def select_articles_by_length(group_articles):
     """기사 길이와 신문사 우선순위를 고려하여 기사 선택"""
     if len(group_articles) == 0:
         return None
     
-    # 기사 길이 계산 (copy()를 사용하여 경고 방지)
     group_articles = group_articles.copy()
     group_articles['길이'] = group_articles['내용'].str.len()
-    
-    # 신문사 그룹별로 가장 긴 기사 선택
-    selected_articles = []
-    used_groups = set()
-    
-    for group_name in ['보수', '진보', '경제']:
-        group_mask = group_articles['신문사'].isin(NEWSPAPER_GROUPS[group_name].keys())
-        group_articles_subset = group_articles[group_mask].copy()  # copy() 사용
-        
-        if len(group_articles_subset) > 0:
-            # 가장 긴 기사 선택
-            candidates = group_articles_subset.sort_values(['길이', '신문사'], 
-                                                         key=lambda x: x.map(get_newspaper_priority) if x.name == '신문사' else x,
-                                                         ascending=[False, True])
-            
-            # 기사 길이 차이가 20% 이상이면 길이를 우선
-            if len(candidates) > 1:
-                max_length = candidates.iloc[0]['길이']
-                second_length = candidates.iloc[1]['길이']
-                if (max_length - second_length) / max_length > 0.2:
-                    selected_article = candidates.iloc[0].to_dict()
-                else:
-                    # 길이가 비슷하면 신문사 우선순위로 선택
-                    selected_article = candidates.iloc[0].to_dict()
-            else:
-                selected_article = candidates.iloc[0].to_dict()
-            
-            selected_articles.append(selected_article)
-            used_groups.add(group_name)
-            logger.info(f"{group_name}그룹에서 기사 선택: {selected_article['신문사']}")
-    
-    # 선택된 기사가 3개 미만이면 나머지 기사 중에서 길이가 긴 순으로 추가
-    if len(selected_articles) < 3:
-        remaining_articles = group_articles[~group_articles['신문사'].isin([a['신문사'] for a in selected_articles])].copy()  # copy() 사용
-        remaining_articles = remaining_articles.sort_values(['길이', '신문사'], 
-                                                          key=lambda x: x.map(get_newspaper_priority) if x.name == '신문사' else x,
-                                                          ascending=[False, True])
-        
-        for _, article in remaining_articles.iterrows():
-            if len(selected_articles) >= 3:
-                break
-            selected_articles.append(article.to_dict())
-            logger.info(f"추가 선택: {article['신문사']}")
-    
-    return selected_articles
+    with timed('dedup.select'):
+        selected = select_from_clusters(group_articles['신문사'], group_articles['길이'],
+                                        [np.arange(len(group_articles))])[0]
+    return group_articles.iloc[selected].to_dict('records')
 
-def deduplicate_articles(df):
-    """기사 중복제거"""
+def deduplicate_articles(df, similarity_threshold=0.5, corpus_tfidf=False, clustering='greedy',
+                         lsh=False, history_index=None, workers=1, cluster_store=None, window_days=None):
+    """
+    기사 중복제거
+    Args:
+        df: DataFrame, 기사 목록
+        similarity_threshold: float, 유사도 임계값
+        corpus_tfidf: bool, True이면 TF-IDF를 전체 기사로 한 번만 학습하고 키워드별로 나누어 사용
+        clustering: str, 유사 기사 그룹화 방식 ('greedy' 또는 'components')
+        lsh: bool, True이면 MinHash LSH 후보 쌍만 비교 (근사)
+        history_index: LshIndex, 주어지면 과거 실행의 기사와 중복인 새 기사를 제외하고
+            이번 기사를 인덱스에 추가 (증분 실행용)
+        workers: int, 키워드별 그룹화에 사용할 프로세스 수 (1이면 현재 프로세스에서 실행)
+        cluster_store: ClusterStore, 주어지면 이전 실행의 기사 묶음에 속하는 새 기사를 제외하고
+            이번 유사 그룹을 새 묶음으로 저장 (증분 실행용)
+        window_days: int, 주어지면 같은 키워드 안에서도 발행일 차이가 이 일수 이하인 기사끼리만 비교
+            (발행일을 알 수 없는 기사는 모든 기사와 비교)
+    Returns:
+        list: 중복제거된 기사 목록
+    """
+    return deduplicate_table(ArticleTable.from_frame(df), similarity_threshold=similarity_threshold,
+                             corpus_tfidf=corpus_tfidf, clustering=clustering, lsh=lsh,
+                             history_index=history_index, workers=workers, cluster_store=cluster_store,
+                             window_days=window_days)
+
+def deduplicate_table(table, similarity_threshold=0.5, corpus_tfidf=False, clustering='greedy',
+                      lsh=False, history_index=None, workers=1, cluster_store=None, window_days=None):
+    """
+    deduplicate_articles와 같지만 DataFrame 대신 ArticleTable을 받습니다. 옵션은 deduplicate_articles와 같습니다.
+    Returns:
+        list: 중복제거된 기사 목록
+    """
     logger.info("기사 중복제거 시작...")
     
     # 키워드별로 그룹화
-    grouped = df.groupby('키워드')
+    grouped = table.groups()
     deduplicated_rows = []
     
-    for keyword, group in grouped:
+    # 본문 전처리는 기사마다 한 번만 (이후 단계는 기사 위치로 전처리 결과를 사용)
+    with timed('dedup.preprocess'):
+        texts = preprocess_texts(table.texts)
+    
+    # 발행일 구간 비교: 발행일은 여기서 한 번만 날짜 번호로 바꿈
+    days = table.days() if window_days is not None else None
+    
+    # 전체 TF-IDF는 고유 본문마다 한 번만 계산하고, 같은 본문이 여러 키워드에 있으면 같은 행을 사용
+    corpus_matrix = None
+    if corpus_tfidf:
+        corpus_first, corpus_inverse, corpus_counts = collapse_duplicates(texts)
+        corpus_matrix = vectorize_texts([texts[i] for i in corpus_first], corpus_counts).tocsr()
+        logger.info(f"전체 TF-IDF 학습 완료. 기사 {len(table)}개, 고유 본문 {len(corpus_first)}개, "
+                    f"행렬 크기: {corpus_matrix.shape}")
+    
+    if cluster_store is not None:
+        from cluster_store import assign_to_clusters, open_clusters
+    
+    # 기사 묶음 저장소의 모델로 전체 기사를 한 번만 벡터화 (처음 실행이면 이번 기사로 모델 학습)
+    store_vectors = None
+    if cluster_store is not None:
+        with timed('dedup.cluster_store'):
+            store_vectors = cluster_store.model(texts).transform(texts)
+    
+    # 키워드별 입력 준비 (과거 기사와 중복이거나 이전 실행의 기사 묶음에 속하는 기사 제외)
+    prepared = []
+    stored_matches = {}
+    for keyword, positions in grouped:
+        excluded = 0
+        if history_index is not None:
+            duplicates = history_duplicates(keyword, [texts[i] for i in positions],
+                                            [table.links[i] for i in positions], history_index,
+                                            similarity_threshold)
+            excluded = int(duplicates.sum())
+            if excluded:
+                positions = positions[~duplicates]
+        if store_vectors is not None:
+            with timed('dedup.cluster_store'):
+                assigned = assign_to_clusters(keyword, store_vectors[positions], cluster_store,
+                                              similarity_threshold)
+            if assigned.any():
+                stored_matches[keyword] = int(assigned.sum())
+                increment('dedup.stored_cluster_matches', stored_matches[keyword])
+                excluded += stored_matches[keyword]
+                positions = positions[~assigned]
+        prepared.append((keyword, positions, excluded))
+    
+    # 3개 이상인 키워드만 유사도 그룹화 작업으로 보냄 (기사 대신 텍스트/행렬만 전달)
+    # 같은 본문(전처리 결과)의 기사는 하나로 묶어 고유 본문만 벡터화/비교하고, 결과를 원래 위치로 펼침
+    # (발행일 구간 비교에서는 발행일도 같은 기사만 묶음)
+    jobs = []
+    exact_duplicates = 0
+    for keyword, positions, _ in prepared:
+        if len(positions) < 3:
+            continue
+        job_texts = tfidf_matrix = job_days = None
+        if corpus_matrix is not None:
+            ids = corpus_inverse[positions]
+            keys = ids.tolist() if days is None else list(zip(ids.tolist(), days[positions].tolist()))
+            first, inverse, _ = collapse_duplicates(keys)
+            tfidf_matrix = corpus_matrix[ids[first]]
+            if lsh:
+                job_texts = [texts[i] for i in positions[first]]
+        else:
+            keys = [texts[i] for i in positions]
+            if days is not None:
+                keys = list(zip(keys, days[positions].tolist()))
+            first, inverse, _ = collapse_duplicates(keys)
+            job_texts = [texts[i] for i in positions[first]]
+        if days is not None:
+            job_days = days[positions[first]]
+        exact_duplicates += len(inverse) - len(first)
+        jobs.append((job_texts, similarity_threshold, tfidf_matrix, clustering, lsh, inverse, job_days,
+                     window_days))
+    
+    if exact_duplicates:
+        increment('dedup.exact_duplicates', exact_duplicates)
+        logger.info(f"본문이 같은 기사 {exact_duplicates}개를 묶어 유사도 계산에서 한 번만 비교합니다.")
+    
+    if workers > 1:
+        logger.info(f"{len(jobs)}개 키워드를 {workers}개 프로세스로 그룹화합니다.")
+    results = iter(run_cluster_jobs(jobs, workers))
+    
+    # 모든 키워드의 유사 그룹을 기사 위치로 모아 한 번에 기사 선택
+    keyword_clusters = []
+    for keyword, positions, _ in prepared:
+        if len(positions) < 3:
+            keyword_clusters.append(None)
+            continue
+        keyword_clusters.append([positions[members] for members in next(results)])
+    
+    # 이번 유사 그룹(3개 미만 키워드는 기사 하나씩)을 다음 실행을 위한 새 묶음으로 저장
+    if store_vectors is not None:
+        with timed('dedup.cluster_store'):
+            opened = 0
+            for (keyword, positions, _), clusters in zip(prepared, keyword_clusters):
+                if clusters is None:
+                    clusters = [np.array([i]) for i in positions]
+                opened += open_clusters(keyword, store_vectors, clusters, table.links, cluster_store)
+            cluster_store.commit()
+        increment('dedup.stored_clusters_opened', opened)
+        logger.info(f"기사 묶음 저장소: 새 묶음 {opened}개 추가 (전체 {len(cluster_store)}개)")
+    
+    length_values = table.lengths.tolist()
+    all_clusters = [members for clusters in keyword_clusters if clusters for members in clusters]
+    with timed('dedup.select'):
+        selections = iter(select_from_arrays(table.selection_arrays(), all_clusters))
+    
+    for (keyword, positions, excluded), clusters in zip(prepared, keyword_clusters):
         logger.info(f"\n키워드: {keyword}")
-        logger.info(f"기사 수: {len(group)}")
+        logger.info(f"기사 수: {len(positions) + excluded}")
+        if excluded - stored_matches.get(keyword, 0):
+            logger.info(f"과거 기사와 중복: {excluded - stored_matches.get(keyword, 0)}개 제외")
+        if stored_matches.get(keyword):
+            logger.info(f"이전 실행의 기사 묶음에 속함: {stored_matches[keyword]}개 제외")
         
-        if len(group) < 3:
+        if clusters is None:
             logger.info("3개 미만이므로 모두 포함")
-            deduplicated_rows.extend(group.to_dict('records'))
+            deduplicated_rows.extend(table.row(i) for i in positions)
             continue
-            
-        # 유사도 기반 그룹화
-        similar_groups = find_similar_articles(group)
         
-        # 각 유사 그룹에서 기사 선택
-        for group_idx, group_articles in enumerate(similar_groups, 1):
-            logger.info(f"\n유사 그룹 {group_idx} 처리 중...")
-            selected_articles = select_articles_by_length(group_articles)
-            if selected_articles:
-                deduplicated_rows.extend(selected_articles)
-                logger.info(f"선택된 기사 수: {len(selected_articles)}")
-    
-    logger.info(f"\n중복제거 완료. 원본: {len(df)}개, 중복제거 후: {len(deduplicated_rows)}개")
+        # 각 유사 그룹에서 선택된 기사 ('길이' 포함)
+        selected_count = 0
+        for _ in clusters:
+            for i in next(selections):
+                row = table.row(i)
+                row['길이'] = length_values[i]
+                deduplicated_rows.append(row)
+                selected_count += 1
+        logger.info(f"유사 그룹 {len(clusters)}개에서 기사 {selected_count}개 선택")
+    
+    increment('dedup.input', len(table))
+    increment('dedup.output', len(deduplicated_rows))
+    logger.info(f"\n중복제거 완료. 원본: {len(table)}개, 중복제거 후: {len(deduplicated_rows)}개")
+    return deduplicated_rows
+
+def merge_deduplicated(existing_rows, new_rows):
+    """
+    기존 중복제거 결과에 새 결과를 병합합니다.
+    기존 기사는 다시 계산하지 않으며, 이미 있는 링크의 기사는 추가하지 않습니다.
+    Args:
+        existing_rows: list, 기존 news_data.json의 기사 목록
+        new_rows: list, 새 행만으로 중복제거한 기사 목록
+    Returns:
+        list: 키워드 순으로 정렬된 병합 결과
+    """
+    existing_links = {row.get('링크') for row in existing_rows}
+    added = [row for row in new_rows if row.get('링크') not in existing_links]
+    logger.info(f"병합: 기존 {len(existing_rows)}개, 새 기사 {len(added)}개 추가 "
+                f"(이미 있는 링크 {len(new_rows) - len(added)}개 제외)")
+    # 키워드별 블록 순서를 유지 (sorted는 안정 정렬이므로 같은 키워드 내 순서는 그대로)
+    return sorted(existing_rows + added, key=lambda row: row['키워드'])
+
+# crawler.py가 남기는 체크포인트 파일과 최종 결과 파일
+INPUT_FILE = 'temp_news_data.json'
+OUTPUT_FILE = 'news_data.json'
+
+def load_articles(input_file=INPUT_FILE):
+    """
+    크롤링 결과(체크포인트) 파일을 읽습니다.
+    Returns:
+        list: 기사 목록
+    """
+    if not os.path.exists(input_file):
+        raise FileNotFoundError(f"{input_file} 파일이 존재하지 않습니다.")
+    
+    # 파일 크기 확인
+    file_size = os.path.getsize(input_file)
+    if file_size == 0:
+        raise ValueError(f"{input_file} 파일이 비어있습니다.")
+    
+    logger.info(f"입력 파일 크기: {file_size} bytes")
+    
+    # JSON 데이터 로드
+    with open(input_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    logger.info(f"JSON 파일 로드 완료. 기사 수: {len(data)}")
+    return data
+
+def deduplicate_records(records, incremental=False, corpus_tfidf=False, clustering='greedy', lsh=False,
+                        history=False, workers=1, clusters=False, window_days=None):
+    """
+    기사 목록(dict)을 중복제거합니다. 옵션은 main과 같습니다.
+    Returns:
+        list: 중복제거된 기사 목록
+    """
+    if not records:
+        logger.info("중복제거할 기사가 없습니다.")
+        return []
+    
+    # DataFrame 대신 필요한 값만 담은 기사 목록으로 변환 (원본 dict는 복사하지 않음)
+    table = ArticleTable(records)
+    logger.info(f"기사 목록 생성 완료. 행 수: {len(table)}")
+    
+    # 과거 기사 인덱스는 새 기사만 들어오는 증분 실행에서만 사용
+    history_index = None
+    if history:
+        if incremental:
+            history_index = LshIndex()
+            logger.info(f"과거 기사 인덱스 로드 완료. 기사 수: {len(history_index)}")
+        else:
+            logger.warning("--history는 --incremental과 함께 사용할 때만 적용됩니다.")
+    
+    # 이전 실행의 기사 묶음도 새 기사만 들어오는 증분 실행에서만 사용
+    cluster_store = None
+    if clusters:
+        if incremental:
+            from cluster_store import ClusterStore
+            cluster_store = ClusterStore()
+            logger.info(f"기사 묶음 저장소 로드 완료. 묶음 수: {len(cluster_store)}")
+        else:
+            logger.warning("--clusters는 --incremental과 함께 사용할 때만 적용됩니다.")
+    
+    try:
+        deduplicated_rows = deduplicate_table(table, corpus_tfidf=corpus_tfidf, clustering=clustering,
+                                              lsh=lsh, history_index=history_index, workers=workers,
+                                              cluster_store=cluster_store, window_days=window_days)
+    finally:
+        if history_index is not None:
+            history_index.close()
+        if cluster_store is not None:
+            cluster_store.close()
+    
+    logger.info(f"중복제거 완료. 원본: {len(table)}개, 중복제거 후: {len(deduplicated_rows)}개")
     return deduplicated_rows
 
-def main():
+def write_articles(result, output_file=OUTPUT_FILE, incremental=False):
+    """
+    중복제거 결과를 저장합니다. 증분 모드에서는 기존 결과에 새 기사만 병합합니다.
+    Returns:
+        list: 저장한 기사 목록
+    """
+    if incremental and os.path.exists(output_file):
+        with open(output_file, 'r', encoding='utf-8') as f:
+            existing_rows = json.load(f)
+        result = merge_deduplicated(existing_rows, result)
+    
+    # 결과를 JSON 파일로 저장
+    with timed('write.news_data'), open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    increment('write.bytes', os.path.getsize(output_file))
+    
+    logger.info(f"중복제거 결과를 {output_file}에 저장했습니다. 파일 크기: {os.path.getsize(output_file)} bytes")
+    return result
+
+def stream_deduplicate(input_file=INPUT_FILE, output_file=OUTPUT_FILE, incremental=False,
+                       max_buffered=DEFAULT_MAX_BUFFERED, corpus_tfidf=False, clustering='greedy', lsh=False,
+                       history=False, workers=1, clusters=False, window_days=None):
+    """
+    입력 파일을 한 건씩 읽어 키워드별로 모은 뒤, 키워드 하나씩 중복제거해 바로 씁니다.
+    메모리에는 버퍼(max_buffered건)와 처리 중인 키워드 하나만 올라가며,
+    결과는 write_articles(deduplicate_records(...))와 같습니다.
+    Args:
+        input_file: str, 크롤링 결과 파일 (JSON 배열 또는 JSON Lines)
+        output_file: str, 결과 파일 (증분 모드에서는 기존 결과와 병합)
+        max_buffered: int, 키워드별 임시 파일로 내보내기 전까지 메모리에 둘 기사 수
+        나머지 옵션은 main과 같음 (corpus_tfidf, workers, clusters는 키워드 단위 처리라 사용하지 않음)
+    Returns:
+        int: 저장한 기사 수
+    """
+    if corpus_tfidf:
+        logger.warning("스트리밍 모드에서는 --corpus-tfidf를 사용할 수 없어 키워드별 TF-IDF를 사용합니다.")
+    if workers > 1:
+        logger.warning("스트리밍 모드는 키워드를 차례로 처리하므로 --workers를 사용하지 않습니다.")
+    if clusters:
+        # 첫 키워드의 기사만으로 모델 어휘를 학습하게 되므로 사용하지 않음
+        logger.warning("스트리밍 모드에서는 --clusters를 사용할 수 없습니다.")
+    
+    history_index = None
+    if history:
+        if incremental:
+            history_index = LshIndex()
+        else:
+            logger.warning("--history는 --incremental과 함께 사용할 때만 적용됩니다.")
+    
     try:
-        # JSON 파일 읽기
-        input_file = 'temp_news_data.json'
-        logger.info(f"입력 파일: {input_file}")
-        
-        if not os.path.exists(input_file):
-            raise FileNotFoundError(f"{input_file} 파일이 존재하지 않습니다.")
-        
-        # 파일 크기 확인
-        file_size = os.path.getsize(input_file)
-        if file_size == 0:
-            raise ValueError(f"{input_file} 파일이 비어있습니다.")
-        
-        logger.info(f"입력 파일 크기: {file_size} bytes")
-        
-        # 파일 내용 확인
-        with open(input_file, 'r', encoding='utf-8') as f:
-            content = f.read(500)
-            logger.info(f"입력 파일 내용 시작 부분:\n{content}")
-        
-        # JSON 데이터 로드
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        logger.info(f"JSON 파일 로드 완료. 기사 수: {len(data)}")
-        
-        # DataFrame으로 변환
-        df = pd.DataFrame(data)
-        logger.info(f"DataFrame 생성 완료. 행 수: {len(df)}")
-        
-        # 중복제거
-        deduplicated_rows = deduplicate_articles(df)
-        
-        # 결과를 JSON 형식으로 변환
-        result = deduplicated_rows
-        logger.info(f"중복제거 완료. 원본: {len(df)}개, 중복제거 후: {len(result)}개")
+        with KeywordSpool(max_buffered) as new_spool, KeywordSpool(max_buffered) as existing_spool:
+            for record in iter_records(input_file):
+                new_spool.add(record)
+            logger.info(f"입력 기사 {sum(new_spool.counts.values())}개, 키워드 {len(new_spool.counts)}개")
+            
+            # 증분 모드: 기존 결과도 키워드별로 모아 merge_deduplicated와 같은 순서로 병합
+            existing_links = set()
+            if incremental and os.path.exists(output_file):
+                for record in iter_records(output_file):
+                    existing_links.add(record.get('링크'))
+                    existing_spool.add(record)
+            
+            with JsonArrayWriter(output_file) as writer:
+                for keyword in sorted(set(new_spool.counts) | set(existing_spool.counts)):
+                    for record in existing_spool.records(keyword):
+                        writer.write(record)
+                    if keyword not in new_spool:
+                        continue
+                    group = ArticleTable(list(new_spool.records(keyword)))
+                    for row in deduplicate_table(group, clustering=clustering, lsh=lsh,
+                                                 history_index=history_index, window_days=window_days):
+                        if row.get('링크') not in existing_links:
+                            writer.write(row)
+    finally:
+        if history_index is not None:
+            history_index.close()
+    
+    increment('write.bytes', os.path.getsize(output_file))
+    logger.info(f"중복제거 결과를 {output_file}에 저장했습니다. 기사 수: {writer.count}")
+    return writer.count
+
+def main(incremental=False, corpus_tfidf=False, clustering='greedy', lsh=False, history=False, workers=1,
+         stream=False, max_buffered=DEFAULT_MAX_BUFFERED, report=None, profile=None, clusters=False,
+         window_days=None):
+    """
+    체크포인트 파일(temp_news_data.json)만으로 중복제거를 다시 실행합니다.
+    report가 주어지면 단계별 시간과 지표를 실행 보고서로 저장하고, profile에 포함된 단계는 cProfile로 실행합니다.
+    """
+    timer = StageTimer(profile)
+    status = 'error'
+    try:
+        logger.info(f"입력 파일: {INPUT_FILE}")
         
-        # 결과를 JSON 파일로 저장
-        output_file = 'news_data.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        if incremental and not os.path.exists(INPUT_FILE):
+            logger.info(f"{INPUT_FILE} 파일이 없습니다. 새로운 기사가 없으므로 기존 결과를 유지합니다.")
+            status = 'skipped'
+            return
         
-        logger.info(f"중복제거 결과를 {output_file}에 저장했습니다.")
+        if stream:
+            with timer.stage('중복제거'):
+                stream_deduplicate(INPUT_FILE, OUTPUT_FILE, incremental=incremental, max_buffered=max_buffered,
+                                   corpus_tfidf=corpus_tfidf, clustering=clustering, lsh=lsh, history=history,
+                                   workers=workers, clusters=clusters, window_days=window_days)
+            status = 'ok'
+            return
         
-        # 파일 크기 확인
-        if os.path.exists(output_file):
-            file_size = os.path.getsize(output_file)
-            logger.info(f"출력 파일 크기: {file_size} bytes")
-            
-            # 파일 내용 확인
-            with open(output_file, 'r', encoding='utf-8') as f:
-                content = f.read(500)
-                logger.info(f"출력 파일 내용 시작 부분:\n{content}")
-        else:
-            raise FileNotFoundError(f"{output_file} 파일이 생성되지 않았습니다.")
+        with timer.stage('읽기'):
+            data = load_articles(INPUT_FILE)
+        with timer.stage('중복제거'):
+            result = deduplicate_records(data, incremental=incremental, corpus_tfidf=corpus_tfidf,
+                                         clustering=clustering, lsh=lsh, history=history, workers=workers,
+                                         clusters=clusters, window_days=window_days)
+        with timer.stage('저장'):
+            write_articles(result, OUTPUT_FILE, incremental=incremental)
+        status = 'ok'
         
     except Exception as e:
         logger.error(f"프로그램 실행 중 오류 발생: {str(e)}")
         raise
+    finally:
+        if report:
+            write_report(report, timer, command='shorten', status=status)
 
 if __name__ == "__main__":
-    main() 
+    parser = argparse.ArgumentParser(description='기사 중복제거')
+    parser.add_argument('--incremental', action='store_true',
+                        help='기존 news_data.json을 다시 계산하지 않고 새 기사만 병합')
+    parser.add_argument('--corpus-tfidf', action='store_true',
+                        help='TF-IDF를 키워드별이 아닌 전체 기사로 한 번만 학습')
+    parser.add_argument('--clustering', choices=sorted(CLUSTERING_METHODS), default='greedy',
+                        help='유사 기사 그룹화 방식 (기본값: greedy)')
+    parser.add_argument('--lsh', action='store_true',
+                        help='MinHash LSH 후보 쌍만 정확한 유사도로 비교 (대규모 키워드용 근사)')
+    parser.add_argument('--history', action='store_true',
+                        help='과거 실행의 기사와 중복인 새 기사를 제외 (--incremental 필요)')
+    parser.add_argument('--clusters', action='store_true',
+                        help='이전 실행의 기사 묶음(키워드별 중심 벡터)에 속하는 새 기사를 제외하고 '
+                             '이번 유사 그룹을 묶음으로 저장 (--incremental 필요)')
+    parser.add_argument('--window-days', type=int, default=None, metavar='DAYS',
+                        help='발행일 차이가 DAYS일 이하인 기사끼리만 비교 (기본값: 같은 키워드의 모든 기사 비교)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='키워드별 그룹화에 사용할 프로세스 수 (0이면 CPU 수, 기본값: 1)')
+    parser.add_argument('--stream', action='store_true',
+                        help='입력을 한 건씩 읽고 키워드별로 중복제거해 바로 저장 (메모리 사용량 제한)')
+    parser.add_argument('--max-buffered', type=int, default=DEFAULT_MAX_BUFFERED,
+                        help=f'--stream에서 메모리에 둘 최대 기사 수 (기본값: {DEFAULT_MAX_BUFFERED})')
+    parser.add_argument('--report', nargs='?', const=DEFAULT_REPORT_PATH, default=None,
+                        help=f'단계별 시간과 지표를 실행 보고서(JSON)로 저장 (경로 생략 시 {DEFAULT_REPORT_PATH})')
+    parser.add_argument('--profile', action='append', default=None, metavar='STAGE',
+                        help='cProfile로 실행할 단계 (여러 번 지정 가능, all이면 모든 단계)')
+    args = parser.parse_args()
+    main(incremental=args.incremental, corpus_tfidf=args.corpus_tfidf, clustering=args.clustering,
+         lsh=args.lsh, history=args.history, workers=args.workers or os.cpu_count(),
+         stream=args.stream, max_buffered=args.max_buffered, report=args.report, profile=args.profile,
+         clusters=args.clusters, window_days=args.window_days)
@@ -0,0 +1,184 @@
+import logging
+import os
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.preprocessing import normalize
+from sklearn.utils.extmath import safe_sparse_dot
+
+from metrics import timed
+from shorten import MAX_FEATURES, SIMILARITY_BLOCK_SIZE, limit_and_idf, preprocess_texts
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_PATH = os.path.join('.cache', 'similarity_model.npz')
+
+# top_k를 지정하지 않았을 때 돌려주는 이웃 수
+DEFAULT_TOP_K = 10
+
+
+class SimilarityModel:
+    """
+    한 번 학습한(또는 저장해 둔) 어휘/IDF로 기사 본문을 TF-IDF 벡터로 바꾸고,
+    한 건 대 여러 건, 여러 건 대 여러 건의 코사인 유사도를 희소 행렬 곱으로 한꺼번에 계산합니다.
+    Args:
+        vocabulary: list, 어휘 (열 순서)
+        idf: array, 어휘별 IDF
+    """
+
+    def __init__(self, vocabulary, idf):
+        self.vocabulary = list(vocabulary)
+        self.idf = np.asarray(idf, dtype=np.float64)
+        if len(self.vocabulary) != len(self.idf):
+            raise ValueError("어휘 수와 IDF 수가 다릅니다")
+        self._vectorizer = CountVectorizer(vocabulary=self.vocabulary, dtype=np.float64)
+
+    @classmethod
+    def fit(cls, texts, weights=None, max_features=MAX_FEATURES):
+        """
+        본문 목록으로 어휘/IDF를 학습합니다. (shorten.vectorize_texts와 같은 TF-IDF 설정)
+        Args:
+            texts: list, 기사 본문 (전처리 전)
+            weights: array, 본문별 기사 수 (collapse_duplicates 결과용, 없으면 모두 1)
+            max_features: int, 어휘 수 상한
+        """
+        texts = preprocess_texts(texts)
+        weights = np.ones(len(texts)) if weights is None else np.asarray(weights, dtype=np.float64)
+        vectorizer = CountVectorizer(dtype=np.float64)
+        try:
+            counts = vectorizer.fit_transform(texts).tocsr()
+        except ValueError:
+            # 모든 본문이 비어 있으면 어휘가 없음 (모든 유사도 0)
+            return cls([], [])
+        _, columns, idf = limit_and_idf(counts, weights, max_features)
+        return cls(vectorizer.get_feature_names_out()[columns], idf)
+
+    @classmethod
+    def load(cls, path=DEFAULT_MODEL_PATH):
+        """save로 저장한 모델을 읽습니다."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data['vocabulary'].tolist(), data['idf'])
+
+    def save(self, path=DEFAULT_MODEL_PATH):
+        """어휘/IDF를 원자적으로 저장합니다."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            np.savez(f, vocabulary=np.array(self.vocabulary, dtype=str), idf=self.idf)
+        os.replace(temp_path, path)
+        logger.info(f"유사도 모델 저장: {path} (어휘 {len(self.vocabulary)}개)")
+
+    def __len__(self):
+        return len(self.vocabulary)
+
+    def transform(self, texts):
+        """
+        본문 목록을 L2 정규화된 TF-IDF 행렬로 바꿉니다. 어휘에 없는 단어는 무시합니다.
+        Returns:
+            csr_matrix: 본문 수 × 어휘 수
+        """
+        if not self.vocabulary:
+            return sparse.csr_matrix((len(texts), 0))
+        counts = self._vectorizer.transform(preprocess_texts(texts)).tocsr()
+        counts.data *= self.idf[counts.indices]
+        return normalize(counts, norm='l2', copy=False)
+
+    def oov_share(self, texts):
+        """본문 단어 중 어휘에 없는 단어의 비율 (단어가 없으면 0). 모델을 다시 학습할지 판단할 때 사용"""
+        texts = preprocess_texts(texts)
+        analyzer = self._vectorizer.build_analyzer()
+        total = sum(len(analyzer(text)) for text in texts)
+        if total == 0:
+            return 0.0
+        if not self.vocabulary:
+            return 1.0
+        return 1.0 - self._vectorizer.transform(texts).sum() / total
+
+    def _matrix(self, texts):
+        """본문 목록이면 변환하고, 이미 transform한 행렬이면 그대로 사용"""
+        if sparse.issparse(texts):
+            return sparse.csr_matrix(texts)
+        return self.transform(texts)
+
+    def similarity(self, text1, text2):
+        """두 본문의 코사인 유사도"""
+        matrix = self.transform([text1, text2])
+        return float(matrix[0].multiply(matrix[1]).sum())
+
+    def one_vs_many(self, query, candidates, top_k=DEFAULT_TOP_K, threshold=0.0):
+        """
+        본문 하나와 후보 본문들의 유사도 상위 이웃을 찾습니다.
+        Args:
+            query: str, 기사 본문
+            candidates: list 또는 transform한 행렬, 후보 본문
+            top_k: int, 최대 이웃 수 (None이면 임계값을 넘는 모든 후보)
+            threshold: float, 이 값보다 유사도가 큰 후보만 반환
+        Returns:
+            list: 유사도 내림차순 (후보 위치, 유사도) 목록
+        """
+        return self.many_vs_many([query], candidates, top_k=top_k, threshold=threshold)[0]
+
+    def many_vs_many(self, queries, candidates=None, top_k=DEFAULT_TOP_K, threshold=0.0):
+        """
+        여러 본문 각각에 대해 후보 본문 중 유사도 상위 이웃을 찾습니다.
+        질의 행 블록 단위로 희소 행렬 곱을 계산하므로 메모리는 SIMILARITY_BLOCK_SIZE로 제한됩니다.
+        Args:
+            queries: list 또는 transform한 행렬, 질의 본문
+            candidates: list 또는 transform한 행렬, 후보 본문 (None이면 질의끼리 비교하고 자기 자신은 제외)
+            top_k: int, 질의별 최대 이웃 수 (None이면 임계값을 넘는 모든 후보)
+            threshold: float, 이 값보다 유사도가 큰 후보만 반환
+        Returns:
+            list: 질의별 유사도 내림차순 (후보 위치, 유사도) 목록
+        """
+        with timed('similarity.query'):
+            query_matrix = self._matrix(queries)
+            exclude_self = candidates is None
+            candidate_matrix = query_matrix if exclude_self else self._matrix(candidates)
+            n = candidate_matrix.shape[0]
+            transposed = candidate_matrix.T.tocsr()
+            rows_per_block = max(1, SIMILARITY_BLOCK_SIZE // max(n, 1))
+
+            neighbors = []
+            for start in range(0, query_matrix.shape[0], rows_per_block):
+                block = safe_sparse_dot(query_matrix[start:start + rows_per_block], transposed, dense_output=True)
+                block = np.asarray(block)
+                if exclude_self:
+                    rows = np.arange(block.shape[0])
+                    block[rows, rows + start] = -1.0
+                for row in block:
+                    neighbors.append(_top_neighbors(row, top_k, threshold))
+            return neighbors
+
+
+def _top_neighbors(row, top_k, threshold):
+    """유사도 한 행에서 임계값을 넘는 상위 top_k개를 (위치, 유사도) 목록으로 반환"""
+    indices = np.flatnonzero(row > threshold)
+    if top_k is not None and len(indices) > top_k:
+        # k번째 유사도와 같은 후보까지 남겨서 동점일 때도 앞 위치가 선택되도록 함
+        kth = -np.partition(-row[indices], top_k - 1)[top_k - 1]
+        indices = indices[row[indices] >= kth]
+    # 유사도 내림차순, 같으면 앞 위치 우선
+    indices = indices[np.lexsort((indices, -row[indices]))][:top_k]
+    return [(int(i), float(row[i])) for i in indices]
+
+
+def load_or_fit(texts, path=DEFAULT_MODEL_PATH, refit=False):
+    """
+    저장된 모델이 있으면 읽고, 없거나 refit이면 texts로 학습해 저장합니다.
+    Args:
+        texts: list, 학습에 쓸 기사 본문
+        path: str, 모델 파일 경로
+        refit: bool, 저장된 모델을 무시하고 다시 학습할지 여부
+    """
+    if not refit and os.path.exists(path):
+        try:
+            return SimilarityModel.load(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"유사도 모델을 읽지 못했습니다. 다시 학습합니다: {str(e)}")
+    model = SimilarityModel.fit(texts)
+    model.save(path)
+    return model
@@ -0,0 +1,230 @@
+import re
+
+# 한 번에 파서에 넣는 문자 수
+CHUNK_SIZE = 16 * 1024
+
+# 본문에서 제거할 요소 (extractor.REMOVE_SELECTOR와 같은 대상)
+REMOVED_TAGS = {'script', 'style', 'iframe'}
+REMOVED_CLASSES = {'reporter_area', 'copyright', 'promotion'}
+
+# get_text가 텍스트로 취급하지 않는 요소
+NON_TEXT_TAGS = {'script', 'style', 'template'}
+
+# 'tag', 'tag#id', '#id', 'tag.class', '.class' 형태의 단순 선택자
+SIMPLE_SELECTOR = re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)?(?:#([\w-]+)|\.([\w-]+))?$')
+
+
+def compile_selector(selector):
+    """
+    단순 CSS 선택자를 (tag, attrib) → bool 함수로 변환합니다.
+    Returns:
+        callable 또는 None (지원하지 않는 형태의 선택자)
+    """
+    match = SIMPLE_SELECTOR.match(selector.strip())
+    if not match or not any(match.groups()):
+        return None
+    tag, element_id, class_name = match.groups()
+    tag = tag.lower() if tag else None
+
+    def matcher(element_tag, attrib):
+        if tag and element_tag != tag:
+            return False
+        if element_id and attrib.get('id') != element_id:
+            return False
+        if class_name and class_name not in attrib.get('class', '').split():
+            return False
+        return True
+
+    return matcher
+
+
+def is_removed(tag, attrib):
+    """본문에서 제외할 요소인지 확인합니다."""
+    if tag in REMOVED_TAGS or tag in NON_TEXT_TAGS:
+        return True
+    classes = attrib.get('class')
+    return bool(classes) and not REMOVED_CLASSES.isdisjoint(classes.split())
+
+
+class _CaptureTarget:
+    """
+    lxml 파서 target: 트리를 만들지 않고 대상 요소의 텍스트만 모읍니다.
+    대상 요소가 닫히면 done이 True가 되어 더 이상 읽지 않아도 됩니다.
+    guard가 있으면 guard에 일치하는 요소가 있는지 끝까지 읽고, 있으면 blocked가 됩니다.
+    """
+
+    def __init__(self, matcher, skip=is_removed, guard=None):
+        self.matcher = matcher
+        self.skip = skip
+        self.guard = guard
+        self.depth = 0  # 대상 요소 안에서의 깊이 (0이면 진입 전)
+        self.skip_depth = 0  # 제외 요소 안에서의 깊이
+        self.found = False
+        self.captured = False
+        self.blocked = False
+        self.done = False
+        self.parts = []
+        self._buffer = []
+
+    def _flush(self):
+        # BeautifulSoup의 get_text(strip=True)처럼 문자열 단위로 양끝 공백 제거
+        if self._buffer:
+            text = ''.join(self._buffer).strip()
+            if text:
+                self.parts.append(text)
+            self._buffer = []
+
+    def start(self, tag, attrib):
+        if self.done:
+            return
+        if self.guard is not None and self.guard(tag, attrib):
+            self.blocked = True
+            self.done = True
+            return
+        if self.captured:
+            return
+        if self.depth:
+            self._flush()
+            self.depth += 1
+            if self.skip_depth:
+                self.skip_depth += 1
+            elif self.skip(tag, attrib):
+                self.skip_depth = 1
+        elif self.matcher(tag, attrib):
+            self.found = True
+            self.depth = 1
+
+    def end(self, tag):
+        if self.done or self.captured or not self.depth:
+            return
+        self._flush()
+        self.depth -= 1
+        if self.skip_depth:
+            self.skip_depth -= 1
+        if self.depth == 0:
+            self.captured = True
+            self.done = self.guard is None
+
+    def data(self, data):
+        if self.depth and not self.skip_depth and not self.done and not self.captured:
+            self._buffer.append(data)
+
+    def comment(self, text):
+        if self.depth and not self.done and not self.captured:
+            self._flush()
+
+    def close(self):
+        self._flush()
+        return ''.join(self.parts) if self.found and not self.blocked else None
+
+
+class _BlockLengthTarget:
+    """lxml 파서 target: 모든 p/div 요소의 get_text(strip=True) 길이를 계산합니다."""
+
+    def __init__(self):
+        self.lengths = []  # 등장 순서별 p/div 텍스트 길이
+        self._stack = []  # 열린 요소별 p/div 번호 (p/div가 아니면 None)
+        self._open_blocks = []
+        self._non_text_depth = 0
+        self._buffer = []
+
+    def _flush(self):
+        if self._buffer:
+            length = len(''.join(self._buffer).strip())
+            if length:
+                for index in self._open_blocks:
+                    self.lengths[index] += length
+            self._buffer = []
+
+    def start(self, tag, attrib):
+        self._flush()
+        if self._non_text_depth or tag in NON_TEXT_TAGS:
+            self._non_text_depth += 1
+        if tag in ('p', 'div'):
+            index = len(self.lengths)
+            self.lengths.append(0)
+            self._open_blocks.append(index)
+            self._stack.append(index)
+        else:
+            self._stack.append(None)
+
+    def end(self, tag):
+        self._flush()
+        if self._non_text_depth:
+            self._non_text_depth -= 1
+        if self._stack and self._stack.pop() is not None:
+            self._open_blocks.pop()
+
+    def data(self, data):
+        if not self._non_text_depth:
+            self._buffer.append(data)
+
+    def comment(self, text):
+        self._flush()
+
+    def close(self):
+        self._flush()
+        return self.lengths
+
+
+def _run(target, html, stop_early=True):
+    """HTML을 조각 단위로 파서에 넣고, 대상이 끝나면 중단합니다."""
+    from lxml import etree
+
+    parser = etree.HTMLParser(target=target)
+    for start in range(0, len(html), CHUNK_SIZE):
+        parser.feed(html[start:start + CHUNK_SIZE])
+        if stop_early and getattr(target, 'done', False):
+            break
+    try:
+        return parser.close()
+    except etree.XMLSyntaxError:
+        return target.close()
+
+
+def stream_extract(html, selector, unless=()):
+    """
+    트리를 만들지 않고 선택자에 처음 일치하는 요소의 본문 텍스트를 추출합니다.
+    요소가 닫히는 즉시 파싱을 멈추며, script/style/iframe/.reporter_area/.copyright/.promotion은
+    읽는 동안 제외합니다.
+    Args:
+        html: str, 페이지 HTML
+        selector: str, 단순 CSS 선택자
+        unless: list, 이 선택자 중 하나라도 일치하는 요소가 있으면 None
+            (우선순위가 더 높은 선택자 확인용. 주어지면 문서 끝까지 읽음)
+    Returns:
+        str: 공백이 정리되지 않은 본문 텍스트. 요소가 없으면 None
+    Raises:
+        ValueError: 지원하지 않는 형태의 선택자
+    """
+    matchers = [compile_selector(s) for s in [selector, *unless]]
+    if None in matchers:
+        raise ValueError(f"스트리밍 추출을 지원하지 않는 선택자입니다: {[selector, *unless]}")
+    guards = matchers[1:]
+    guard = (lambda tag, attrib: any(match(tag, attrib) for match in guards)) if guards else None
+    return _run(_CaptureTarget(matchers[0], guard=guard), html)
+
+
+def longest_text_block(html):
+    """
+    텍스트가 가장 긴 p/div 요소의 get_text(strip=True) 결과를 반환합니다.
+    길이 계산과 텍스트 추출을 모두 스트리밍으로 처리합니다. 요소가 없으면 None.
+    """
+    lengths = _run(_BlockLengthTarget(), html, stop_early=False)
+    if not lengths:
+        return None
+    # max()처럼 길이가 같으면 먼저 나온 요소를 선택
+    longest = max(range(len(lengths)), key=lengths.__getitem__)
+
+    position = {'seen': -1}
+
+    def matcher(tag, attrib):
+        if tag in ('p', 'div'):
+            position['seen'] += 1
+            return position['seen'] == longest
+        return False
+
+    def skip(tag, attrib):
+        return tag in NON_TEXT_TAGS
+
+    return _run(_CaptureTarget(matcher, skip=skip), html)
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# 가짜 워크시트/스텁 서버는 벤치마크와 같이 사용
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """캐시/상태/결과 파일이 임시 디렉터리에 생기도록 작업 디렉터리를 바꿉니다."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
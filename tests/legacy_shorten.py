@@ -0,0 +1,107 @@
+"""
+변경 전 shorten.py의 중복제거 (동작 보존 확인용 기준 구현)
+처음 커밋의 코드에서 로그 출력만 뺐습니다. 고치지 마세요.
+"""
+import re
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+NEWSPAPER_GROUPS = {
+    '보수': {
+        '조선일보': 1,
+        '중앙일보': 2,
+        '동아일보': 3
+    },
+    '진보': {
+        '경향신문': 1,
+        '한겨레신문': 2,
+        '한국일보': 3
+    },
+    '경제': {
+        '매일경제': 1,
+        '한국경제': 2,
+        '서울경제': 3,
+        '아주경제': 4
+    }
+}
+
+
+def get_newspaper_priority(newspaper):
+    """신문사의 우선순위를 반환"""
+    for group in NEWSPAPER_GROUPS.values():
+        if newspaper in group:
+            return group[newspaper]
+    return float('inf')
+
+
+def preprocess_text(text):
+    """텍스트 전처리"""
+    if not isinstance(text, str):
+        return ""
+    text = re.sub(r'[^가-힣0-9\s]', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+def find_similar_articles(group, similarity_threshold=0.5):
+    """같은 키워드의 기사에서 유사한 기사 그룹 목록을 반환"""
+    texts = group['내용'].apply(preprocess_text).tolist()
+    vectorizer = TfidfVectorizer(max_features=10000)
+    tfidf_matrix = vectorizer.fit_transform(texts)
+    similarity_matrix = cosine_similarity(tfidf_matrix)
+
+    similar_groups = []
+    used_indices = set()
+    for i in range(len(texts)):
+        if i in used_indices:
+            continue
+        similar_indices = np.where(similarity_matrix[i] > similarity_threshold)[0]
+        similar_indices = [idx for idx in similar_indices if idx not in used_indices]
+        if similar_indices:
+            similar_groups.append(group.iloc[similar_indices])
+            used_indices.update(similar_indices)
+    return similar_groups
+
+
+def select_articles_by_length(group_articles):
+    """기사 길이와 신문사 우선순위를 고려하여 기사 선택"""
+    if len(group_articles) == 0:
+        return None
+
+    def sort_key(x):
+        return x.map(get_newspaper_priority) if x.name == '신문사' else x
+
+    group_articles = group_articles.copy()
+    group_articles['길이'] = group_articles['내용'].str.len()
+    selected_articles = []
+    for group_name in ['보수', '진보', '경제']:
+        group_mask = group_articles['신문사'].isin(NEWSPAPER_GROUPS[group_name].keys())
+        subset = group_articles[group_mask].copy()
+        if len(subset) > 0:
+            candidates = subset.sort_values(['길이', '신문사'], key=sort_key, ascending=[False, True])
+            selected_articles.append(candidates.iloc[0].to_dict())
+
+    if len(selected_articles) < 3:
+        remaining = group_articles[~group_articles['신문사'].isin([a['신문사'] for a in selected_articles])].copy()
+        remaining = remaining.sort_values(['길이', '신문사'], key=sort_key, ascending=[False, True])
+        for _, article in remaining.iterrows():
+            if len(selected_articles) >= 3:
+                break
+            selected_articles.append(article.to_dict())
+    return selected_articles
+
+
+def deduplicate_articles(df):
+    """기사 중복제거"""
+    deduplicated_rows = []
+    for keyword, group in df.groupby('키워드'):
+        if len(group) < 3:
+            deduplicated_rows.extend(group.to_dict('records'))
+            continue
+        for group_articles in find_similar_articles(group):
+            selected_articles = select_articles_by_length(group_articles)
+            if selected_articles:
+                deduplicated_rows.extend(selected_articles)
+    return deduplicated_rows
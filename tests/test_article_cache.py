@@ -0,0 +1,147 @@
+from types import SimpleNamespace
+
+import pytest
+
+import article_cache
+import crawler
+from article_cache import ArticleCache
+
+URL = 'https://n.news.naver.com/mnews/article/023/0000001'
+BODY = '정부는 오늘 새로운 정책을 발표했다. ' * 20
+
+
+class FakeClock:
+    """호출할 때마다 1초씩 증가하는 시계 (접근 순서가 같은 시각으로 겹치지 않도록)"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        self.now += 1
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, status_code, text='', headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode('utf-8')
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """미리 정한 응답을 차례로 돌려주고 요청 헤더를 기록하는 세션"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent_headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+def article_page(text):
+    return f'<html><body><div id="dic_area">{text}</div></body></html>'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(article_cache, 'time', SimpleNamespace(time=clock.time))
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = ArticleCache(path=str(tmp_path / 'cache.sqlite3'), ttl=100)
+    yield cache
+    cache.close()
+
+
+def test_fresh_entry_is_served_without_request(cache):
+    cache.put(URL, BODY, etag='"v1"')
+    session = FakeSession([])
+
+    assert crawler.crawl_article(URL, session=session, cache=cache) == BODY
+    assert session.sent_headers == []
+    assert cache.stats == {'hit': 1, 'revalidated': 0, 'miss': 0}
+
+
+def test_ttl_expiry(cache):
+    cache.put(URL, BODY, fetched_at=500.0)
+    entry = cache.get(URL)
+    assert entry.is_fresh(cache.ttl, now=599.0)
+    assert not entry.is_fresh(cache.ttl, now=600.0)
+
+
+def test_stale_entry_is_revalidated_with_304(cache, clock):
+    cache.put(URL, BODY, etag='"v1"', last_modified='Sat, 22 Aug 2026 00:00:00 GMT',
+              fetched_at=clock.now - 1000)
+    session = FakeSession([FakeResponse(304)])
+
+    assert crawler.crawl_article(URL, session=session, cache=cache) == BODY
+    assert session.sent_headers[0]['If-None-Match'] == '"v1"'
+    assert session.sent_headers[0]['If-Modified-Since'] == 'Sat, 22 Aug 2026 00:00:00 GMT'
+    assert cache.stats == {'hit': 0, 'revalidated': 1, 'miss': 0}
+    # 재검증된 항목은 다시 TTL 동안 요청 없이 사용
+    assert cache.get(URL).is_fresh(cache.ttl, now=clock.now)
+
+
+def test_changed_article_replaces_entry_and_etag(cache, clock):
+    cache.put(URL, BODY, etag='"v1"', fetched_at=clock.now - 1000)
+    updated = '수정된 기사 본문입니다. ' * 20
+    session = FakeSession([FakeResponse(200, article_page(updated), headers={'ETag': '"v2"'})])
+
+    assert crawler.crawl_article(URL, session=session, cache=cache) == updated.strip()
+    assert session.sent_headers[0]['If-None-Match'] == '"v1"'
+    entry = cache.get(URL)
+    assert (entry.text, entry.etag) == (updated.strip(), '"v2"')
+    assert cache.stats == {'hit': 0, 'revalidated': 0, 'miss': 1}
+
+
+def test_miss_sends_no_conditional_headers(cache):
+    session = FakeSession([FakeResponse(200, article_page(BODY), headers={'ETag': '"v1"'})])
+
+    assert crawler.crawl_article(URL, session=session, cache=cache) == BODY.strip()
+    assert 'If-None-Match' not in session.sent_headers[0]
+    assert cache.get(URL).etag == '"v1"'
+
+
+def test_eviction_keeps_recently_used_entries(cache):
+    cache.max_entries = 2
+    for i in range(3):
+        cache.put(f'{URL}{i}', BODY)
+    # 가장 먼저 저장했지만 최근에 읽은 항목은 남음
+    cache.get(f'{URL}0')
+    cache.evict()
+
+    assert len(cache) == 2
+    assert cache.get(f'{URL}0') is not None
+    assert cache.get(f'{URL}1') is None
+    assert cache.get(f'{URL}2') is not None
+
+
+def test_eviction_by_total_bytes(cache):
+    size = len(BODY.encode('utf-8'))
+    cache.max_bytes = size * 2
+    for i in range(4):
+        cache.put(f'{URL}{i}', BODY)
+    cache.evict()
+
+    assert len(cache) == 2
+    assert [cache.get(f'{URL}{i}') is not None for i in range(4)] == [False, False, True, True]
+
+
+def test_put_evicts_periodically(cache, monkeypatch):
+    monkeypatch.setattr(article_cache, 'EVICT_EVERY', 2)
+    cache.max_entries = 1
+    cache.put(f'{URL}0', BODY)
+    cache.put(f'{URL}1', BODY)
+
+    assert len(cache) == 1
+    assert cache.get(f'{URL}1') is not None
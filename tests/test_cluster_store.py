@@ -0,0 +1,60 @@
+import os
+import time
+
+import numpy as np
+
+from cluster_store import ClusterStore, open_clusters
+
+OLD_TEXTS = ['정부는 오늘 새로운 부동산 정책을 발표했다 주택 공급 확대', '부동산 정책 발표 이후 주택 시장 반응',
+             '국회는 예산안 처리를 두고 논의했다 여야 합의', '예산안 여야 합의 국회 본회의 통과']
+NEW_TEXTS = ['반도체 수출이 크게 늘었다 메모리 가격 상승', '메모리 반도체 수출 증가 가격 상승세',
+             '부동산 정책 발표 이후 주택 시장 반응 거래 증가', '태풍이 남부 지방에 상륙했다 피해 우려']
+
+
+def make_store(tmp_path, texts=OLD_TEXTS, **options):
+    store = ClusterStore(str(tmp_path / 'clusters.sqlite3'), model_path=str(tmp_path / 'model.npz'), **options)
+    model = store.model(texts)
+    open_clusters('키워드', model.transform(texts), [np.array([0, 1]), np.array([2, 3])],
+                  ['link0', 'link1', 'link2', 'link3'], store)
+    store.commit()
+    return store
+
+
+def reopen(store, **options):
+    store.close()
+    return ClusterStore(store.path, model_path=store.model_path, **options)
+
+
+def test_model_is_kept_for_familiar_texts(tmp_path):
+    store = make_store(tmp_path)
+    mtime = os.path.getmtime(store.model_path)
+
+    store = reopen(store)
+    store.model(OLD_TEXTS[1:])
+    assert os.path.getmtime(store.model_path) == mtime
+
+
+def test_refit_on_new_vocabulary_moves_centroids(tmp_path):
+    store = make_store(tmp_path)
+    old_vocabulary = set(store.model(OLD_TEXTS).vocabulary)
+
+    store = reopen(store)
+    model = store.model(NEW_TEXTS)
+    assert set(model.vocabulary) != old_vocabulary
+    assert '반도체' in model.vocabulary
+
+    # 옮긴 중심 벡터는 새 어휘의 열을 쓰고, 같은 이야기의 새 기사와 여전히 가까움
+    ids, sizes, centroids = store.load('키워드', len(model))
+    assert list(sizes) == [2]  # 예산안 묶음은 새 어휘에 남는 단어가 없어 제거됨
+    similarity = (model.transform([NEW_TEXTS[2]]) @ centroids.T).toarray()[0, 0]
+    assert similarity > 0.5
+
+
+def test_old_model_is_refit(tmp_path):
+    store = make_store(tmp_path)
+    mtime = os.path.getmtime(store.model_path)
+
+    store = reopen(store, max_model_age=60)
+    store.model(OLD_TEXTS, now=time.time() + 120)
+    assert os.path.getmtime(store.model_path) > mtime
+    assert len(store) == 2
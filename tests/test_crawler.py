@@ -0,0 +1,86 @@
+import json
+
+import crawler
+from fake_sheet import FakeWorksheet
+from pipeline_state import load_state
+from sheet_reader import SHEET_COLUMNS
+from stub_server import StubServer
+
+
+def article_page(text):
+    return f'<html><body><div id="dic_area">{text}</div></body></html>'
+
+
+def sheet(base_url, paths, keyword='키워드'):
+    rows = [SHEET_COLUMNS]
+    for i, path in enumerate(paths):
+        rows.append([keyword, '8/22/2026', f'제목 {i}', base_url + path])
+    return rows
+
+
+def read_output():
+    with open('news_data.json', 'r', encoding='utf-8') as f:
+        return {row['링크']: row['내용'] for row in json.load(f)}
+
+
+def test_failed_article_is_stored_after_retry(workdir):
+    paths = ['/mnews/article/023/0000001', '/mnews/article/028/0000002']
+    bodies = {path: f'{i}번 기사 본문입니다. ' * 20 for i, path in enumerate(paths)}
+    with StubServer(pages={p: article_page(t) for p, t in bodies.items()}, latency=0.0,
+                    failures={paths[1]: [404]}) as server:
+        worksheet = FakeWorksheet(sheet(server.base_url, paths))
+        links = [server.base_url + path for path in paths]
+
+        crawler.main(incremental=True, worksheet=worksheet)
+        # 실패한 기사는 빈 본문으로 저장되지 않음
+        assert read_output() == {links[0]: bodies[paths[0]].strip()}
+
+        crawler.main(incremental=True, worksheet=worksheet)
+        assert read_output() == {links[0]: bodies[paths[0]].strip(), links[1]: bodies[paths[1]].strip()}
+
+
+def test_dead_link_is_retried_without_rereading_sheet(workdir):
+    paths = ['/mnews/article/023/0000001', '/mnews/article/028/0000002', '/mnews/article/023/0000003']
+    pages = {path: article_page(f'{i}번 기사 본문입니다. ' * 20) for i, path in enumerate(paths)}
+    dead = paths[0]
+    with StubServer(pages=pages, latency=0.0, failures={dead: [404] * 10}) as server:
+        worksheet = FakeWorksheet(sheet(server.base_url, paths[:2]))
+        dead_link = server.base_url + dead
+
+        crawler.main(incremental=True, worksheet=worksheet)
+        state = load_state()
+        # 실패한 행이 있어도 시트 위치는 끝까지 진행하고, 실패한 행은 재시도 목록에 남음
+        assert state['sheet']['last_row'] == 3
+        assert state['retries'][dead_link]['attempts'] == 1
+
+        # 시트가 바뀌지 않아도 재시도하고, 시트 값은 다시 요청하지 않음
+        requests = worksheet.requests
+        crawler.main(incremental=True, worksheet=worksheet)
+        assert worksheet.requests == requests
+        assert load_state()['retries'][dead_link]['attempts'] == 2
+
+        # 새로 추가된 행만 읽음
+        worksheet.append_row(sheet(server.base_url, paths[2:])[1])
+        crawler.main(incremental=True, worksheet=worksheet)
+        state = load_state()
+        assert state['sheet']['last_row'] == 4
+        assert set(read_output()) == {server.base_url + path for path in paths[1:]}
+
+        # 최대 횟수(DEFAULT_MAX_ATTEMPTS)만큼 실패하면 포기
+        assert state['retries'] == {}
+        assert dead_link not in state['seen_links']
+
+
+def test_history_and_clusters_drop_follow_up_duplicates(workdir):
+    paths = ['/mnews/article/023/0000001', '/mnews/article/028/0000002']
+    body = '정부는 오늘 새로운 부동산 정책을 발표했다. 주택 공급을 크게 늘리겠다고 밝혔다. ' * 10
+    with StubServer(pages={path: article_page(body) for path in paths}, latency=0.0) as server:
+        worksheet = FakeWorksheet(sheet(server.base_url, paths[:1]))
+        crawler.main(incremental=True, worksheet=worksheet, history=True, clusters=True)
+        assert (workdir / '.cache' / 'clusters.sqlite3').exists()
+        assert (workdir / '.cache' / 'lsh_index.sqlite3').exists()
+
+        # 다음 날 같은 내용의 기사는 이전 실행의 기사와 중복이므로 추가되지 않음
+        worksheet.append_row(sheet(server.base_url, paths[1:])[1])
+        crawler.main(incremental=True, worksheet=worksheet, history=True, clusters=True)
+        assert set(read_output()) == {server.base_url + paths[0]}
@@ -0,0 +1,34 @@
+import pytest
+
+from extractor import ExtractorRegistry
+
+URL = 'https://www.example-news.co.kr/news/{}'
+
+
+def page(*blocks):
+    return '<html><body>' + ''.join(blocks) + '</body></html>'
+
+
+ONLY_ARTICLE = page('<article>아티클 요소 본문</article>')
+BOTH = page('<article>아티클 요소 본문</article>', '<div class="article-body">기사 본문 영역</div>')
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_learned_selector_does_not_override_selector_order(streaming):
+    registry = ExtractorRegistry(streaming=streaming)
+    assert registry.extract(ONLY_ARTICLE, URL.format(1)) == ('아티클 요소 본문', 'article')
+    assert registry.learned['www.example-news.co.kr'] == 'article'
+
+    # div.article-body가 article보다 앞선 선택자이므로, 둘 다 있는 페이지는 학습 여부와 관계없이 div.article-body
+    assert registry.extract(BOTH, URL.format(2)) == ('기사 본문 영역', 'div.article-body')
+    assert ExtractorRegistry(streaming=streaming).extract(BOTH, URL.format(2)) == ('기사 본문 영역', 'div.article-body')
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_extraction_does_not_depend_on_fetch_order(streaming):
+    pages = [ONLY_ARTICLE, BOTH, page('<div class="article-body">다른 본문</div>'), BOTH]
+    expected = [ExtractorRegistry(streaming=streaming).extract(html, URL.format(i)) for i, html in enumerate(pages)]
+    for order in ([0, 1, 2, 3], [2, 0, 3, 1], [3, 2, 1, 0]):
+        registry = ExtractorRegistry(streaming=streaming)
+        results = {i: registry.extract(pages[i], URL.format(i)) for i in order}
+        assert [results[i] for i in range(len(pages))] == expected
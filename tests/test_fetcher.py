@@ -0,0 +1,91 @@
+import pytest
+import requests
+
+from fetcher import CircuitBreaker, CircuitOpenError, Fetcher
+
+URL = 'https://n.news.naver.com/mnews/article/023/0000001'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+
+
+class FakeSession:
+    """미리 정한 상태 코드(또는 예외)를 차례로 돌려주는 세션"""
+
+    def __init__(self):
+        self.outcomes = []
+
+    def get(self, url, headers=None, timeout=None):
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return FakeResponse(outcome)
+
+
+def make_fetcher(clock, retries=2):
+    session = FakeSession()
+    breaker = CircuitBreaker(threshold=1, cooldown=60, clock=clock)
+    return Fetcher(session=session, retries=retries, rate_per_host=0, breaker=breaker, sleep=lambda delay: None)
+
+
+def test_trial_retries_recover_after_cooldown():
+    clock = FakeClock()
+    fetcher = make_fetcher(clock)
+    fetcher.session.outcomes = [503, 503, 503]
+    assert fetcher.get(URL).status_code == 503
+
+    clock.now = 10
+    with pytest.raises(CircuitOpenError):
+        fetcher.get(URL)
+
+    # 시험 요청이 503을 받아도 같은 호출 안에서 재시도하고, 성공하면 다시 엶
+    clock.now = 61
+    fetcher.session.outcomes = [503, 200]
+    assert fetcher.get(URL).status_code == 200
+    fetcher.session.outcomes = [200]
+    assert fetcher.get(URL).status_code == 200
+
+
+def test_failed_trial_restarts_cooldown():
+    clock = FakeClock()
+    fetcher = make_fetcher(clock)
+    fetcher.session.outcomes = [503] * 3
+    fetcher.get(URL)
+
+    clock.now = 61
+    fetcher.session.outcomes = [503] * 3
+    assert fetcher.get(URL).status_code == 503
+    clock.now = 100
+    with pytest.raises(CircuitOpenError):
+        fetcher.get(URL)
+
+    clock.now = 122
+    fetcher.session.outcomes = [200]
+    assert fetcher.get(URL).status_code == 200
+
+
+def test_unexpected_error_during_trial_does_not_block_host():
+    clock = FakeClock()
+    fetcher = make_fetcher(clock)
+    fetcher.session.outcomes = [503] * 3
+    fetcher.get(URL)
+
+    clock.now = 61
+    fetcher.session.outcomes = [requests.exceptions.InvalidHeader('bad header')]
+    with pytest.raises(requests.exceptions.InvalidHeader):
+        fetcher.get(URL)
+
+    clock.now = 1000
+    fetcher.session.outcomes = [200]
+    assert fetcher.get(URL).status_code == 200
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from record_stream import JsonArrayWriter, KeywordSpool, iter_records
+
+RECORDS = [
+    {'키워드': '금리', '제목': '기준금리 동결', '내용': '한국은행이 기준금리를 동결했다. ' * 30, '링크': 'https://a/1'},
+    {'키워드': '반도체', '제목': '괄호 ] 와 쉼표 , 가 든 "제목"', '내용': '줄바꿈\n과 [배열] {객체} 기호', '링크': 'https://a/2'},
+    {'키워드': '금리', '제목': '숫자와 널', '내용': '', '링크': 'https://a/3', '점수': 1.5, '순위': None},
+    {'키워드': None, '제목': '키워드 없음', '내용': 'emoji 😀 \\ 역슬래시', '링크': 'https://a/4', '태그': ['a', 'b']},
+]
+
+
+def write_array(path, records):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, ensure_ascii=False, indent=2)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 64 * 1024])
+def test_iter_records_reads_json_array(tmp_path, chunk_size):
+    path = tmp_path / 'news.json'
+    write_array(path, RECORDS)
+    assert list(iter_records(str(path), chunk_size=chunk_size)) == RECORDS
+
+
+@pytest.mark.parametrize('chunk_size', [1, 64 * 1024])
+def test_iter_records_reads_compact_and_empty_arrays(tmp_path, chunk_size):
+    path = tmp_path / 'news.json'
+    path.write_text(json.dumps(RECORDS, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+    assert list(iter_records(str(path), chunk_size=chunk_size)) == RECORDS
+
+    path.write_text('  [ ]\n', encoding='utf-8')
+    assert list(iter_records(str(path), chunk_size=chunk_size)) == []
+
+
+def test_iter_records_reads_json_lines(tmp_path):
+    path = tmp_path / 'news.jsonl'
+    lines = [json.dumps(record, ensure_ascii=False) for record in RECORDS]
+    path.write_text('\n'.join(lines[:2]) + '\n\n' + '\n'.join(lines[2:]) + '\n', encoding='utf-8')
+    assert list(iter_records(str(path))) == RECORDS
+
+    path.write_text('', encoding='utf-8')
+    assert list(iter_records(str(path))) == []
+
+
+def test_iter_records_rejects_truncated_array(tmp_path):
+    path = tmp_path / 'news.json'
+    text = json.dumps(RECORDS, ensure_ascii=False, indent=2)
+    path.write_text(text[:len(text) // 2], encoding='utf-8')
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_records(str(path), chunk_size=16))
+
+
+@pytest.mark.parametrize('records', [RECORDS, RECORDS[:1], []])
+def test_json_array_writer_matches_json_dump(tmp_path, records):
+    expected = tmp_path / 'expected.json'
+    write_array(expected, records)
+
+    path = tmp_path / 'news.json'
+    with JsonArrayWriter(str(path)) as writer:
+        for record in records:
+            writer.write(record)
+
+    assert writer.count == len(records)
+    assert path.read_bytes() == expected.read_bytes()
+    assert list(iter_records(str(path), chunk_size=5)) == records
+
+
+def test_json_array_writer_keeps_target_on_error(tmp_path):
+    path = tmp_path / 'news.json'
+    write_array(path, RECORDS[:1])
+    with pytest.raises(RuntimeError):
+        with JsonArrayWriter(str(path)) as writer:
+            writer.write(RECORDS[1])
+            raise RuntimeError('중단')
+
+    assert json.loads(path.read_text(encoding='utf-8')) == RECORDS[:1]
+    assert not (tmp_path / 'news.json.tmp').exists()
+
+
+def test_keyword_spool_groups_in_order_across_flushes(tmp_path):
+    records = [dict(record, 순번=i) for i in range(5) for record in RECORDS]
+    with KeywordSpool(max_buffered=3, directory=str(tmp_path)) as spool:
+        for record in records:
+            spool.add(record)
+
+        assert spool.keywords() == ['금리', '반도체']
+        assert spool.dropped == 5
+        for keyword in spool.keywords():
+            assert spool.records(keyword) == [r for r in records if r['키워드'] == keyword]
+    assert list(tmp_path.iterdir()) == []
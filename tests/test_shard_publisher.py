@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from fake_contents_api import FakeContentsApi
+from shard_publisher import GitDataTarget, PublishConflict, load_shards, publish_shards
+
+REPO = 'owner/news_bot'
+
+
+def article(day, i):
+    return {'키워드': '키워드', '발행일': f'8/{day}/2026', '제목': f'제목 {i}',
+            '링크': f'https://n.news.naver.com/mnews/article/023/{i:07d}', '내용': f'{i}번 기사 본문', '신문사': '023'}
+
+
+@pytest.fixture
+def api():
+    with FakeContentsApi() as server:
+        yield server
+
+
+def target(api):
+    return GitDataTarget(REPO, 'token', api_url=api.base_url)
+
+
+def test_publish_is_one_commit(api):
+    records = [article(day, day * 10 + i) for day in (1, 2, 3) for i in range(2)]
+    stats = publish_shards(records, target(api), files={'news_data.json': b'[]'})
+
+    assert stats['uploaded'] == 3
+    assert api.commits == 1
+    assert api.requests['PUT'] == 0
+    assert sorted(api.files) == ['news_data.json', 'news_shards/2026-08-01.json', 'news_shards/2026-08-02.json',
+                                 'news_shards/2026-08-03.json', 'news_shards/manifest.json']
+    assert load_shards(target(api)) == records
+
+
+def test_only_changed_shards_are_committed(api):
+    records = [article(day, day * 10) for day in (1, 2)]
+    publish_shards(records, target(api))
+    before = dict(api.files)
+    api.reset_counts()
+
+    publish_shards(records, target(api))
+    assert api.commits == 0
+
+    publish_shards(records + [article(2, 99)], target(api))
+    assert api.commits == 1
+    changed = {path for path in api.files if api.files[path] != before.get(path)}
+    assert changed == {'news_shards/2026-08-02.json', 'news_shards/manifest.json'}
+
+
+def test_removed_shard_is_deleted(api):
+    publish_shards([article(1, 1), article(2, 2)], target(api))
+    api.reset_counts()
+
+    stats = publish_shards([article(2, 2)], target(api))
+    assert stats['deleted'] == 1
+    assert api.commits == 1
+    assert 'news_shards/2026-08-01.json' not in api.files
+
+
+def test_commit_is_rebased_when_branch_moves(api):
+    publisher = target(api)
+    publisher.put('news_data.json', b'[1]')
+    # 변경을 모은 뒤 커밋 전에 다른 곳에서 브랜치에 커밋함
+    api.commit_directly({'README.md': b'news_bot'})
+
+    publisher.commit('Update')
+    assert api.files == {'README.md': b'news_bot', 'news_data.json': b'[1]'}
+
+
+def test_put_with_stale_sha_conflicts(api):
+    api.commit_directly({'news_data.json': json.dumps([]).encode('utf-8')})
+    with pytest.raises(PublishConflict):
+        target(api).put('news_data.json', b'[1]', sha=None)
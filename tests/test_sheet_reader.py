@@ -0,0 +1,51 @@
+from fake_sheet import FakeWorksheet
+from sheet_reader import SHEET_COLUMNS, SheetReader
+
+
+def rows(n, start=0):
+    return [['키워드', '8/22/2026', f'제목 {i}', f'https://n.news.naver.com/mnews/article/023/{i:07d}']
+            for i in range(start, start + n)]
+
+
+def worksheet(n):
+    # 크롤러가 쓰지 않는 열이 섞여 있는 시트
+    return FakeWorksheet([SHEET_COLUMNS + ['요약']] + [row + ['요약'] for row in rows(n)])
+
+
+def test_unchanged_revision_skips_reading():
+    sheet = worksheet(5)
+    df, state = SheetReader(sheet).read()
+    requests = sheet.requests
+
+    df, new_state = SheetReader(sheet).read(state)
+    assert len(df) == 0
+    assert new_state == state
+    assert sheet.requests == requests
+
+
+def test_only_appended_rows_are_read():
+    sheet = worksheet(5)
+    _, state = SheetReader(sheet).read()
+    for row in rows(2, start=5):
+        sheet.append_row(row + ['요약'])
+
+    df, state = SheetReader(sheet).read(state)
+    assert list(df.index) == [7, 8]
+    assert list(df.columns) == SHEET_COLUMNS
+    assert df['제목'].tolist() == ['제목 5', '제목 6']
+    assert state['last_row'] == 8
+    assert state['last_link'] == df['링크'].iloc[-1]
+
+
+def test_incremental_read_uses_fewer_requests_and_cells():
+    full = worksheet(200)
+    full.get_all_values()
+
+    sheet = worksheet(200)
+    _, state = SheetReader(sheet).read()
+    sheet.append_row(rows(1, start=200)[0] + ['요약'])
+    sheet.requests = sheet.cells = 0
+    SheetReader(sheet).read(state)
+
+    assert sheet.requests <= full.requests
+    assert sheet.cells * 10 < full.cells
@@ -0,0 +1,174 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import legacy_shorten
+import shorten
+
+
+def select_both(clusters):
+    """select_from_clusters와 변경 전 선택 방식의 결과 (유사 그룹별 선택된 내용 목록)"""
+    df = pd.DataFrame([article for cluster in clusters for article in cluster])
+    positions, start = [], 0
+    for cluster in clusters:
+        positions.append(np.arange(start, start + len(cluster)))
+        start += len(cluster)
+    selected = shorten.select_from_clusters(df['신문사'], df['내용'].str.len(), positions)
+    new = [df['내용'].iloc[rows].tolist() for rows in selected]
+    legacy = [[article['내용'] for article in legacy_shorten.select_articles_by_length(df.iloc[rows])]
+              for rows in positions]
+    return new, legacy
+
+
+def test_missing_newspaper_does_not_collide_with_other_cluster():
+    clusters = [
+        [{'신문사': '기타', '내용': 'a' * 100}, {'신문사': '조선일보', '내용': 'b' * 50}],
+        [{'신문사': None, '내용': 'c' * 90}, {'신문사': '기타', '내용': 'd' * 80}],
+    ]
+    new, legacy = select_both(clusters)
+    assert legacy == [['b' * 50, 'a' * 100], ['c' * 90, 'd' * 80]]
+    assert new == legacy
+
+
+def test_selection_matches_legacy_on_random_clusters():
+    rng = np.random.default_rng(0)
+    newspapers = ['조선일보', '한겨레신문', '한국경제', '경향신문', '매일경제', '기타', None]
+    clusters = [[{'신문사': newspapers[rng.integers(len(newspapers))], '내용': 'x' * int(rng.integers(1, 60))}
+                 for _ in range(rng.integers(1, 7))] for _ in range(200)]
+    new, legacy = select_both(clusters)
+    assert new == legacy
+
+
+def test_preprocess_texts_matches_preprocess_text():
+    texts = ['정부는 오늘(22일) 새 정책을 발표했다!!', '  ABC 123　가나다\n\t라마  ', None, '', '정부는 오늘(22일) 새 정책을 발표했다!!']
+    assert shorten.preprocess_texts(texts) == [shorten.preprocess_text(text) for text in texts]
+    assert shorten.preprocess_texts(texts)[0] == '정부는 오늘 22일 새 정책을 발표했다'
+
+
+def window_reference(matrix, days, window_days, similarity_threshold=0.5):
+    """similarity_graph에서 발행일 구간 밖의 쌍을 지운 행렬 (발행일을 모르는 기사는 모든 기사와 비교)"""
+    full = shorten.similarity_graph(matrix, similarity_threshold).toarray()
+    days = np.asarray(days)
+    unknown = days == shorten.UNKNOWN_DAY
+    within = (np.abs(days[:, None] - days[None, :]) <= window_days) | unknown[:, None] | unknown[None, :]
+    return np.where(within, full, 0.0)
+
+
+def random_tfidf(rng, n, days):
+    """같은 날 주변에 비슷한 기사가 몰리도록 만든 음이 아닌 희소 행렬"""
+    from scipy import sparse
+    topics = sparse.random(8, 40, density=0.3, random_state=rng).toarray()
+    noise = sparse.random(n, 40, density=0.05, random_state=rng).toarray()
+    return sparse.csr_matrix(topics[np.abs(days) % len(topics)] + noise * 0.5)
+
+
+@pytest.mark.parametrize('block_size', [shorten.SIMILARITY_BLOCK_SIZE, 50])
+@pytest.mark.parametrize('window_days', [0, 1, 3, 1000])
+def test_window_similarity_graph_matches_masked_full_graph(monkeypatch, block_size, window_days):
+    monkeypatch.setattr(shorten, 'SIMILARITY_BLOCK_SIZE', block_size)
+    rng = np.random.default_rng(window_days)
+    days = 739000 + rng.integers(0, 10, size=60)
+    days[rng.choice(60, size=6, replace=False)] = shorten.UNKNOWN_DAY
+    matrix = random_tfidf(rng, len(days), days)
+
+    graph = shorten.window_similarity_graph(matrix, days, window_days)
+    expected = window_reference(matrix, days, window_days)
+    assert graph.shape == expected.shape
+    np.testing.assert_allclose(graph.toarray(), expected)
+    assert graph.nnz == np.count_nonzero(expected)
+
+
+@pytest.mark.parametrize('days', [[shorten.UNKNOWN_DAY] * 3, [739000], [739000, 739000, 739005]])
+def test_window_similarity_graph_edge_cases(days):
+    rng = np.random.default_rng(1)
+    matrix = random_tfidf(rng, len(days), np.asarray(days, dtype=np.int64))
+    graph = shorten.window_similarity_graph(matrix, days, 1)
+    assert graph.shape == (len(days), len(days))
+    np.testing.assert_allclose(graph.toarray(), window_reference(matrix, days, 1))
+
+
+def test_window_pair_count_matches_brute_force():
+    rng = np.random.default_rng(2)
+    days = 739000 + rng.integers(0, 20, size=80)
+    days[:7] = shorten.UNKNOWN_DAY
+    for window_days in (0, 2, 30):
+        expected = sum(1 for i in range(len(days)) for j in range(i + 1, len(days))
+                       if shorten.UNKNOWN_DAY in (days[i], days[j]) or abs(days[i] - days[j]) <= window_days)
+        assert shorten.window_pair_count(days, window_days) == expected
+
+
+SENTENCES = [
+    '정부는 오늘 새로운 부동산 정책을 발표했다.', '한국은행은 기준금리를 3.5%로 동결했다.',
+    '반도체 수출이 석 달 연속 증가했다.', '서울 아파트 매매가격이 소폭 상승했다.',
+    '금융당국은 가계부채 관리 방안을 내놓았다.', '전문가들은 하반기 경기 회복을 전망했다.',
+    '국회는 관련 법안을 본회의에서 처리했다.', '기업들은 투자 계획을 재검토하고 있다.',
+    '환율은 달러당 1300원 선에서 움직였다.', '소비자 물가 상승률이 2%대로 내려왔다.',
+    '야당은 정책의 실효성에 의문을 제기했다.', '시장에서는 추가 대책이 필요하다는 지적이 나온다.',
+    '수출 기업의 실적 개선이 기대된다.', '청년 고용률이 전년 대비 하락했다.',
+    '지방 주택 시장은 여전히 침체돼 있다.', '전기차 배터리 업계가 증설에 나섰다.',
+]
+NEWSPAPERS = ['조선일보', '중앙일보', '동아일보', '경향신문', '한겨레신문', '한국일보',
+              '매일경제', '한국경제', '서울경제', '아주경제', '기타', None]
+
+
+def dedup_records(seed=0):
+    """키워드마다 근접 중복 기사 묶음이 있는 기사 목록 (결측 신문사/본문, 3개 미만 키워드 포함)"""
+    rng = np.random.default_rng(seed)
+    records = []
+    for k, keyword in enumerate(['금리', '부동산', '반도체', '소수']):
+        for story in range(2 if keyword == '소수' else 6):
+            base = [str(s) for s in rng.choice(SENTENCES, size=6, replace=False)]
+            for _ in range(1 if keyword == '소수' else int(rng.integers(1, 7))):
+                body = [s if rng.random() > 0.25 else str(rng.choice(SENTENCES)) for s in base]
+                records.append({
+                    '키워드': keyword,
+                    '발행일': f"8/{int(rng.integers(1, 28))}/2026",
+                    '제목': body[0],
+                    '링크': f"https://n.news.naver.com/mnews/article/{k}/{len(records):07d}",
+                    '내용': ' '.join(body) * int(rng.integers(1, 4)),
+                    '신문사': NEWSPAPERS[int(rng.integers(len(NEWSPAPERS)))],
+                })
+    records[3]['내용'] = None
+    records[5]['내용'] = records[4]['내용']
+    return records
+
+
+def comparable(rows):
+    """NaN을 None으로 바꾼 행 목록 (NaN != NaN이므로 비교용)"""
+    return [{key: None if isinstance(value, float) and np.isnan(value) else value for key, value in row.items()}
+            for row in rows]
+
+
+def legacy_result(records):
+    return comparable(legacy_shorten.deduplicate_articles(pd.DataFrame(records)))
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_deduplicate_articles_matches_legacy(seed):
+    records = dedup_records(seed)
+    expected = legacy_result(records)
+    assert len(expected) < len(records)
+    assert comparable(shorten.deduplicate_articles(pd.DataFrame(records))) == expected
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+@pytest.mark.parametrize('options', [{}, {'window_days': 100000}], ids=['table', 'window'])
+def test_deduplicate_records_matches_legacy(seed, options):
+    records = dedup_records(seed)
+    assert comparable(shorten.deduplicate_records(records, **options)) == legacy_result(records)
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_corpus_tfidf_matches_legacy_for_single_keyword(seed):
+    # 전체 TF-IDF는 키워드가 하나일 때만 키워드별 TF-IDF와 같은 가중치
+    records = [record for record in dedup_records(seed) if record['키워드'] == '부동산']
+    assert comparable(shorten.deduplicate_records(records, corpus_tfidf=True)) == legacy_result(records)
+
+
+def test_article_table_rows_match_data_frame():
+    records = dedup_records(0)
+    records[1] = {key: value for key, value in records[1].items() if key != '발행일'}
+    records[2]['추가'] = '열'
+    table = shorten.ArticleTable(records)
+    expected = comparable(pd.DataFrame(records).to_dict('records'))
+    assert comparable([table.row(i) for i in range(len(table))]) == expected
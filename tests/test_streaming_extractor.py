@@ -0,0 +1,97 @@
+import json
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+
+import streaming_extractor
+from extractor import REMOVE_SELECTOR, ExtractorRegistry
+from streaming_extractor import longest_text_block, stream_extract
+
+pytest.importorskip('lxml')
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'fixtures')
+
+
+def load_fixtures():
+    with open(os.path.join(FIXTURE_DIR, 'index.json'), 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    fixtures = []
+    for name, url in index.items():
+        with open(os.path.join(FIXTURE_DIR, name), 'r', encoding='utf-8') as f:
+            fixtures.append((name, url, f.read()))
+    return fixtures
+
+
+FIXTURES = load_fixtures()
+
+
+def tree_extract(html, selector):
+    """기존 트리 방식 (Bs4Backend.text와 같은 처리)"""
+    node = BeautifulSoup(html, 'html.parser').select_one(selector)
+    if node is None:
+        return None
+    for tag in node.select(REMOVE_SELECTOR):
+        tag.decompose()
+    return node.get_text(strip=True)
+
+
+def tree_longest_block(html):
+    paragraphs = BeautifulSoup(html, 'html.parser').find_all(['p', 'div'])
+    if not paragraphs:
+        return None
+    return max(paragraphs, key=lambda p: len(p.get_text(strip=True))).get_text(strip=True)
+
+
+PAGES = [
+    '<div id="dic_area">첫 문장 <b>굵게</b> 다음 문장</div>',
+    '<div id="dic_area">  앞 공백\n<br>줄바꿈 뒤  </div>',
+    '<div id="dic_area">본문<script>var a = 1;</script>계속<style>p {}</style>끝</div>',
+    '<div id="dic_area">본문<div class="reporter_area">기자 <span>이름</span></div>뒤 텍스트</div>',
+    '<div id="dic_area">본문<div class="ad copyright">저작권</div><p class="promotion">홍보</p>끝</div>',
+    '<div id="dic_area">앞<!-- 주석 -->뒤</div>',
+    '<div id="dic_area">&lt;인용&gt; &amp; 기호 &quot;따옴표&quot;</div>',
+    '<div id="dic_area"><div><div>중첩된 <i>요소</i></div>안쪽</div>바깥</div><div id="other">다른 요소</div>',
+    '<div id="other">일치하지 않음</div>',
+    '<div id="dic_area"></div>',
+]
+
+
+@pytest.mark.parametrize('html', PAGES)
+def test_stream_extract_matches_tree(html):
+    page = f'<html><body><div id="header">메뉴</div>{html}</body></html>'
+    assert stream_extract(page, 'div#dic_area') == tree_extract(page, 'div#dic_area')
+
+
+def test_stream_extract_across_chunks(monkeypatch):
+    monkeypatch.setattr(streaming_extractor, 'CHUNK_SIZE', 7)
+    html = '<html><body><div id="dic_area">' + '정부는 <b>오늘</b> 정책을 발표했다. ' * 30 + '</div></body></html>'
+    assert stream_extract(html, 'div#dic_area') == tree_extract(html, 'div#dic_area')
+
+
+def test_stream_extract_unless_requires_earlier_selector_absent():
+    html = '<html><body><article>아티클</article><div class="article-body">본문</div></body></html>'
+    assert stream_extract(html, 'article') == '아티클'
+    assert stream_extract(html, 'article', unless=['div.article-body']) is None
+    assert stream_extract(html, 'div.article-body', unless=['div#dic_area']) == '본문'
+
+
+def test_stream_extract_rejects_unsupported_selector():
+    with pytest.raises(ValueError):
+        stream_extract('<div></div>', 'div > p')
+    with pytest.raises(ValueError):
+        stream_extract('<div></div>', 'div', unless=['div p'])
+
+
+@pytest.mark.parametrize('name, url, html', FIXTURES, ids=[fixture[0] for fixture in FIXTURES])
+def test_streamed_registry_matches_tree_registry(name, url, html):
+    tree = ExtractorRegistry(backend='bs4', streaming=False)
+    streamed = ExtractorRegistry(backend='bs4', streaming=True)
+    # 두 번째 호출은 등록/학습된 선택자로 스트리밍 경로를 탐
+    for _ in range(2):
+        assert streamed.extract(html, url) == tree.extract(html, url)
+
+
+@pytest.mark.parametrize('html', PAGES + [fixture[2] for fixture in FIXTURES])
+def test_longest_text_block_matches_tree(html):
+    assert longest_text_block(html) == tree_longest_block(html)